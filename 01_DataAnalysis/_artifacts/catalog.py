@@ -0,0 +1,158 @@
+import argparse
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+#전처리 결과 저장소 (Parquet 데이터 레이크).
+#    data/lake/{변수}/연도={YYYY}/구역={구역}/part-0.parquet
+#변수마다 폴더를 나누고(컬럼 구성이 다름), 그 안은 연도/구역 hive 파티션.
+#읽을 때 연도/구역 조건은 폴더 단위로 걸러지고(파티션 프루닝),
+#컬럼 선택과 나머지 조건은 Parquet 파일 안에서 처리된다(projection/predicate pushdown).
+#
+#사용 예:
+#    lake = Catalog()
+#    lake.load("월별풍속", years=2023, regions="강릉")
+#    lake.load("월별기온", columns=["일시", "평균기온(℃)"], filters=ds.field("평균기온(℃)") > 20)
+
+LAKE_ROOT = Path(__file__).resolve().parents[1] / "data" / "lake"
+
+#파티션 컬럼 (폴더 이름으로만 저장되고 파일 안에는 없음)
+PARTITION_SCHEMA = pa.schema([("연도", pa.int16()), ("구역", pa.string())])
+
+
+def _partitioning():
+    #폴더 이름은 URL 인코딩되어 저장되고, 읽을 때 다시 "강원도(강릉)"으로 풀린다
+    return ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+
+def _region_name(region):
+    """
+    "강릉" → "강원도(강릉)" (이미 "강원도(강릉)" 형태면 그대로)
+    """
+    region = str(region)
+    return region if "(" in region else f"강원도({region})"
+
+
+def _as_list(value):
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return [value]
+    return list(value)
+
+
+def write_partitioned(df, variable, root=LAKE_ROOT, date_col="일시", region_col="구역"):
+    """
+    변수 하나의 통합 DataFrame(ingest.ingest_variable 결과)을 레이크에 저장.
+    이번에 들어온 연도/구역 파티션만 교체하고 나머지 파티션은 그대로 둔다.
+    """
+    df = df.copy()
+    df["연도"] = pd.to_datetime(df[date_col]).dt.year.astype("int16")
+    df["구역"] = df[region_col].astype(str)
+    if region_col != "구역":
+        df = df.drop(columns=[region_col])
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    ds.write_dataset(
+        table,
+        Path(root) / variable,
+        format="parquet",
+        partitioning=_partitioning(),
+        existing_data_behavior="delete_matching",
+        basename_template="part-{i}.parquet",
+    )
+    return df.groupby(["연도", "구역"], observed=True).ngroups
+
+
+class Catalog:
+    """
+    레이크 조회용 카탈로그
+    """
+
+    def __init__(self, root=LAKE_ROOT):
+        self.root = Path(root)
+        self._datasets = {}
+
+    def variables(self):
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def dataset(self, variable):
+        #파일 목록 탐색은 변수별로 한 번만
+        if variable not in self._datasets:
+            path = self.root / variable
+            if not path.exists():
+                raise KeyError(f"레이크에 '{variable}'이(가) 없습니다. (있는 변수: {self.variables()})")
+            self._datasets[variable] = ds.dataset(path, format="parquet", partitioning=_partitioning())
+        return self._datasets[variable]
+
+    def refresh(self):
+        """
+        write_partitioned로 새로 저장한 뒤 파일 목록 다시 읽기
+        """
+        self._datasets.clear()
+
+    def schema(self, variable):
+        return self.dataset(variable).schema
+
+    def partitions(self, variable):
+        """
+        저장된 (연도, 구역) 목록 — 파일은 읽지 않고 폴더 이름만 본다.
+        """
+        rows = [
+            ds.get_partition_keys(fragment.partition_expression)
+            for fragment in self.dataset(variable).get_fragments()
+        ]
+        return (
+            pd.DataFrame(rows, columns=PARTITION_SCHEMA.names)
+            .drop_duplicates()
+            .sort_values(PARTITION_SCHEMA.names, ignore_index=True)
+        )
+
+    def load(self, variable, years=None, regions=None, columns=None, filters=None):
+        """
+        필요한 조각만 읽기
+        years: 연도 하나 또는 목록
+        regions: 구역 하나 또는 목록 ("강릉" / "강원도(강릉)" 모두 가능)
+        columns: 읽을 컬럼 (None이면 전체, 연도/구역은 요청할 때만 포함)
+        filters: 추가 조건 (pyarrow.dataset 식, 예: ds.field("평균풍속(m/s)") > 3)
+        """
+        expr = None
+        years = _as_list(years)
+        regions = _as_list(regions)
+        if years is not None:
+            expr = ds.field("연도").isin([int(y) for y in years])
+        if regions is not None:
+            cond = ds.field("구역").isin([_region_name(r) for r in regions])
+            expr = cond if expr is None else expr & cond
+        if filters is not None:
+            expr = filters if expr is None else expr & filters
+
+        table = self.dataset(variable).to_table(columns=columns, filter=expr)
+        df = table.to_pandas()
+        if "구역" in df.columns:
+            df["구역"] = df["구역"].astype("category")
+        return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레이크에 저장된 변수/파티션 보기")
+    parser.add_argument("variable", nargs="?", help="변수 이름 (없으면 변수 목록)")
+    parser.add_argument("--root", default=str(LAKE_ROOT), help="레이크 경로")
+    args = parser.parse_args()
+
+    lake = Catalog(args.root)
+    if args.variable is None:
+        for variable in lake.variables():
+            print(variable)
+        return
+
+    print(lake.schema(args.variable))
+    print(lake.partitions(args.variable).groupby("연도")["구역"].count())
+
+
+if __name__ == "__main__":
+    main()
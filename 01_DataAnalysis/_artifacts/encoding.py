@@ -0,0 +1,123 @@
+import codecs
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+#원본 파일 인코딩 자동 판별 + UTF-8 변환 캐시.
+#기상청/공단 CSV는 cp949, RE100 CSV는 utf-8-sig처럼 섞여 있어서
+#노트북마다 encoding=을 적어야 했고, 틀리면 읽기가 깨졌다.
+#
+#- sniff_encoding: 앞부분 바이트만 보고 utf-8-sig / utf-8 / cp949 판별
+#- to_utf8: 원본을 한 번만 UTF-8로 변환해 캐시에 저장 (파일 내용 해시 + 인코딩이 키)
+#           다음부터는 캐시 파일을 그대로 읽으므로 판별/디코딩을 다시 하지 않는다.
+#- read_csv: pd.read_csv 대신 쓰면 encoding을 신경 쓰지 않아도 됨
+#
+#사용 예:
+#    from encoding import read_csv
+#    df = read_csv("../data/raw/energy/한국에너지공단_기초지자체별 신재생에너지 보급 현황.csv")
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / ".text_cache"
+
+#판별 순서 (utf-8이 아니면 한글 윈도우 기본값 cp949로 본다)
+CANDIDATES = ("utf-8", "cp949")
+SAMPLE_SIZE = 64 * 1024
+
+_index_lock = threading.Lock()
+
+
+def sniff_encoding(path, sample_size=SAMPLE_SIZE, default="cp949"):
+    """
+    앞부분 sample_size 바이트로 인코딩 판별
+    BOM이 있으면 utf-8-sig, 샘플이 UTF-8로 풀리면 utf-8, 아니면 cp949
+    """
+    with open(path, "rb") as f:
+        sample = f.read(sample_size)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for encoding in CANDIDATES:
+        #샘플 끝에서 글자가 잘려도 오류가 나지 않게 증분 디코더로 확인
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=len(sample) < sample_size)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return default
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _index_path(cache_dir):
+    return Path(cache_dir) / "index.json"
+
+
+def _load_index(cache_dir):
+    try:
+        return json.loads(_index_path(cache_dir).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _cached_hash(path, cache_dir):
+    #(경로, 크기, 수정시각)이 같으면 전에 계산한 해시를 재사용 (매번 전체를 읽지 않도록)
+    stat = os.stat(path)
+    stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+    key = str(Path(path).resolve())
+    with _index_lock:
+        entry = _load_index(cache_dir).get(key)
+    if entry and entry["stamp"] == stamp:
+        return entry["hash"], entry["encoding"]
+
+    digest = file_hash(path)
+    encoding = sniff_encoding(path)
+    with _index_lock:
+        index = _load_index(cache_dir)
+        index[key] = {"stamp": stamp, "hash": digest, "encoding": encoding}
+        tmp = _index_path(cache_dir).with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, _index_path(cache_dir))
+    return digest, encoding
+
+
+def to_utf8(path, encoding=None, cache_dir=CACHE_DIR):
+    """
+    원본 파일의 UTF-8(BOM 없음) 캐시 경로를 돌려준다. 캐시가 없으면 이때 한 번 변환.
+    encoding: 원본 인코딩을 알고 있으면 지정 (None이면 자동 판별)
+    """
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    digest, sniffed = _cached_hash(path, cache_dir)
+    #같은 원본이라도 디코딩한 인코딩이 다르면 다른 캐시 (잘못 지정해 깨진 캐시를 재사용하지 않도록)
+    effective = codecs.lookup(encoding or sniffed).name
+    cached = Path(cache_dir) / f"{digest[:24]}.{effective}{Path(path).suffix}"
+    if cached.exists():
+        return cached
+
+    text = Path(path).read_bytes().decode(effective)
+    tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8", newline="")
+    os.replace(tmp, cached)
+    return cached
+
+
+def read_text(path, encoding=None, cache_dir=CACHE_DIR):
+    """
+    원본 파일 내용을 문자열로 (UTF-8 캐시에서 읽음)
+    """
+    return to_utf8(path, encoding, cache_dir).read_text(encoding="utf-8")
+
+
+def read_csv(path, encoding=None, cache_dir=CACHE_DIR, **kwargs):
+    """
+    pd.read_csv와 같지만 encoding을 자동으로 처리
+    """
+    return pd.read_csv(to_utf8(path, encoding, cache_dir), encoding="utf-8", **kwargs)
@@ -0,0 +1,207 @@
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from schemas import read_with_schema
+
+#한국에너지공단 기초지자체별 신재생에너지 보급 현황 → 광역 × 기초 × 에너지원 × 연도 집계 큐브.
+#차트마다 원본 CSV를 다시 읽고 groupby/str.contains 하던 것을 큐브 하나로 대체한다.
+#
+#원본에는 합계 행이 섞여 있다.
+#    에너지원: 신·재생에너지 = 재생에너지 + 신에너지, 재생에너지/신에너지 = 각 세부 에너지원 합
+#    기초: 광역과 같은 이름(예: 기초 "강원") = 그 광역의 합계 (기초가 하나뿐인 세종 제외)
+#그대로 sum 하면 두세 번 더해지므로 큐브에는 가장 작은 단위(세부 에너지원 × 시군)만 저장하고
+#합계는 rollup으로 계산한다.
+#
+#사용 예:
+#    cube = EnergyCube.load()
+#    cube.rollup("에너지원", 광역="강원", measure="발전량(MWh)")
+#    cube.slice(광역="강원", 에너지원=["태양광", "풍력"])
+#    python energy_cube.py update "../data/raw/energy/한국에너지공단_기초지자체별 신재생에너지 보급 현황.csv" --year 2023
+
+CUBE_PATH = Path(__file__).resolve().parents[1] / "data" / "processed" / "knrec_cube.parquet"
+SOURCE = "KNREC_기초지자체"
+
+DIMENSIONS = ["연도", "광역", "기초", "에너지원"]
+MEASURES = ["생산량(toe)", "발전량(MWh)", "보급용량_발전_누적(kW)", "보급용량_발전_신규(kW)"]
+
+#에너지원 구분 (합계 행 이름 → 세부 에너지원)
+ENERGY_GROUPS = {
+    "재생에너지": ["태양광", "태양열", "풍력", "수력", "해양", "지열", "수열", "바이오", "폐기물"],
+    "신에너지": ["연료전지", "IGCC"],
+}
+TOTAL_SOURCES = {"신·재생에너지", *ENERGY_GROUPS}
+SOURCE_GROUP = {src: group for group, sources in ENERGY_GROUPS.items() for src in sources}
+
+
+def _file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _guess_year(path):
+    #파일명에 기준연도가 있으면 사용 (예: ..._2023.csv), 없으면 None
+    m = re.search(r"(?<!\d)(20\d{2})(?!\d)", Path(path).stem)
+    return int(m.group(1)) if m else None
+
+
+def to_cells(df, year=None):
+    """
+    원본 DataFrame → 큐브 셀 (합계 행 제거, 연도 추가)
+    """
+    #기초 = 광역인 행은 합계 (단, 세종처럼 기초가 하나뿐인 광역은 그 행이 실제 값)
+    same = df["기초"].astype(str) == df["광역"].astype(str)
+    single = df.groupby("광역", observed=True)["기초"].transform("nunique") == 1
+    leaf = df[~df["에너지원"].isin(TOTAL_SOURCES) & (~same | single)]
+    cells = leaf[["광역", "기초", "에너지원"] + MEASURES].copy()
+    cells.insert(0, "연도", pd.array([year] * len(cells), dtype="Int16"))
+    for col in ("광역", "기초", "에너지원"):
+        cells[col] = cells[col].astype(str)
+    return cells.reset_index(drop=True)
+
+
+class EnergyCube:
+    """
+    세부 에너지원 × 시군 단위 셀을 담은 집계 큐브
+    """
+
+    def __init__(self, cells, releases=None):
+        self.cells = cells
+        self.releases = releases or {}  #{연도: 원본 파일 해시}
+        for col in ("광역", "기초", "에너지원"):
+            if not isinstance(self.cells[col].dtype, pd.CategoricalDtype):
+                self.cells[col] = self.cells[col].astype("category")
+
+    # ==================== 만들기/저장 ====================
+    @classmethod
+    def from_csv(cls, path, year=None):
+        year = year if year is not None else _guess_year(path)
+        cells = to_cells(read_with_schema(path, SOURCE), year)
+        return cls(cells, {str(year): _file_hash(path)})
+
+    @classmethod
+    def load(cls, path=CUBE_PATH):
+        table = pq.read_table(path)
+        meta = (table.schema.metadata or {}).get(b"releases", b"{}")
+        return cls(table.to_pandas(), json.loads(meta))
+
+    def save(self, path=CUBE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(self.cells, preserve_index=False)
+        meta = dict(table.schema.metadata or {})
+        meta[b"releases"] = json.dumps(self.releases).encode("utf-8")
+        pq.write_table(table.replace_schema_metadata(meta), path, compression="zstd")
+
+    def update(self, path, year=None):
+        """
+        새 공단 자료 반영: 같은 연도 셀만 교체, 다른 연도는 그대로
+        연도 없이 만든 큐브의 셀(연도 NaN)은 연도가 정해진 자료로 교체됨 (같은 자료를 두 번 더하지 않도록)
+        연도를 모르는 자료를 연도가 있는 큐브에 넣으려 하면 ValueError
+        같은 파일(해시 동일)이면 아무것도 하지 않고 False 반환
+        """
+        year = year if year is not None else _guess_year(path)
+        if year is None and self.years():
+            raise ValueError(f"연도를 알 수 없는 자료입니다 (year= 지정 필요, 큐브 연도: {self.years()})")
+        digest = _file_hash(path)
+        if self.releases.get(str(year)) == digest:
+            return False
+
+        new = to_cells(read_with_schema(path, SOURCE), year)
+        replace = self.cells["연도"].isna()
+        if year is not None:
+            replace |= (self.cells["연도"] == year).fillna(False)
+        old = self.cells[~replace.to_numpy()]
+        cells = pd.concat(
+            [old.astype({c: str for c in ("광역", "기초", "에너지원")}), new],
+            ignore_index=True,
+        )
+        releases = {k: v for k, v in self.releases.items() if k != "None"}
+        self.__init__(cells.sort_values(DIMENSIONS, ignore_index=True), {**releases, str(year): digest})
+        return True
+
+    # ==================== 조회 ====================
+    def years(self):
+        return sorted(self.cells["연도"].dropna().unique().tolist())
+
+    def _mask(self, filters):
+        mask = pd.Series(True, index=self.cells.index)
+        for dim, value in filters.items():
+            if value is None:
+                continue
+            if dim not in DIMENSIONS:
+                raise KeyError(f"없는 차원: {dim} (차원: {DIMENSIONS})")
+            values = [value] if pd.api.types.is_scalar(value) else list(value)
+            if dim == "에너지원":
+                #"재생에너지"/"신에너지"/"신·재생에너지"는 세부 에너지원으로 펼침
+                expanded = []
+                for v in values:
+                    if v == "신·재생에너지":
+                        expanded += list(SOURCE_GROUP)
+                    else:
+                        expanded += ENERGY_GROUPS.get(v, [v])
+                values = expanded
+            mask &= self.cells[dim].isin(values).fillna(False)
+        return mask.to_numpy()
+
+    def slice(self, measures=None, **filters):
+        """
+        조건에 맞는 셀 그대로 (예: slice(광역="강원", 에너지원="재생에너지"))
+        """
+        cols = DIMENSIONS + (measures or MEASURES)
+        return self.cells.loc[self._mask(filters), cols].reset_index(drop=True)
+
+    def rollup(self, by, measure=None, **filters):
+        """
+        by 차원으로 합계 (나머지 차원은 합침)
+        by: "에너지원" / ["광역", "기초"] / "구분"(재생에너지·신에너지) 등
+        measure: 합계 낼 값 (None이면 전체 MEASURES)
+        반환값: by 인덱스의 Series(measure 하나) 또는 DataFrame, 큰 순서로 정렬
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        cells = self.cells.loc[self._mask(filters)]
+        keys = [cells["에너지원"].map(SOURCE_GROUP).rename("구분") if b == "구분" else b for b in by]
+        cols = [measure] if isinstance(measure, str) else (measure or MEASURES)
+        out = cells.groupby(keys, observed=True)[cols].sum()
+        if isinstance(measure, str):
+            return out[measure].sort_values(ascending=False)
+        return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공단 기초지자체별 보급 현황 집계 큐브")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    up = sub.add_parser("update", help="원본 CSV를 큐브에 반영 (없으면 새로 만듦)")
+    up.add_argument("csv", help="공단 원본 CSV")
+    up.add_argument("--year", type=int, help="기준연도 (없으면 파일명에서 찾음)")
+    up.add_argument("--cube", default=str(CUBE_PATH), help="큐브 파일 경로")
+
+    show = sub.add_parser("show", help="차원별 합계 보기")
+    show.add_argument("by", nargs="+", help="합계 기준 차원 (예: 에너지원)")
+    show.add_argument("--measure", default="발전량(MWh)")
+    show.add_argument("--region", help="광역 (예: 강원)")
+    show.add_argument("--cube", default=str(CUBE_PATH), help="큐브 파일 경로")
+    args = parser.parse_args()
+
+    if args.command == "update":
+        if Path(args.cube).exists():
+            cube = EnergyCube.load(args.cube)
+            changed = cube.update(args.csv, args.year)
+        else:
+            cube = EnergyCube.from_csv(args.csv, args.year)
+            changed = True
+        if changed:
+            cube.save(args.cube)
+        print(f"{'반영' if changed else '변경 없음'}: 셀 {len(cube.cells)}개, 연도 {cube.years() or '미지정'}")
+    else:
+        cube = EnergyCube.load(args.cube)
+        print(cube.rollup(args.by, args.measure, 광역=args.region))
+
+
+if __name__ == "__main__":
+    main()
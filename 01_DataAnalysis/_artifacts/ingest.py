@@ -0,0 +1,133 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from kma_loader import load_kma_csv
+from catalog import LAKE_ROOT, write_partitioned
+
+#기상청 구역별 CSV 폴더 → 변수 하나당 통합 파일 1개 (Parquet/Feather).
+#기존 흐름: CSV → 구역별 시트 엑셀(openpyxl) → read_excel(sheet_name=None) → merge_region_sheets
+#바뀐 흐름: CSV를 프로세스 여러 개로 동시에 읽고, 파일명에서 "구역" 컬럼을 바로 붙여 저장.
+#엑셀은 필요할 때만 마지막에 내보낸다 (시트 = 구역, 기존 통합 엑셀과 같은 구조).
+#
+#사용 예:
+#    python ingest.py ../data/raw/weather 월별강수량 --out ../data/processed/강원도_월별강수량.parquet
+#    python ingest.py ../data/raw/weather --all --out-dir ../data/processed
+#    python ingest.py ../data/raw/weather --all --lake   (연도/구역 파티션 레이크, catalog.py)
+
+
+def parse_filename(path):
+    """
+    "강원도(강릉)_월별강수량_(2020-2025).csv" → ("강원도(강릉)", "월별강수량")
+    """
+    parts = Path(path).stem.split("_")
+    region = parts[0]
+    variable = parts[1] if len(parts) > 1 else ""
+    return region, variable
+
+
+def _load_with_region(path):
+    #ProcessPoolExecutor에서 쓰려면 최상위 함수여야 한다.
+    df = load_kma_csv(path)
+    df.attrs = {}
+    df["구역"] = parse_filename(path)[0]
+    return df
+
+
+def find_variables(folder):
+    """
+    폴더 안 CSV 파일명에서 변수 이름 목록을 뽑는다. (구역이 붙은 파일만)
+    """
+    variables = set()
+    for path in Path(folder).glob("*.csv"):
+        region, variable = parse_filename(path)
+        if "(" in region and variable:
+            variables.add(variable)
+    return sorted(variables)
+
+
+def ingest_variable(folder, variable, workers=None):
+    """
+    folder 안의 "*_{variable}_*.csv"를 병렬로 읽어 하나의 DataFrame으로 합친다.
+    "구역", "지점명"은 category로 저장.
+    """
+    paths = sorted(
+        p for p in Path(folder).glob(f"*_{variable}_*.csv")
+        if parse_filename(p)[1] == variable
+    )
+    if not paths:
+        raise FileNotFoundError(f"{folder}에 '{variable}' CSV가 없습니다.")
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        dfs = list(executor.map(_load_with_region, paths))
+
+    df = pd.concat(dfs, ignore_index=True)
+    df["구역"] = df["구역"].astype("category")
+    if "지점명" in df.columns:
+        df["지점명"] = df["지점명"].astype("category")
+    return df
+
+
+def save_dataset(df, out_path):
+    """
+    확장자에 맞춰 저장 (.parquet / .feather)
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if out_path.suffix == ".feather":
+        df.reset_index(drop=True).to_feather(out_path)
+    else:
+        df.to_parquet(out_path, index=False)
+
+
+def export_excel(df, excel_path, region_col="구역"):
+    """
+    (선택) 기존 통합 엑셀과 같은 구조로 내보내기: 시트 = 구역
+    """
+    with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+        for region, part in df.groupby(region_col, observed=True, sort=True):
+            part.drop(columns=[region_col]).to_excel(
+                writer, sheet_name=str(region)[:31], index=False
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기상청 구역별 CSV → 변수별 통합 파일")
+    parser.add_argument("folder", help="CSV 폴더 (예: ../data/raw/weather)")
+    parser.add_argument("variable", nargs="?", help="변수 이름 (예: 월별강수량)")
+    parser.add_argument("--all", action="store_true", help="폴더 안의 모든 변수 처리")
+    parser.add_argument("--out", help="저장 경로 (.parquet / .feather)")
+    parser.add_argument("--out-dir", default=".", help="--all일 때 저장 폴더")
+    parser.add_argument("--excel", action="store_true", help="엑셀(시트=구역)도 같이 저장")
+    parser.add_argument("--lake", nargs="?", const=str(LAKE_ROOT),
+                        help="파일 대신 레이크에 저장 (경로 생략 시 data/lake)")
+    parser.add_argument("--workers", type=int, help="프로세스 수 (기본값: CPU 수)")
+    args = parser.parse_args()
+
+    if args.all:
+        jobs = [(v, Path(args.out_dir) / f"강원도_{v}.parquet") for v in find_variables(args.folder)]
+    elif args.variable:
+        jobs = [(args.variable, Path(args.out or f"강원도_{args.variable}.parquet"))]
+    else:
+        parser.error("variable 또는 --all이 필요합니다.")
+
+    for variable, out_path in jobs:
+        df = ingest_variable(args.folder, variable, workers=args.workers)
+        if args.lake:
+            parts = write_partitioned(df, variable, root=args.lake)
+            print(f"{variable}: {len(df)}행, 파티션 {parts}개 → {Path(args.lake) / variable}")
+        else:
+            save_dataset(df, out_path)
+            print(f"{variable}: {len(df)}행, 구역 {df['구역'].nunique()}개 → {out_path}")
+
+        if args.excel:
+            excel_path = out_path.with_suffix(".xlsx")
+            export_excel(df, excel_path)
+            print(f"  엑셀 저장: {excel_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import io
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from encoding import read_text
+from schemas import check_columns, count_rows, detect_source, get_schema
+
+#기상청 기상자료개방포털 CSV(월별/일별/시간별) 로더.
+#00_energy.ipynb의 read_csv(engine="python", skiprows=8) 대체용.
+#앞쪽 검색조건 줄 수가 파일마다 달라서 skiprows를 고정하지 않고 헤더 줄을 직접 찾는다.
+
+
+#헤더 줄 판별에 쓰는 컬럼명 (둘 중 하나만 있어도 헤더로 본다)
+HEADER_KEYS = ("일시", "지점번호")
+
+#앞쪽 공백/탭 (줄 시작), 데이터 중간에 끼어 있는 탭
+_LEADING_WS = re.compile(r"^[ \t]+", flags=re.MULTILINE)
+
+
+def _split_preamble(text):
+    """
+    헤더 줄 위치를 찾아 (검색조건 dict, 헤더부터 끝까지의 본문)으로 나눈다.
+    """
+    meta = {}
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        cells = [c.strip() for c in line.replace("\t", "").split(",")]
+        if any(key in cells for key in HEADER_KEYS):
+            return meta, text[pos:]
+
+        #",요소 : 강수량" 같은 검색조건 줄은 메타데이터로 보관
+        item = ",".join(cells).strip(",")
+        if ":" in item:
+            key, value = item.split(":", 1)
+            meta[key.strip()] = value.strip()
+        pos += len(line)
+
+    raise ValueError("헤더 줄(일시/지점번호)을 찾을 수 없습니다.")
+
+
+def kma_dtypes(columns):
+    """
+    컬럼명으로 dtype 지정
+    지점번호(지점) int16, 지점명 category, 일시/○○일자 문자열, 나머지 관측값 float64
+    """
+    dtypes = {}
+    for col in columns:
+        if col in ("지점번호", "지점"):  #시간별 자료는 "지점"
+            dtypes[col] = "int16"
+        elif col == "지점명":
+            dtypes[col] = "category"
+        elif col == "일시" or col.endswith("일자") or col.endswith("시각"):
+            dtypes[col] = "string"
+        else:
+            dtypes[col] = "float64"
+    return dtypes
+
+
+def _parse(body, usecols, dtypes, engine):
+    if engine == "pyarrow":
+        return pd.read_csv(
+            io.BytesIO(body.encode("utf-8")),
+            engine="pyarrow",
+            usecols=usecols,
+            dtype=dtypes,
+        )
+    return pd.read_csv(
+        io.StringIO(body),
+        engine="c",
+        usecols=usecols,
+        dtype=dtypes,
+        on_bad_lines="skip",
+    )
+
+
+def load_kma_csv(path, encoding=None, parse_dates=True, engine=None,
+                 schema=None, usecols=None, strict=True):
+    """
+    기상청 CSV 한 개를 DataFrame으로 읽는다.
+
+    path: CSV 경로
+    encoding: 원본 인코딩 (None이면 자동 판별, 기상청 내려받기 파일은 보통 cp949)
+    parse_dates: True면 "일시"를 datetime으로 변환 (월 "2020-01" / 일 / 시간 모두 가능)
+    engine: "pyarrow" 또는 "c" (None이면 pyarrow가 설치돼 있을 때 pyarrow)
+    schema: schemas.SCHEMAS 항목 (None이면 파일명으로 찾고, 없으면 컬럼명으로 dtype 추정)
+            스키마가 있으면 헤더를 검사하고(다르면 SchemaError) footer 줄은 읽지 않는다.
+    usecols: 읽을 컬럼 (None이면 전체)
+    strict: 스키마에 없는 컬럼이 있어도 오류로 볼지
+
+    검색조건(요소, 지점명, 기간 등)은 df.attrs["meta"]에 들어간다.
+    """
+    if schema is None:
+        source = detect_source(path)
+        schema = get_schema(source) if source else None
+
+    text = read_text(path, encoding)  #처음 한 번만 디코딩, 이후엔 UTF-8 캐시에서 읽음
+    meta, body = _split_preamble(text)
+
+    #줄 앞 탭/공백, 헤더 중간의 탭 제거 (C 파서가 그대로 읽을 수 있게)
+    body = _LEADING_WS.sub("", body).replace("\t", "")
+
+    header, _, rows = body.partition("\n")
+    columns = [c.strip() for c in header.split(",") if c.strip()]  #끝의 빈 컬럼(,) 제외
+    if schema is not None:
+        check_columns(columns, schema, Path(path).name, strict)
+        #key 값이 규칙에 안 맞는 첫 줄부터는 footer (빈 줄, 탭만 있는 줄 등)
+        row_lines = rows.splitlines()
+        rows = "\n".join(row_lines[:count_rows(row_lines, schema, columns.index(schema["key"]))])
+        dtypes = {c: schema["columns"].get(c, "string") for c in columns}
+    else:
+        dtypes = kma_dtypes(columns)
+
+    usecols = [c for c in usecols if c in columns] if usecols else columns
+    dtypes = {c: dtypes[c] for c in usecols}
+    #헤더에만 붙은 끝 쉼표 때문에 데이터 줄과 컬럼 수가 달라지지 않게 헤더를 다시 쓴다
+    body = ",".join(columns) + "\n" + rows
+
+    if engine is None:
+        try:
+            import pyarrow  # noqa: F401
+            engine = "pyarrow"
+        except ImportError:
+            engine = "c"
+
+    try:
+        df = _parse(body, usecols, dtypes, engine)
+    except (ValueError, TypeError):
+        #관측값에 숫자가 아닌 표기("-" 등)가 섞인 파일: 문자열로 읽고 숫자 변환
+        df = pd.read_csv(io.StringIO(body), engine="c", usecols=usecols,
+                         dtype=str, on_bad_lines="skip")
+        for col, dtype in dtypes.items():
+            if dtype == "float64":
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+            elif dtype == "int16":
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int16")
+            else:
+                df[col] = df[col].astype(dtype)
+
+    if parse_dates and "일시" in df.columns:
+        df["일시"] = pd.to_datetime(df["일시"].str.strip(), format="ISO8601")
+
+    df.attrs["meta"] = meta
+    if schema is not None:
+        df.attrs["units"] = {c: u for c, u in schema["units"].items() if c in df.columns}
+    return df
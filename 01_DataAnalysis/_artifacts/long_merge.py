@@ -1,37 +1,76 @@
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 #함수 모듈 만들 때 외부 변수를 쓰지 않도록 짠다. (전역 변수X)
 
+#월 → 계절 (3~5 봄, 6~8 여름, 9~11 가을, 12~2 겨울)
+SEASONS = ["봄", "여름", "가을", "겨울"]
+_MONTH_TO_SEASON = np.array([-1, 3, 3, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3], dtype="int8")
+
+
 """
     날짜 컬럼을 datetime으로 변환하고
-    연도, 월 컬럼을 추가
+    연도, 월 컬럼을 추가 (옵션: 분기, 계절)
 """
 
 def add_year_month(
     df,
     date_col="일시",
     drop_cols=None,
-    date_format="%Y-%m"
+    date_format="%Y-%m",
+    quarter=False,
+    season=False,
+    inplace=False
 ):
-    df = df.copy()
+    if not inplace:
+        df = df.copy()
 
     #df.DataFrame 타입으로 입력 받는다.
-    #"일시" 컬럼은 문자열로 받는다.
+    #"일시" 컬럼은 문자열로 받는다. (이미 datetime이면 변환은 건너뜀)
     # list이거나 None: 아무 컬럼도 지우지 않는다.
     #날짜 문자열 포맷 지정 "%Y-%m" 한 건 인자만 교체하기 편하도록.
+    #quarter=True면 "분기"(1~4), season=True면 "계절"(봄/여름/가을/겨울) 추가
+    #inplace=True면 복사하지 않고 받은 df에 바로 컬럼을 추가한다.
     #반환값은 DataFrame으로 나온다. 표현
     #필수 인자는 1개 : table_df 그 외는 옵션. 
 
-    df[date_col] = pd.to_datetime(
-        df[date_col],
-        format=date_format
-    ) #datetime 변환 함수
+    #같은 날짜 문자열이 지점 수만큼 반복되므로 고유값만 변환하고 코드로 되돌려 붙인다.
+    codes, uniques = pd.factorize(df[date_col])
+    dates = pd.DatetimeIndex(
+        uniques if isinstance(uniques, pd.DatetimeIndex)
+        else pd.to_datetime(uniques, format=date_format)
+    ) #datetime 변환 함수 (고유값 개수만큼만 실행)
+
+    missing = codes < 0 #빈 날짜
+    safe_codes = np.where(missing, 0, codes)
+
+    def _expand(values, dtype):
+        #고유값 기준 결과 → 행 기준으로 펼치기 (빈 날짜가 있으면 Int16/Int8 + <NA>)
+        if not missing.any():
+            return values.astype(dtype)[codes]
+        out = pd.array(values[safe_codes], dtype=dtype.capitalize())
+        out[missing] = pd.NA
+        return out
 
-    df["연도"] = df[date_col].dt.year
-    df["월"] = df[date_col].dt.month
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = dates.take(codes, allow_fill=True, fill_value=pd.NaT)
+
+    months = dates.month.to_numpy()
+    df["연도"] = _expand(dates.year.to_numpy(), "int16")
+    df["월"] = _expand(months, "int8")
+    if quarter:
+        df["분기"] = _expand(dates.quarter.to_numpy(), "int8")
+    if season:
+        season_codes = _MONTH_TO_SEASON[months][safe_codes]
+        season_codes[missing] = -1
+        df["계절"] = pd.Categorical.from_codes(season_codes, categories=SEASONS)
 
     if drop_cols:
-        df = df.drop(columns=drop_cols, errors="ignore")
+        if inplace:
+            df.drop(columns=drop_cols, errors="ignore", inplace=True)
+        else:
+            df = df.drop(columns=drop_cols, errors="ignore")
         #drop_cols가 있으면 실행, errors="ignore"는 없어도 에러 안 뜨게 하고자 함.
 
     return df
@@ -40,17 +79,63 @@ def add_year_month(
 """
     시트명 = 구역 구조의 엑셀 데이터를
     하나의 DataFrame으로 통합
+    sheets: {구역: DataFrame} dict 또는 (구역, DataFrame)을 내주는 제너레이터
+    batch_rows: 이 행 수만큼 모일 때마다 먼저 합친다 (합친 시트는 바로 놓아줌)
 """
 
-def merge_region_sheets(sheets: dict):
-    dfs = [] #빈 데이터 생성, 활용할 D.F 쓰기 위해
+def _merge_batch(dfs, regions, lengths, region_col, category_cols):
+    #모인 시트를 합치고 구역/문자열 컬럼을 바로 category로 줄인다.
+    batch = pd.concat(dfs, ignore_index=True)
+    batch[region_col] = pd.Categorical(
+        np.repeat(np.array(regions, dtype=object), lengths), categories=list(dict.fromkeys(regions))
+    )
+    for col in category_cols:
+        if col in batch.columns and not isinstance(batch[col].dtype, pd.CategoricalDtype):
+            batch[col] = batch[col].astype("category")
+    return batch
+
+
+def merge_region_sheets(sheets, region_col="구역", category_cols=("지점명",), batch_rows=500_000):
+    #read_excel(sheet_name=None) 결과 dict도, 파일을 하나씩 읽어 내주는 제너레이터도 받는다.
+    #제너레이터로 넘기면 batch_rows 단위로 합치면서 원본 시트를 놓아주므로
+    #원본 전체 + 합친 결과를 동시에 들고 있지 않는다. (dict는 호출한 쪽이 원본을 계속 들고 있음)
+    items = sheets.items() if isinstance(sheets, dict) else sheets
+    category_cols = tuple(category_cols or ())
 
-    for region, df in sheets.items():
-        temp = df.copy() 
-        temp["구역"] = region
-        dfs.append(temp)
-        
-    table_df = pd.concat(dfs, ignore_index=True)
+    batches = [] #합친 묶음 (category로 줄인 상태)
+    order = [] #구역 순서 (시트 순서 유지, 중복 제거)
+    dfs, regions, lengths = [], [], []
+    for region, df in items:
+        dfs.append(df)
+        regions.append(region)
+        lengths.append(len(df))
+        if sum(lengths) >= batch_rows:
+            batches.append(_merge_batch(dfs, regions, lengths, region_col, category_cols))
+            order.extend(regions)
+            dfs, regions, lengths = [], [], []
+    if dfs:
+        batches.append(_merge_batch(dfs, regions, lengths, region_col, category_cols))
+        order.extend(regions)
+    del dfs
+
+    if not batches:
+        return pd.DataFrame()
+
+    #묶음마다 category 목록이 다르면 concat이 object로 풀어버리므로 목록을 맞춘다.
+    categories = {region_col: list(dict.fromkeys(order))}
+    for col in category_cols:
+        if col != region_col and all(col in b.columns for b in batches):
+            categories[col] = union_categoricals([b[col] for b in batches]).categories
+    for b in batches:
+        for col, cats in categories.items():
+            b[col] = b[col].cat.set_categories(cats)
+
+    table_df = pd.concat(batches, ignore_index=True)
     #pd.concat : 여러개의 df를 하나로 합치는 함수
-    return table_df
+    del batches
+
+    for col in category_cols:
+        if col in table_df.columns and not isinstance(table_df[col].dtype, pd.CategoricalDtype):
+            table_df[col] = table_df[col].astype("category")
 
+    return table_df
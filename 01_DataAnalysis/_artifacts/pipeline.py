@@ -0,0 +1,268 @@
+import argparse
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+
+import pandas as pd
+
+from kma_loader import load_kma_csv
+from long_merge import merge_region_sheets, add_year_month
+from ingest import parse_filename
+from preprocess_outputs.preprocessing import clean_structure, fill_missing
+from schemas import SCHEMAS
+
+#노트북 여러 개(00_energy → 엑셀 → long_format_DF → energy_analysis)로 흩어진 전처리를
+#단계(stage) 그래프로 선언해서 실행한다.
+#- 단계마다 (함수 코드 + 함수가 쓰는 로컬 모듈 소스 + 파라미터 + 입력) 해시로 결과를 디스크에 캐시
+#- 다시 실행하면 바뀐 단계와 그 아래 단계만 계산, 나머지는 캐시 사용
+#- 서로 의존하지 않는 단계(강수량/기온/풍속/일조일사)는 동시에 실행
+#- 실행은 run()을 부를 때만 (add는 선언만 함)
+#
+#사용 예:
+#    python pipeline.py ../data/raw/weather --out-dir ../data/processed
+
+CACHE_DIR = Path(__file__).resolve().parent / ".pipeline_cache"
+
+
+class Files:
+    """
+    파일 입력 (경로 또는 glob). 파일 내용이 바뀌면 해시도 바뀐다.
+    """
+
+    def __init__(self, folder, pattern="*"):
+        self.folder = Path(folder)
+        self.pattern = pattern
+
+    def paths(self):
+        return sorted(self.folder.glob(self.pattern))
+
+    def digest(self):
+        h = hashlib.sha256()
+        for path in self.paths():
+            h.update(path.name.encode("utf-8"))
+            h.update(hashlib.sha256(path.read_bytes()).digest())
+        return h.hexdigest()
+
+
+def _project_modules(func, deps=()):
+    #단계 함수가 쓰는 이 폴더 안의 모듈 전부 (모듈이 가져다 쓰는 모듈까지 따라감)
+    #→ 함수 본문은 그대로여도 부르는 함수(fill_missing 등)가 바뀌면 해시가 바뀐다.
+    root = Path(__file__).resolve().parent
+
+    def local(obj):
+        mod = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+        path = getattr(mod, "__file__", None)
+        if path and Path(path).resolve().is_relative_to(root):
+            return mod
+        return None
+
+    code = getattr(func, "__code__", None)
+    names = code.co_names if code is not None else ()
+    used = [func.__globals__[n] for n in names if n in func.__globals__]
+    todo = [m for m in map(local, [func, *used, *deps]) if m is not None]
+    seen = {}
+    while todo:
+        mod = todo.pop()
+        if mod.__name__ in seen:
+            continue
+        seen[mod.__name__] = Path(mod.__file__).resolve()
+        for obj in list(vars(mod).values()):
+            if inspect.ismodule(obj) or inspect.isfunction(obj) or inspect.isclass(obj):
+                found = local(obj)
+                if found is not None and found.__name__ not in seen:
+                    todo.append(found)
+    return [seen[name] for name in sorted(seen)]
+
+
+def _code_digest(func, deps=(), version=None):
+    """
+    함수 코드 해시 = 함수 소스 + 함수가 쓰는 로컬 모듈 소스 파일 + deps + version
+    deps: 해시에 더 넣을 모듈/함수/파일 경로 (자동으로 못 찾는 의존성)
+    version: 코드 밖 변화(외부 자료 규칙 등)를 반영하고 싶을 때 올리는 값
+    """
+    h = hashlib.sha256()
+    try:
+        h.update(inspect.getsource(func).encode("utf-8"))
+    except (OSError, TypeError):
+        h.update(f"{func.__module__}.{func.__qualname__}".encode("utf-8"))
+    paths = [Path(d) for d in deps if isinstance(d, (str, Path))]
+    objects = [d for d in deps if not isinstance(d, (str, Path))]
+    for path in _project_modules(func, objects) + sorted(paths):
+        h.update(path.name.encode("utf-8"))
+        h.update(hashlib.sha256(path.read_bytes()).digest())
+    if version is not None:
+        h.update(str(version).encode("utf-8"))
+    return h.hexdigest()
+
+
+class Pipeline:
+    """
+    단계 그래프 + 해시 캐시
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, workers=None):
+        self.cache_dir = Path(cache_dir)
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.stages = {}  #이름 → (함수, 입력 목록, 파라미터)
+        self.code_deps = {}  #이름 → (deps, version)
+        self.log = []     #(단계, "cache" / "run")
+
+    def add(self, name, func, inputs=(), deps=(), version=None, **params):
+        """
+        단계 선언 (실행하지 않음)
+        inputs: 앞 단계 이름(str) 또는 Files. 함수에는 inputs 순서대로 넘어간다.
+        deps/version: 코드 해시에 더할 의존성과 버전 (_code_digest 참고, 함수에는 안 넘어감)
+        params: 함수에 키워드 인자로 넘어가고 해시에 포함
+        """
+        for item in inputs:
+            if isinstance(item, str) and item not in self.stages:
+                raise KeyError(f"{name}: 앞 단계 '{item}'이(가) 먼저 선언돼야 합니다.")
+        self.stages[name] = (func, list(inputs), params)
+        self.code_deps[name] = (tuple(deps), version)
+        return name
+
+    # ==================== 해시 ====================
+    def _keys(self):
+        #선언 순서 = 위상 순서 (add에서 앞 단계가 먼저 있어야 하므로)
+        keys = {}
+        for name, (func, inputs, params) in self.stages.items():
+            h = hashlib.sha256()
+            h.update(name.encode("utf-8"))
+            h.update(_code_digest(func, *self.code_deps[name]).encode())
+            h.update(json.dumps(params, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8"))
+            for item in inputs:
+                h.update((keys[item] if isinstance(item, str) else item.digest()).encode())
+            keys[name] = h.hexdigest()[:20]
+        return keys
+
+    def _cache_path(self, name, key):
+        return self.cache_dir / f"{name}-{key}.pkl"
+
+    # ==================== 실행 ====================
+    def run(self, targets=None):
+        """
+        targets(기본값: 아래 단계가 없는 마지막 단계들)를 계산해서 {이름: 결과}로 반환
+        캐시가 있는 단계는 결과가 실제로 필요할 때만 읽는다.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        keys = self._keys()
+        if targets is None:
+            used = {i for _, inputs, _ in self.stages.values() for i in inputs if isinstance(i, str)}
+            targets = [n for n in self.stages if n not in used]
+
+        #targets에 필요한 단계만 (위로 거슬러 올라가며)
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name in needed:
+                continue
+            needed.add(name)
+            if not self._cache_path(name, keys[name]).exists():
+                stack.extend(i for i in self.stages[name][1] if isinstance(i, str))
+
+        results = {}
+
+        def load(name):
+            if name not in results:
+                results[name] = pd.read_pickle(self._cache_path(name, keys[name]))
+                self.log.append((name, "cache"))
+            return results[name]
+
+        def compute(name):
+            func, inputs, params = self.stages[name]
+            args = [results[i] if isinstance(i, str) else i for i in inputs]
+            out = func(*args, **params)
+            pd.to_pickle(out, self._cache_path(name, keys[name]))
+            return out
+
+        todo = [n for n in self.stages if n in needed and not self._cache_path(n, keys[n]).exists()]
+        for name in needed - set(todo):
+            if name in targets or any(name in self.stages[t][1] for t in todo):
+                load(name)
+
+        #앞 단계가 다 끝난 단계부터 동시에 실행
+        waiting = {n: {i for i in self.stages[n][1] if isinstance(i, str) and i in todo} for n in todo}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running = {}
+            while waiting or running:
+                for name in [n for n, deps in waiting.items() if not deps]:
+                    del waiting[name]
+                    running[executor.submit(compute, name)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    self.log.append((name, "run"))
+                    for deps in waiting.values():
+                        deps.discard(name)
+
+        return {name: results[name] for name in targets}
+
+    def clear_cache(self, keep_current=True):
+        """
+        캐시 정리 (keep_current면 현재 그래프의 결과는 남김)
+        """
+        current = {self._cache_path(n, k).name for n, k in self._keys().items()} if keep_current else set()
+        for path in self.cache_dir.glob("*.pkl"):
+            if path.name not in current:
+                path.unlink()
+
+
+# ==================== 기상 데이터 전처리 그래프 ====================
+def read_region_files(files, variable):
+    #구역별 CSV → 스키마 검사/정리 → merge_region_sheets (하나씩 읽어서 넘김)
+    schema = SCHEMAS[f"KMA_{variable}"]
+    return merge_region_sheets(
+        (parse_filename(path)[0], clean_structure(load_kma_csv(path, schema=schema), schema))
+        for path in files.paths()
+    )
+
+
+def fill_weather(df, variable, fill_method="mean"):
+    schema = SCHEMAS[f"KMA_{variable}"]
+    measures = [c for c, t in schema["columns"].items() if t == "float64" and c in df.columns]
+    return fill_missing(df, measures, method=fill_method, by="구역", time_col="일시")
+
+
+def build_weather_pipeline(folder, variables=None, cache_dir=CACHE_DIR, workers=None):
+    """
+    변수마다 (파일 읽기 → 구조 정리/결측치 → 연도/월) 3단계, 변수끼리는 독립(병렬)
+    """
+    variables = variables or [s.split("_", 1)[1] for s in SCHEMAS if s.startswith("KMA_")]
+    pipe = Pipeline(cache_dir, workers)
+    for variable in variables:
+        raw = pipe.add(f"{variable}_raw", read_region_files,
+                       [Files(folder, SCHEMAS[f"KMA_{variable}"]["pattern"])], variable=variable)
+        clean = pipe.add(f"{variable}_clean", fill_weather, [raw], variable=variable)
+        pipe.add(variable, add_year_month, [clean], quarter=True, season=True)
+    return pipe
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기상 데이터 전처리 파이프라인 (바뀐 단계만 다시 계산)")
+    parser.add_argument("folder", help="구역별 CSV 폴더 (예: ../data/raw/weather)")
+    parser.add_argument("--variables", nargs="*", help="변수 이름 (기본값: 스키마에 등록된 전체)")
+    parser.add_argument("--out-dir", help="결과 Parquet 저장 폴더")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR), help="단계별 캐시 폴더")
+    parser.add_argument("--workers", type=int, help="동시 실행 단계 수")
+    args = parser.parse_args()
+
+    pipe = build_weather_pipeline(args.folder, args.variables, args.cache_dir, args.workers)
+    results = pipe.run()
+    for name, status in pipe.log:
+        print(f"{status:>5}  {name}")
+
+    for variable, df in results.items():
+        print(f"{variable}: {len(df)}행")
+        if args.out_dir:
+            out_path = Path(args.out_dir) / f"강원도_{variable}.parquet"
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(out_path, index=False)
+
+
+if __name__ == "__main__":
+    main()
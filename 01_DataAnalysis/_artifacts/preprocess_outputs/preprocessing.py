@@ -4,29 +4,279 @@ import matplotlib.pyplot as plt
 
 
 #행열 정리 코드
-def clean_structure(df):
-    df = df.iloc[:-3, :-3]      # 뒤쪽 행/열 제거만
+#고정 위치(iloc[:-3, :-3])로 자르지 않고 스키마(_artifacts/schemas.py의 SCHEMAS 항목)를 기준으로 정리.
+#파일을 읽을 때부터 자르려면 schemas.read_with_schema를 쓰고, 이건 이미 읽은 DataFrame용.
+def clean_structure(df, schema=None, strict=True):
+    """
+    schema가 있으면 (검사/footer 판별은 schemas.py와 같은 함수 사용)
+    - 컬럼명 정리(공백/탭) 후 필수 컬럼 검사 (없으면 SchemaError, strict면 모르는 컬럼도 오류)
+    - 스키마 컬럼만 남김
+    - key 컬럼이 row_rule에 안 맞는 첫 행부터 footer로 보고 제거
+      (빈 행 때문에 key가 실수(105.0)로 읽혀도 정수로 보고 비교)
+    schema가 없으면 빈 행/열, 이름 없는 열(Unnamed)만 제거
+    """
+    df = df.rename(columns=lambda c: str(c).replace("\t", "").strip())
+    df = df.loc[:, [c for c in df.columns if c and not c.startswith("Unnamed:")]]
+
+    if schema is None:
+        return df.dropna(how="all").dropna(axis=1, how="all").reset_index(drop=True)
+
+    from schemas import check_columns, count_key_rows
+    check_columns(df.columns, schema, strict=strict)
+    end = count_key_rows(df[schema["key"]], schema)
+
+    df = df.iloc[:end][[c for c in df.columns if c in schema["columns"]]]
     return df.reset_index(drop=True)
 
-#강제로 행,열 정리하는 것이므로 전처리 과정에 크게 유용하지 못함.
+#결측값 처리 방법 (crawler_config.DATA_CLEANING['FILL_METHOD']와 같은 이름)
+#interpolate는 시간 보간 (time_col이 있으면 날짜 간격 기준, 없으면 행 순서 기준)
+FILL_METHODS = ("forward", "backward", "mean", "median", "zero", "interpolate")
+
+
+def _to_numeric(df, cols):
+    #숫자가 아닌 컬럼만 골라서 한 번에 변환
+    bad = [c for c in cols if not pd.api.types.is_numeric_dtype(df[c])]
+    if bad:
+        df[bad] = df[bad].apply(pd.to_numeric, errors="coerce")
+
+
+def _group_keys(df, by, time_col):
+    #by에 "월"이 있는데 컬럼이 없으면 time_col에서 월을 뽑아 쓴다.
+    keys = []
+    for key in ([by] if isinstance(by, str) else list(by)):
+        if key == "월" and key not in df.columns and time_col is not None:
+            keys.append(pd.to_datetime(df[time_col]).dt.month.rename("월"))
+        else:
+            keys.append(df[key])
+    return keys
+
+
+def _interpolate(block, times):
+    if times is None:
+        return block.interpolate(method="linear", limit_area="inside")
+    out = block.set_axis(pd.DatetimeIndex(times)).interpolate(method="time", limit_area="inside")
+    return out.set_axis(block.index)
 
 
-#결측값 처리 (평균 값으로 대체)
-def handle_rainfall_missing(df,col):
-    if not pd.api.types.is_numeric_dtype(df[col]):
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    
-    pre = df[col].mean().round(1)
-    df[col] = df[col].fillna(pre)
+#결측값 처리 (여러 컬럼을 한 번에)
+def fill_missing(
+    df,
+    cols,
+    method=None,
+    by=None,
+    time_col=None,
+    config=None,
+    decimals=1,
+    inplace=False
+):
+    """
+    cols: 결측치를 채울 컬럼 목록 (숫자로 변환해서 처리)
+    method: FILL_METHODS 중 하나. None이면 config["FILL_METHOD"], config도 없으면 "mean"
+    by: 그룹 기준 컬럼 (예: "구역", ["구역", "월"]) → 그룹 안에서만 채움
+    time_col: 날짜 컬럼. 있으면 날짜순으로 ffill/bfill/보간 (원래 행 순서는 유지)
+    config: crawler_config.DATA_CLEANING 같은 dict
+    decimals: mean/median으로 채운 값 반올림 자리수 (None이면 반올림 안 함)
 
+    컬럼별로 몇 개를 채웠는지는 df.attrs["fill_report"]에 들어간다.
+    {컬럼: {"결측": 채우기 전, "채움": 채운 개수, "남음": 남은 결측}}
+    """
+    if method is None:
+        method = (config or {}).get("FILL_METHOD", "mean")
+    if method not in FILL_METHODS:
+        raise ValueError(f"method는 {FILL_METHODS} 중 하나여야 합니다: {method}")
+
+    if not inplace:
+        df = df.copy()
+
+    cols = [c for c in cols if c in df.columns]
+    if not cols:
+        df.attrs["fill_report"] = {}
+        return df
+    _to_numeric(df, cols)
+
+    block = df[cols]
+    before = block.isna().sum()
+
+    #날짜순으로 정렬해서 처리 후 원래 순서로 되돌림 (인덱스가 중복돼도 되도록 위치 기준)
+    order = None
+    if time_col is not None and method in ("forward", "backward", "interpolate"):
+        order = np.argsort(pd.to_datetime(df[time_col]).to_numpy(), kind="stable")
+        block = block.iloc[order]
+
+    keys = None
+    if by is not None:
+        keys = _group_keys(df, by, time_col)
+        if order is not None:
+            keys = [k.iloc[order] for k in keys]
+        grouped = block.groupby(keys, observed=True, sort=False)
+
+    if method == "zero":
+        filled = block.fillna(0)
+    elif method in ("forward", "backward"):
+        fill = "ffill" if method == "forward" else "bfill"
+        filled = getattr(grouped if keys is not None else block, fill)()
+    elif method in ("mean", "median"):
+        stat = grouped.transform(method) if keys is not None else getattr(block, method)()
+        if decimals is not None:
+            stat = stat.round(decimals)
+        filled = block.fillna(stat)
+    else:
+        times = None if time_col is None else df[time_col].iloc[order]
+        if keys is None:
+            filled = _interpolate(block, times)
+        else:
+            #그룹 경계를 넘어 보간하지 않도록 그룹(구역 등)마다 따로
+            filled = block.copy()
+            for idx in grouped.indices.values():
+                filled.iloc[idx] = _interpolate(
+                    block.iloc[idx], None if times is None else times.iloc[idx]
+                )
+
+    if order is not None:
+        filled = filled.iloc[np.argsort(order)]
+    df[cols] = filled.to_numpy()
+
+    after = df[cols].isna().sum()
+    df.attrs["fill_report"] = {
+        col: {"결측": int(before[col]), "채움": int(before[col] - after[col]), "남음": int(after[col])}
+        for col in cols
+    }
     return df
 
+
 #결측값 처리 (평균 값으로 대체)= 범용성 있도록 개선한 함수는 이 쪽.
 def handle_missing(df, col):
-    if not pd.api.types.is_numeric_dtype(df[col]):
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return fill_missing(df, [col], method="mean", inplace=True)
 
-    pre = df[col].mean().round(1)
-    df[col] = df[col].fillna(pre)
+#강수량 전용으로 먼저 만들었던 함수 (handle_missing과 같음, 기존 노트북 호환용)
+def handle_rainfall_missing(df, col):
+    return handle_missing(df, col)
 
-    return df
\ No newline at end of file
+
+#이상치 처리 방법 (crawler_config.DATA_CLEANING['OUTLIER_METHOD']와 같은 이름)
+#rolling은 시간순 이동 구간(window) 안에서 IQR 기준 (계절 변화를 따라감)
+OUTLIER_METHODS = ("IQR", "Z-score", "rolling")
+OUTLIER_ACTIONS = ("flag", "mask", "clip")
+_DEFAULT_THRESHOLD = {"IQR": 1.5, "Z-score": 3.0, "rolling": 1.5}
+
+
+def _group_codes(df, keys):
+    #행마다 그룹 번호 (그룹이 없으면 전부 0)
+    if keys is None:
+        return np.zeros(len(df), dtype=np.intp)
+    #dropna=False: 키가 빈 행도 자기 그룹을 받음 (-1이면 low[codes]가 마지막 그룹 기준을 가져감)
+    return df.groupby(keys, observed=True, sort=True, dropna=False).ngroup().to_numpy()
+
+
+def _outlier_bounds(block, codes, method, threshold, window, order):
+    #컬럼별 하한/상한 (행 기준 배열, shape = block.shape)
+    if method == "rolling":
+        if order is not None:
+            block = block.iloc[order]
+            codes = codes[order]
+        rolled = block.reset_index(drop=True).groupby(codes, sort=False).rolling(
+            window, center=True, min_periods=max(2, window // 2)
+        )
+        q1 = rolled.quantile(0.25).droplevel(0).sort_index().to_numpy()
+        q3 = rolled.quantile(0.75).droplevel(0).sort_index().to_numpy()
+        lower, upper = q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+        if order is not None:
+            back = np.argsort(order)
+            lower, upper = lower[back], upper[back]
+        return lower, upper
+
+    grouped = block.groupby(codes, sort=True)
+    if method == "IQR":
+        q1 = grouped.quantile(0.25).to_numpy()
+        q3 = grouped.quantile(0.75).to_numpy()
+        low, high = q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+    else:
+        mean = grouped.mean().to_numpy()
+        std = grouped.std().to_numpy()
+        low, high = mean - threshold * std, mean + threshold * std
+    #그룹별 값 → 행으로 펼치기
+    return low[codes], high[codes]
+
+
+#이상치 처리 (여러 컬럼을 한 번에)
+def handle_outliers(
+    df,
+    cols,
+    method=None,
+    threshold=None,
+    action="flag",
+    by=None,
+    time_col=None,
+    window=12,
+    config=None,
+    inplace=False
+):
+    """
+    cols: 검사할 컬럼 목록 (숫자로 변환해서 처리)
+    method: OUTLIER_METHODS 중 하나. None이면 config["OUTLIER_METHOD"], config도 없으면 "IQR"
+            config의 OUTLIER_METHOD가 None이면 아무것도 하지 않는다.
+    threshold: IQR 배수 / 표준편차 배수 (None이면 config["OUTLIER_THRESHOLD"] 또는 기본값)
+    action: "flag" → "{컬럼}_이상치" bool 컬럼 추가
+            "mask" → 이상치를 NaN으로 (fill_missing으로 다시 채울 수 있음)
+            "clip" → 하한/상한으로 자름
+    by: 그룹 기준 (예: "구역", ["구역", "월"]) → 지점별/월별로 따로 기준 계산
+    time_col, window: rolling에서 쓰는 날짜 컬럼과 구간 길이(행 수, 가운데 정렬)
+
+    컬럼별 처리 결과는 df.attrs["outlier_report"]에 들어간다.
+    {컬럼: {"이상치": 개수, "하한초과": 아래로 벗어난 개수, "상한초과": 위로 벗어난 개수}}
+    """
+    config = config or {}
+    if method is None:
+        method = config.get("OUTLIER_METHOD", "IQR")
+    if not inplace:
+        df = df.copy()
+    if method is None:
+        df.attrs["outlier_report"] = {}
+        return df
+
+    method = {m.lower(): m for m in OUTLIER_METHODS}.get(str(method).lower())
+    if method is None:
+        raise ValueError(f"method는 {OUTLIER_METHODS} 중 하나여야 합니다.")
+    if action not in OUTLIER_ACTIONS:
+        raise ValueError(f"action은 {OUTLIER_ACTIONS} 중 하나여야 합니다: {action}")
+    if threshold is None:
+        threshold = config.get("OUTLIER_THRESHOLD", _DEFAULT_THRESHOLD[method])
+
+    cols = [c for c in cols if c in df.columns]
+    if not cols:
+        df.attrs["outlier_report"] = {}
+        return df
+    _to_numeric(df, cols)
+
+    keys = None if by is None else _group_keys(df, by, time_col)
+    codes = _group_codes(df, keys)
+    order = None
+    if method == "rolling" and time_col is not None:
+        order = np.argsort(pd.to_datetime(df[time_col]).to_numpy(), kind="stable")
+
+    block = df[cols]
+    lower, upper = _outlier_bounds(block, codes, method, threshold, window, order)
+    values = block.to_numpy(dtype="float64")
+
+    with np.errstate(invalid="ignore"):
+        below = values < lower
+        above = values > upper
+    outlier = below | above
+
+    if action == "flag":
+        for i, col in enumerate(cols):
+            df[f"{col}_이상치"] = outlier[:, i]
+    elif action == "mask":
+        df[cols] = np.where(outlier, np.nan, values)
+    else:
+        df[cols] = np.where(below, lower, np.where(above, upper, values))
+
+    df.attrs["outlier_report"] = {
+        col: {
+            "이상치": int(outlier[:, i].sum()),
+            "하한초과": int(below[:, i].sum()),
+            "상한초과": int(above[:, i].sum()),
+        }
+        for i, col in enumerate(cols)
+    }
+    return df
@@ -0,0 +1,273 @@
+import fnmatch
+import io
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from encoding import read_text
+
+#원본 파일(출처)별 스키마 모음.
+#로더는 "전부 읽고 iloc로 자르기" 대신 여기 적힌 대로
+#헤더 줄 찾기 → 컬럼 검사(다르면 바로 오류) → 필요한 컬럼/행만 읽기(usecols, nrows)를 한다.
+#인코딩은 스키마에 적지 않고 encoding.py가 판별한다.
+#
+#스키마 항목
+#    pattern: 파일명 패턴 (detect_source에서 사용)
+#    header_keys: 헤더 줄 판별용 컬럼명 (하나만 있어도 헤더로 봄)
+#    key: 데이터 행 판별 컬럼 (이 값이 비거나 형식이 안 맞는 첫 행부터 footer)
+#    row_rule: key 값 형식 (정규식)
+#    columns: {컬럼명: dtype} — 파일에 있어야 하는 컬럼 전체
+#    required: 꼭 있어야 하는 컬럼 (없으면 SchemaError)
+#    units: {컬럼명: 단위}
+#    na_values: 결측으로 볼 표기
+
+
+class SchemaError(ValueError):
+    """
+    파일 구조가 스키마와 다름 (컬럼 누락/추가, 헤더 없음)
+    """
+
+
+_UNIT = re.compile(r"\(([^)]*)\)\s*$")
+
+
+def _units(columns):
+    #"평균풍속(m/s)" → "m/s"
+    units = {}
+    for col in columns:
+        m = _UNIT.search(col)
+        if m:
+            units[col] = m.group(1)
+    return units
+
+
+def _kma(variable, measures, dates=()):
+    """
+    기상청 월별 자료 스키마 (지점번호/지점명/일시 + 관측값 + 발생일자)
+    """
+    columns = {"지점번호": "int16", "지점명": "category", "일시": "string"}
+    columns.update({col: "float64" for col in measures})
+    columns.update({col: "string" for col in dates})
+    return {
+        "pattern": f"*_{variable}_*.csv",
+        "loader": "kma",
+        "header_keys": ("일시", "지점번호"),
+        "key": "지점번호",
+        "row_rule": r"\d+",
+        "columns": columns,
+        "required": ["지점번호", "일시", measures[0]],
+        "units": _units(measures),
+        "na_values": [],
+    }
+
+
+SCHEMAS = {
+    "KMA_월별강수량": _kma(
+        "월별강수량",
+        ["강수량(mm)", "일최다강수량(mm)", "1시간최다강수량(mm)"],
+        ["일최다강수량일자", "1시간최다강수량일자"],
+    ),
+    "KMA_월별기온": _kma(
+        "월별기온",
+        ["평균기온(℃)", "평균최고기온(℃)", "최고기온(℃)", "평균최저기온(℃)", "최저기온(℃)"],
+        ["최고기온일자", "최저기온일자"],
+    ),
+    "KMA_월별풍속": _kma(
+        "월별풍속",
+        ["평균풍속(m/s)", "최대풍속(m/s)", "최대풍속풍향(deg)", "최대순간풍속(m/s)", "최대순간풍속풍향(deg)"],
+        ["최대풍속일자", "최대순간풍속일자"],
+    ),
+    "KMA_월일조일사": _kma(
+        "월일조일사",
+        ["일조합(hr)", "일조율(%)", "일사합(MJ/m2)"],
+    ),
+    #한국에너지공단 기초지자체별 신재생에너지 보급 현황 (공공데이터포털)
+    "KNREC_기초지자체": {
+        "pattern": "한국에너지공단_기초지자체별*.csv",
+        "header_keys": ("광역", "기초"),
+        "key": "광역",
+        "row_rule": r"\S+",
+        "columns": {
+            "광역": "category",
+            "기초": "category",
+            "에너지원": "category",
+            "생산량(toe)": "float64",
+            "발전량(MWh)": "float64",
+            "보급용량_발전_누적(kW)": "float64",
+            "보급용량_발전_신규(kW)": "float64",
+        },
+        "required": ["광역", "기초", "에너지원", "발전량(MWh)"],
+        "units": _units(["생산량(toe)", "발전량(MWh)", "보급용량_발전_누적(kW)", "보급용량_발전_신규(kW)"]),
+        "na_values": ["-"],
+    },
+    #한국에너지공단 재생에너지 사용 확인제도 참여 현황
+    "KNREC_RE100_거래": {
+        "pattern": "한국에너지공단_재생에너지 사용 확인제도*.csv",
+        "header_keys": ("거래일자",),
+        "key": "거래일자",
+        "row_rule": r"\d{4}-\d{2}-\d{2}",
+        "columns": {
+            "거래일자": "string",
+            "계약형태": "category",
+            "거래건수(건)": "float64",
+            "거래물량(MWh)": "float64",
+            "거래물량(REC)": "float64",
+            "평균단가(원_MWh)": "float64",
+            "평균단가(원_REC)": "float64",
+        },
+        "required": ["거래일자", "계약형태", "거래물량(MWh)"],
+        "units": {"거래건수(건)": "건", "거래물량(MWh)": "MWh", "거래물량(REC)": "REC",
+                  "평균단가(원_MWh)": "원/MWh", "평균단가(원_REC)": "원/REC"},
+        "na_values": ["거래없음"],
+    },
+}
+
+
+def get_schema(source):
+    try:
+        return SCHEMAS[source]
+    except KeyError:
+        raise KeyError(f"등록되지 않은 출처: {source} (등록된 출처: {list(SCHEMAS)})") from None
+
+
+def detect_source(path):
+    """
+    파일명으로 출처 찾기 (없으면 None)
+    """
+    name = Path(path).name
+    for source, schema in SCHEMAS.items():
+        if fnmatch.fnmatch(name, schema["pattern"]):
+            return source
+    return None
+
+
+def normalize_columns(columns):
+    #앞뒤 공백/탭 제거, 빈 컬럼(끝 쉼표, Unnamed: n) 제외
+    cleaned = []
+    for col in columns:
+        col = str(col).replace("\t", "").strip()
+        if col and not col.startswith("Unnamed:"):
+            cleaned.append(col)
+    return cleaned
+
+
+def check_columns(columns, schema, source="", strict=True):
+    """
+    헤더 컬럼을 스키마와 비교
+    - required 컬럼이 없으면 SchemaError
+    - strict=True면 스키마에 없는 컬럼이 생겨도 SchemaError (원본 형식 변경 감지)
+    """
+    columns = normalize_columns(columns)
+    missing = [c for c in schema["required"] if c not in columns]
+    if missing:
+        raise SchemaError(f"{source}: 필수 컬럼 없음 {missing} (파일 컬럼: {columns})")
+    extra = [c for c in columns if c not in schema["columns"]]
+    if strict and extra:
+        raise SchemaError(f"{source}: 스키마에 없는 컬럼 {extra}")
+    return columns
+
+
+def find_header(lines, schema):
+    """
+    헤더 줄 번호 (검색조건 같은 앞쪽 설명 줄은 건너뜀)
+    """
+    for i, line in enumerate(lines):
+        cells = normalize_columns(line.split(","))
+        if any(key in cells for key in schema["header_keys"]):
+            return i
+    raise SchemaError(f"헤더 줄({schema['header_keys']})을 찾을 수 없습니다.")
+
+
+def _key_text(keys):
+    #key 값을 비교용 문자열로: 탭/공백/따옴표 제거, 숫자로 읽힌 값(105.0)은 정수 표기, 결측은 ""
+    text = pd.Series(keys).astype("string").str.replace("\t", "", regex=False).str.strip().str.strip('"')
+    return text.str.replace(r"^(\d+)\.0+$", r"\1", regex=True).fillna("")
+
+
+def count_key_rows(keys, schema):
+    """
+    key 값 목록에서 데이터 행이 몇 개인지 (row_rule에 안 맞는 첫 값부터 footer)
+    """
+    valid = _key_text(keys).str.fullmatch(schema["row_rule"]).fillna(False).to_numpy(dtype=bool)
+    return len(valid) if valid.all() else int((~valid).argmax())
+
+
+def count_rows(lines, schema, key_pos=0):
+    """
+    헤더 다음부터 데이터 행이 몇 줄인지 (key 값이 row_rule에 안 맞는 첫 줄부터 footer)
+    """
+    cells = [line.split(",") for line in lines]
+    keys = [c[key_pos] if len(c) > key_pos else "" for c in cells]
+    return count_key_rows(keys, schema)
+
+
+def read_with_schema(path, source=None, usecols=None, strict=True):
+    """
+    스키마에 맞춰 파일 읽기
+    source: SCHEMAS 키 (None이면 파일명으로 찾음)
+    usecols: 읽을 컬럼 (None이면 스키마 컬럼 전체)
+
+    footer와 스키마 밖 컬럼은 읽지 않는다 (nrows, usecols).
+    구조가 다르면 SchemaError.
+    """
+    source = source or detect_source(path)
+    if source is None:
+        raise SchemaError(f"{Path(path).name}: 맞는 스키마가 없습니다.")
+    schema = get_schema(source)
+
+    if schema.get("loader") == "kma":
+        from kma_loader import load_kma_csv
+        return load_kma_csv(path, schema=schema, usecols=usecols, strict=strict)
+
+    if Path(path).suffix in (".xlsx", ".xls"):
+        return _read_excel(path, schema, source, usecols, strict)
+
+    text = read_text(path)  #인코딩 자동 판별, UTF-8 캐시
+    lines = text.splitlines()
+    header = find_header(lines, schema)
+    raw_columns = lines[header].split(",")
+    columns = check_columns(raw_columns, schema, source, strict)
+    key_pos = [c.replace("\t", "").strip() for c in raw_columns].index(schema["key"])
+    nrows = count_rows(lines[header + 1:], schema, key_pos)
+
+    wanted = [c for c in (usecols or columns) if c in schema["columns"]]
+    df = pd.read_csv(
+        io.StringIO(text),
+        skiprows=header,
+        nrows=nrows,
+        usecols=lambda c: c.strip() in wanted,
+        dtype=str,
+        skipinitialspace=True,
+    )
+    df.columns = [c.strip() for c in df.columns]
+    return _cast(df, schema)
+
+
+def _read_excel(path, schema, source, usecols, strict):
+    #헤더만 먼저 읽어 검사 → key 컬럼만 읽어 footer 위치 확인 → 필요한 컬럼/행만 읽기
+    columns = check_columns(pd.read_excel(path, nrows=0).columns, schema, source, strict)
+    key = pd.read_excel(path, usecols=[schema["key"]], dtype=str)[schema["key"]]
+    nrows = count_key_rows(key, schema)
+
+    wanted = [c for c in (usecols or columns) if c in schema["columns"]]
+    df = pd.read_excel(path, usecols=lambda c: str(c).strip() in wanted, nrows=nrows, dtype=str)
+    df.columns = [str(c).strip() for c in df.columns]
+    return _cast(df, schema)
+
+
+def _cast(df, schema):
+    na_values = set(schema.get("na_values", []))
+    for col in df.columns:
+        dtype = schema["columns"][col]
+        values = df[col].str.strip()
+        if na_values:
+            values = values.mask(values.isin(na_values))
+        if dtype in ("float64", "int16"):
+            values = pd.to_numeric(values.str.replace(",", "", regex=False), errors="coerce")
+            values = values.astype("Int16" if dtype == "int16" and values.isna().any() else dtype)
+        else:
+            values = values.astype(dtype)
+        df[col] = values
+    df.attrs["units"] = {c: u for c, u in schema["units"].items() if c in df.columns}
+    return df
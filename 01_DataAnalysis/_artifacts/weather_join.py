@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+#기상 변수(강수량/기온/풍속/일조일사)를 하나의 넓은 표로 합치기.
+#키는 정렬된 (구역, 일시) MultiIndex 하나로 통일하고,
+#변수별 df를 pd.merge로 여러 번 붙이는 대신 정렬된 인덱스끼리 한 번에 맞춘다.
+#
+#- join_variables: 정확히 같은 (구역, 일시)끼리 결합
+#- fill_from_nearest: 어떤 변수가 없는 구역은 가장 가까운 관측소 값으로 채움
+#- asof_join: 발전량처럼 날짜가 딱 맞지 않는 표에 "그 시점 이전 최근 기상값" 붙이기
+#
+#사용 예:
+#    wide = join_variables({"월별강수량": rain_df, "월별풍속": wind_df, ...})
+#    wide = fill_from_nearest(wide)
+#    merged = asof_join(energy_df, wide, on="일시", by="구역")
+
+KEYS = ["구역", "일시"]
+
+#관측값이 아닌 컬럼 (넓은 표에는 넣지 않음)
+NON_MEASURES = {"지점번호", "지점", "지점명", "연도", "월", "분기", "계절"}
+
+#ASOS 관측소 위치 (위도, 경도) — 가까운 관측소 찾기용
+STATION_COORDS = {
+    "강원도(강릉)": (37.7515, 128.8910),
+    "강원도(대관령)": (37.6771, 128.7183),
+    "강원도(동해)": (37.5071, 129.1243),
+    "강원도(북강릉)": (37.8046, 128.8554),
+    "강원도(북춘천)": (37.9474, 127.7544),
+    "강원도(속초)": (38.2509, 128.5647),
+    "강원도(영월)": (37.1813, 128.4574),
+    "강원도(원주)": (37.3375, 127.9466),
+    "강원도(인제)": (38.0599, 128.1671),
+    "강원도(정선군)": (37.3807, 128.6460),
+    "강원도(철원)": (38.1479, 127.3042),
+    "강원도(춘천)": (37.9026, 127.7357),
+    "강원도(태백)": (37.1705, 128.9893),
+    "강원도(홍천)": (37.6836, 127.8804),
+}
+
+
+def _measures(df):
+    return [
+        c for c in df.columns
+        if c not in NON_MEASURES and c not in KEYS and pd.api.types.is_numeric_dtype(df[c])
+    ]
+
+
+def _indexed(df, columns):
+    #(구역, 일시) 인덱스 + 정렬. 이미 그 인덱스면 다시 만들지 않는다.
+    if list(df.index.names) != KEYS:
+        df = df.set_index(KEYS)
+    df = df[columns]
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+
+def join_variables(frames, columns=None, how="outer"):
+    """
+    변수별 DataFrame → (구역, 일시) 인덱스의 넓은 표 하나
+    frames: {변수이름: df} (df에는 "구역", "일시" 컬럼이 있어야 함)
+    columns: {변수이름: [쓸 컬럼]} (없으면 숫자 관측값 컬럼 전체)
+    how: "outer"면 어느 변수에든 있는 (구역, 일시) 전부, "inner"면 모든 변수에 있는 것만
+
+    컬럼 이름이 변수끼리 겹치면 "변수이름:컬럼" 으로 바꾼다.
+    """
+    columns = columns or {}
+    parts = []
+    seen = {}
+    for variable, df in frames.items():
+        cols = columns.get(variable) or _measures(df)
+        part = _indexed(df, cols)
+        for col in cols:
+            seen[col] = seen.get(col, 0) + 1
+        parts.append((variable, part))
+
+    renamed = []
+    for variable, part in parts:
+        dup = [c for c in part.columns if seen[c] > 1]
+        if dup:
+            part = part.rename(columns={c: f"{variable}:{c}" for c in dup})
+        renamed.append(part)
+
+    #정렬된 인덱스끼리 한 번에 맞춤 (변수 수만큼 merge를 반복하지 않음)
+    wide = pd.concat(renamed, axis=1, join=how, sort=True)
+    if not isinstance(wide.index.levels[0].dtype, pd.CategoricalDtype):
+        wide.index = wide.index.set_levels(wide.index.levels[0].astype("category"), level=0)
+    return wide
+
+
+def nearest_stations(regions, coords=None):
+    """
+    구역마다 다른 구역을 가까운 순서로 정렬한 목록 {구역: [가까운 구역, ...]}
+    (위경도 평면 거리, 경도는 위도에 맞게 보정)
+    """
+    coords = coords or STATION_COORDS
+    regions = [r for r in regions if r in coords]
+    if not regions:
+        return {}
+    lat = np.radians([coords[r][0] for r in regions])
+    lon = np.radians([coords[r][1] for r in regions])
+    x = lon[:, None] - lon[None, :]
+    x = x * np.cos((lat[:, None] + lat[None, :]) / 2)
+    y = lat[:, None] - lat[None, :]
+    dist = np.hypot(x, y)
+    order = np.argsort(dist, axis=1)
+    return {r: [regions[j] for j in order[i] if j != i] for i, r in enumerate(regions)}
+
+
+def fill_from_nearest(wide, columns=None, coords=None, max_neighbors=3):
+    """
+    구역에 값이 없는 (구역, 일시, 컬럼)을 가까운 관측소의 같은 일시 값으로 채운다.
+    (예: 한 관측소가 풍속은 없고 강수량만 있을 때)
+    max_neighbors: 가까운 순서로 몇 곳까지 찾아볼지
+
+    구역별로 몇 개를 채웠는지는 wide.attrs["filled_from"]에
+    {컬럼: {구역: 채운 개수}} 형태로 남긴다.
+    """
+    columns = columns or list(wide.columns)
+    regions = list(wide.index.get_level_values(0).unique())
+    neighbors = nearest_stations(regions, coords)
+
+    wide = wide.copy()
+    filled_from = {}
+    for col in columns:
+        #일시 × 구역 행렬로 펼쳐서 이웃 구역 열을 통째로 가져다 채움
+        table = wide[col].unstack(level=0)
+        values = table.to_numpy(copy=True)
+        pos = {r: i for i, r in enumerate(table.columns)}
+        counts = {}
+        for region, near in neighbors.items():
+            i = pos[region]
+            for other in near[:max_neighbors]:
+                hole = np.isnan(values[:, i])
+                if not hole.any():
+                    break
+                src = table[other].to_numpy()
+                take = hole & ~np.isnan(src)
+                values[take, i] = src[take]
+                if take.any():
+                    counts[region] = counts.get(region, 0) + int(take.sum())
+        if counts:
+            table = pd.DataFrame(values, index=table.index, columns=table.columns)
+            stacked = table.stack(future_stack=True).swaplevel().reindex(wide.index)
+            wide[col] = stacked.to_numpy()
+            filled_from[col] = counts
+    wide.attrs["filled_from"] = filled_from
+    return wide
+
+
+def asof_join(left, wide, on="일시", by="구역", tolerance=None, direction="backward"):
+    """
+    left의 각 행에 같은 구역의 "on 시점 이전(또는 이후) 가장 가까운" 기상값을 붙인다.
+    (정렬 후 pd.merge_asof 한 번, 결과는 left의 행 순서와 index 그대로)
+    tolerance: 허용 간격 (예: pd.Timedelta("45D")), 넘으면 NaN
+    """
+    right = wide.reset_index() if list(wide.index.names) == KEYS else wide
+    right = right.sort_values(on, kind="stable")
+    #merge_asof는 on 기준 정렬이 필요 → 정렬 순서를 기억해 두었다가 되돌린다.
+    order = np.argsort(left[on].to_numpy(), kind="stable")
+    sorted_left = left.iloc[order]
+
+    #merge_asof의 by 컬럼은 양쪽 타입이 같아야 함
+    if isinstance(right[by].dtype, pd.CategoricalDtype):
+        right = right.assign(**{by: right[by].astype(str)})
+    if isinstance(sorted_left[by].dtype, pd.CategoricalDtype):
+        sorted_left = sorted_left.assign(**{by: sorted_left[by].astype(str)})
+
+    merged = pd.merge_asof(
+        sorted_left, right, on=on, by=by, tolerance=tolerance, direction=direction
+    )
+    #merge_asof 결과는 sorted_left와 한 행씩 대응 → 원래 순서/index/구역 타입으로 복원
+    merged = merged.take(np.argsort(order, kind="stable"))
+    merged.index = left.index
+    merged[by] = left[by]
+    return merged
@@ -0,0 +1,219 @@
+"""
+차트 일괄 생성기
+- 차트를 "스펙(dict) 목록"으로 선언하고 한 번에 그린다
+- 프로세스 풀 + Agg 백엔드, 프로세스마다 Figure 하나를 재사용
+- 입력 데이터/옵션/그리는 코드의 해시가 지난번과 같으면 건너뜀 (.chart_manifest.json)
+
+스펙 예:
+    {
+        'name': 'chart1_total',          # 파일 이름 (확장자 제외)
+        'kind': 'bar',                   # RENDERERS 키
+        'data': df,                      # 그릴 DataFrame
+        'size': (14, 6),                 # 그림 크기 (인치)
+        'params': {'x': '지역', 'y': '총발전량(GWh)', 'title': '...'},
+    }
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = '.chart_manifest.json'
+DEFAULT_SIZE = (12, 6)
+
+
+# ==================== 차트 종류 ====================
+def draw_bar(ax, df, x, y, color='#4CAF50', sort=False, title='', xlabel='', ylabel='',
+             rotation=45, value_labels=False):
+    """막대 그래프 (시군별 총 발전량 등)"""
+    if sort:
+        df = df.sort_values(y, ascending=False)
+    bars = ax.bar(df[x].astype(str), df[y], color=color)
+    if value_labels:
+        ax.bar_label(bars, fmt='%.0f', padding=2)
+    ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+    ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=16, fontweight='bold')
+    ax.tick_params(axis='x', labelrotation=rotation)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right' if rotation else 'center')
+
+
+def draw_stacked_bar(ax, df, x, columns, colors=None, labels=None, title='', ylabel='',
+                     rotation=45):
+    """누적 막대 (에너지원별 발전량) — 누적 높이는 cumsum으로 한 번에 계산"""
+    values = df[columns].to_numpy(dtype=float)
+    bottoms = np.zeros_like(values)
+    bottoms[:, 1:] = np.cumsum(values, axis=1)[:, :-1]
+    pos = np.arange(len(df))
+    colors = colors or [None] * len(columns)
+    labels = labels or columns
+    for i in range(len(columns)):
+        ax.bar(pos, values[:, i], bottom=bottoms[:, i], label=labels[i], color=colors[i])
+    ax.set_xticks(pos)
+    ax.set_xticklabels(df[x].astype(str), rotation=rotation, ha='right' if rotation else 'center')
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+
+
+def draw_line(ax, df, x, y, title='', xlabel='', ylabel='', marker='o', grid=True):
+    """연도별 추이 (y는 컬럼 하나 또는 목록)"""
+    for col in ([y] if isinstance(y, str) else y):
+        ax.plot(df[x], df[col], marker=marker, label=col)
+    if not isinstance(y, str):
+        ax.legend()
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(grid)
+
+
+def draw_count_trend(ax, df, x, y, title='', xlabel='', ylabel='', bar_color='salmon',
+                     line_color='blue'):
+    """연도별 개수 막대 + 누적 선 (RE100 가입연도별 기업 수)"""
+    ax.bar(df[x], df[y], color=bar_color, label=f'연도별 {ylabel}')
+    ax.plot(df[x], df[y].cumsum(), color=line_color, marker='o', label=f'누적 {ylabel}')
+    ax.set_xticks(df[x])
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.legend()
+
+
+def draw_hbar_highlight(ax, df, label, value, highlight=None, color='skyblue',
+                        highlight_color='red', title='', xlabel='', xlim=None, unit=''):
+    """가로 막대 + 특정 항목 강조 (국가별 재생에너지 사용률, 한국만 빨간색)"""
+    colors = np.where(df[label] == highlight, highlight_color, color)
+    pos = np.arange(len(df))
+    ax.barh(pos, df[value], color=colors)
+    ax.set_yticks(pos)
+    ax.set_yticklabels(df[label])
+    ax.invert_yaxis()
+    for i, v in enumerate(df[value]):
+        ax.text(v + 1, i, f'{v}{unit}', va='center')
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel)
+    if xlim:
+        ax.set_xlim(*xlim)
+
+
+RENDERERS = {
+    'bar': draw_bar,
+    'stacked_bar': draw_stacked_bar,
+    'line': draw_line,
+    'count_trend': draw_count_trend,
+    'hbar_highlight': draw_hbar_highlight,
+}
+
+
+# ==================== 해시 ====================
+def _data_hash(df):
+    h = hashlib.sha256()
+    h.update(','.join(map(str, df.columns)).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def chart_hash(spec, dpi):
+    """입력 데이터 + 옵션 + 그리는 함수 코드 + 해상도"""
+    renderer = RENDERERS[spec['kind']]
+    payload = json.dumps(
+        {
+            'kind': spec['kind'],
+            'size': list(spec.get('size', DEFAULT_SIZE)),
+            'params': spec.get('params', {}),
+            'dpi': dpi,
+            'code': hashlib.sha256(inspect.getsource(renderer).encode('utf-8')).hexdigest(),
+            'data': _data_hash(spec['data']),
+        },
+        sort_keys=True, default=str, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ==================== 작업 프로세스 ====================
+_figure = None
+
+
+def _init_worker(font_family):
+    """작업 프로세스 시작 시 한 번: Agg 백엔드, 한글 폰트"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.rcParams['font.family'] = font_family
+    plt.rcParams['axes.unicode_minus'] = False
+
+
+def _render(spec, out_path, dpi):
+    """Figure를 새로 만들지 않고 비운 뒤 다시 그림"""
+    global _figure
+    from matplotlib.figure import Figure
+    if _figure is None:
+        _figure = Figure()
+    fig = _figure
+    fig.clf()
+    fig.set_size_inches(*spec.get('size', DEFAULT_SIZE))
+    ax = fig.add_subplot()
+    RENDERERS[spec['kind']](ax, spec['data'], **spec.get('params', {}))
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=dpi)
+    return out_path
+
+
+def render_charts(specs, out_dir='.', workers=None, dpi=300, fmt='png', force=False,
+                  font_family='Malgun Gothic'):
+    """
+    스펙 목록을 그려서 out_dir에 저장
+    - force=False면 해시가 같고 파일이 있는 차트는 건너뜀
+    반환값: {차트 이름: '생성' / '건너뜀' / '실패: ...'}
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8')) if manifest_path.exists() else {}
+
+    status = {}
+    todo = []
+    for spec in specs:
+        if spec['kind'] not in RENDERERS:
+            raise KeyError(f"알 수 없는 차트 종류: {spec['kind']} ({list(RENDERERS)})")
+        out_path = out_dir / f"{spec['name']}.{fmt}"
+        digest = chart_hash(spec, dpi)
+        if not force and manifest.get(spec['name']) == digest and out_path.exists():
+            status[spec['name']] = '건너뜀'
+        else:
+            todo.append((spec, out_path, digest))
+
+    if todo:
+        workers = workers or min(len(todo), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(font_family,)) as executor:
+            futures = {executor.submit(_render, spec, out_path, dpi): (spec['name'], digest)
+                       for spec, out_path, digest in todo}
+            for future in as_completed(futures):
+                name, digest = futures[future]
+                try:
+                    future.result()
+                    manifest[name] = digest
+                    status[name] = '생성'
+                except Exception as e:
+                    manifest.pop(name, None)
+                    status[name] = f'실패: {e}'
+
+        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    made = sum(1 for s in status.values() if s == '생성')
+    skipped = sum(1 for s in status.values() if s == '건너뜀')
+    print(f"✅ 차트 {made}개 생성, {skipped}개 변경 없음 (전체 {len(specs)}개)")
+    for name, s in status.items():
+        if s.startswith('실패'):
+            print(f"❌ {name}: {s}")
+    return status
@@ -3,119 +3,228 @@
 Folium 지도 + Matplotlib 차트 생성
 
 이 파일은 참고용 샘플입니다. 본인 프로젝트 폴더에 복사해서 사용하세요.
+
+차트는 chart_jobs.py의 스펙 목록으로 선언하고 한 번에 그립니다.
+(프로세스 풀 병렬, 데이터가 바뀌지 않은 차트는 다시 그리지 않음)
+
+실행:
+    python gangwon_energy_analysis.py              # 바뀐 차트만
+    python gangwon_energy_analysis.py --force      # 전부 다시
+    python gangwon_energy_analysis.py --out report --workers 4
 """
 
+import argparse
+from pathlib import Path
+
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import folium
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+import map_layers
+from chart_jobs import render_charts
+
+# 원본 자료 위치 (없으면 해당 차트는 건너뜀)
+DATA_DIR = Path(__file__).resolve().parents[2] / '01_DataAnalysis'
+YEARLY_XLSX = DATA_DIR / 'docs' / '강원도_지역별_재생에너지_발전량.xlsx'
+POLICY_DIR = DATA_DIR / 'data' / 'policy'
+
+SOURCES = ['태양광(GWh)', '풍력(GWh)', '수력(GWh)']
+SOURCE_COLORS = ['#FFB800', '#00C4FF', '#0066FF']
+YEARLY_SOURCES = ['태양광', '풍력', '수력', '바이오']
 
-print("="*60)
-print("강원도 신재생 에너지 현황 분석")
-print("="*60)
 
 # ==================== 데이터 준비 ====================
-region_data = {
-    '지역': ['춘천시', '원주시', '강릉시', '동해시', '태백시', '속초시', 
-            '삼척시', '홍천군', '횡성군', '영월군', '평창군', '정선군',
-            '철원군', '화천군', '양구군', '인제군', '고성군', '양양군'],
-    '태양광(GWh)': [145.2, 198.7, 176.4, 89.3, 67.8, 92.1, 
-                   134.5, 156.8, 112.3, 98.7, 87.4, 76.5,
-                   145.3, 89.6, 67.8, 54.3, 98.5, 87.9],
-    '풍력(GWh)': [23.5, 15.2, 145.8, 78.5, 198.3, 56.4,
-                 167.9, 34.2, 21.5, 45.3, 189.6, 123.7,
-                 67.8, 34.5, 45.6, 56.7, 89.3, 112.5],
-    '수력(GWh)': [89.3, 34.1, 12.3, 5.2, 15.7, 8.9,
-                 45.6, 123.4, 67.8, 89.2, 56.3, 145.8,
-                 23.4, 234.7, 78.9, 156.8, 12.4, 23.6],
-    '위도': [37.8813, 37.3422, 37.7519, 37.5247, 37.1640, 38.2070,
-            37.4500, 37.6974, 37.4828, 37.1836, 37.3709, 37.3807,
-            38.1467, 38.1063, 38.1098, 38.0695, 38.3806, 38.0750],
-    '경도': [127.7298, 127.9202, 128.8760, 129.1143, 128.9856, 128.5918,
-            129.1658, 127.8895, 127.9844, 128.4614, 128.3906, 128.6686,
-            127.3136, 127.7084, 127.9897, 128.1706, 128.4692, 128.6190]
-}
-
-df = pd.DataFrame(region_data)
-df['총발전량(GWh)'] = df['태양광(GWh)'] + df['풍력(GWh)'] + df['수력(GWh)']
-
-print("\n✅ 데이터 로드 완료")
-print(df.head())
-
-# ==================== 차트 생성 ====================
-print("\n[차트 생성 중...]")
-
-# 1. 시군별 총 발전량
-fig, ax = plt.subplots(figsize=(14, 6))
-df_sorted = df.sort_values('총발전량(GWh)', ascending=False)
-ax.bar(df_sorted['지역'], df_sorted['총발전량(GWh)'], color='#4CAF50')
-ax.set_xlabel('지역', fontsize=12, fontweight='bold')
-ax.set_ylabel('총 발전량 (GWh)', fontsize=12, fontweight='bold')
-ax.set_title('강원도 시군별 총 발전량', fontsize=16, fontweight='bold')
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig('./chart1_total.png', dpi=300, bbox_inches='tight')
-print("✅ chart1_total.png 저장")
-
-# 2. 에너지원별 스택 바
-fig, ax = plt.subplots(figsize=(14, 6))
-x = range(len(df))
-ax.bar(x, df['태양광(GWh)'], label='태양광', color='#FFB800')
-ax.bar(x, df['풍력(GWh)'], bottom=df['태양광(GWh)'], label='풍력', color='#00C4FF')
-ax.bar(x, df['수력(GWh)'], bottom=df['태양광(GWh)']+df['풍력(GWh)'], label='수력', color='#0066FF')
-ax.set_xticks(x)
-ax.set_xticklabels(df['지역'], rotation=45, ha='right')
-ax.set_ylabel('발전량 (GWh)')
-ax.set_title('에너지원별 발전량')
-ax.legend()
-plt.tight_layout()
-plt.savefig('./chart2_stack.png', dpi=300, bbox_inches='tight')
-print("✅ chart2_stack.png 저장")
-
-plt.close('all')
+def load_sample_data():
+    region_data = {
+        '지역': ['춘천시', '원주시', '강릉시', '동해시', '태백시', '속초시',
+                '삼척시', '홍천군', '횡성군', '영월군', '평창군', '정선군',
+                '철원군', '화천군', '양구군', '인제군', '고성군', '양양군'],
+        '태양광(GWh)': [145.2, 198.7, 176.4, 89.3, 67.8, 92.1,
+                       134.5, 156.8, 112.3, 98.7, 87.4, 76.5,
+                       145.3, 89.6, 67.8, 54.3, 98.5, 87.9],
+        '풍력(GWh)': [23.5, 15.2, 145.8, 78.5, 198.3, 56.4,
+                     167.9, 34.2, 21.5, 45.3, 189.6, 123.7,
+                     67.8, 34.5, 45.6, 56.7, 89.3, 112.5],
+        '수력(GWh)': [89.3, 34.1, 12.3, 5.2, 15.7, 8.9,
+                     45.6, 123.4, 67.8, 89.2, 56.3, 145.8,
+                     23.4, 234.7, 78.9, 156.8, 12.4, 23.6],
+    }
+    df = pd.DataFrame(region_data)
+    coords = df['지역'].map(map_layers.REGION_COORDS)
+    df['위도'] = coords.str[0]
+    df['경도'] = coords.str[1]
+    df['총발전량(GWh)'] = df[SOURCES].sum(axis=1)
+    return df
+
+
+def load_yearly_data(path=YEARLY_XLSX):
+    """강원도 기초지자체별 연도별 발전량 (쉼표/'-' 표기 정리)"""
+    df = pd.read_excel(path, sheet_name='Sheet1')
+    df['연도'] = pd.to_numeric(df['연도'], errors='coerce')
+    for col in ['재생에너지 합계'] + YEARLY_SOURCES:
+        df[col] = pd.to_numeric(
+            df[col].astype(str).str.replace(',', '', regex=False), errors='coerce'
+        ).fillna(0)
+    return df
+
+
+# ==================== 차트 스펙 ====================
+def sample_chart_specs(df):
+    """1. 시군별 총 발전량, 2. 에너지원별 스택 바, 3~. 에너지원별 순위"""
+    specs = [
+        {
+            'name': 'chart1_total', 'kind': 'bar', 'size': (14, 6),
+            'data': df[['지역', '총발전량(GWh)']],
+            'params': {'x': '지역', 'y': '총발전량(GWh)', 'sort': True, 'color': '#4CAF50',
+                       'title': '강원도 시군별 총 발전량', 'xlabel': '지역', 'ylabel': '총 발전량 (GWh)'},
+        },
+        {
+            'name': 'chart2_stack', 'kind': 'stacked_bar', 'size': (14, 6),
+            'data': df[['지역'] + SOURCES],
+            'params': {'x': '지역', 'columns': SOURCES, 'colors': SOURCE_COLORS,
+                       'labels': ['태양광', '풍력', '수력'],
+                       'title': '에너지원별 발전량', 'ylabel': '발전량 (GWh)'},
+        },
+    ]
+    for col, color in zip(SOURCES, SOURCE_COLORS):
+        name = col.split('(')[0]
+        specs.append({
+            'name': f'chart_rank_{name}', 'kind': 'bar', 'size': (14, 6),
+            'data': df[['지역', col]],
+            'params': {'x': '지역', 'y': col, 'sort': True, 'color': color,
+                       'title': f'강원도 시군별 {name} 발전량', 'xlabel': '지역', 'ylabel': '발전량 (GWh)'},
+        })
+    return specs
+
+
+def yearly_chart_specs(df):
+    """연도별 추이 + 연도마다 시군별 스택 바 + 시군마다 연도별 추이"""
+    yearly = df.groupby('연도', as_index=False)[['재생에너지 합계'] + YEARLY_SOURCES].sum()
+    specs = [
+        {
+            'name': 'yearly_total', 'kind': 'line', 'size': (8, 5),
+            'data': yearly[['연도', '재생에너지 합계']],
+            'params': {'x': '연도', 'y': '재생에너지 합계', 'title': '강원도 연도별 재생에너지 발전량 합계',
+                       'xlabel': '연도', 'ylabel': '재생에너지 발전량(MWh)'},
+        },
+        {
+            'name': 'yearly_sources', 'kind': 'stacked_bar', 'size': (10, 6),
+            'data': yearly[['연도'] + YEARLY_SOURCES],
+            'params': {'x': '연도', 'columns': YEARLY_SOURCES, 'rotation': 0,
+                       'title': '강원도 주요 에너지원별 발전량 추이', 'ylabel': '발전량(MWh)'},
+        },
+    ]
+    for year, part in df.groupby('연도'):
+        specs.append({
+            'name': f'stack_{year}', 'kind': 'stacked_bar', 'size': (14, 6),
+            'data': part[['기초지자체'] + YEARLY_SOURCES].reset_index(drop=True),
+            'params': {'x': '기초지자체', 'columns': YEARLY_SOURCES,
+                       'title': f'{year}년 시군별 에너지원별 발전량', 'ylabel': '발전량(MWh)'},
+        })
+    for region, part in df.groupby('기초지자체'):
+        specs.append({
+            'name': f'trend_{region}', 'kind': 'line', 'size': (8, 5),
+            'data': part[['연도'] + YEARLY_SOURCES].sort_values('연도').reset_index(drop=True),
+            'params': {'x': '연도', 'y': YEARLY_SOURCES, 'title': f'{region} 에너지원별 발전량 추이',
+                       'xlabel': '연도', 'ylabel': '발전량(MWh)'},
+        })
+    return specs
+
+
+def re100_chart_specs(policy_dir=POLICY_DIR):
+    """re100_graph.ipynb의 RE100 차트 (기업별 달성률, 산업별 평균, 가입 추이, 국가 비교)"""
+    companies = pd.read_csv(policy_dir / 'k_re100_companies_all.csv', encoding='utf-8-sig')
+    companies['RE100 달성률'] = (
+        companies['RE100 목표/달성률'].str.extract(r'\((\d+)%\)')[0].astype(float)
+    )
+    achieved = companies.dropna(subset=['RE100 달성률'])
+    industry = (
+        achieved.groupby('사업영역', as_index=False)['RE100 달성률'].mean()
+        .sort_values('RE100 달성률', ascending=False)
+    )
+    joined = companies['가입연도'].value_counts().sort_index().rename_axis('가입연도').reset_index(name='기업 수')
+    countries = pd.read_csv(policy_dir / 'RE100_국가별_비교_한국포함.csv', encoding='utf-8-sig')
+
+    return [
+        {
+            'name': 're100_achievement_by_company', 'kind': 'bar', 'size': (14, 6),
+            'data': achieved[['기업명', 'RE100 달성률']],
+            'params': {'x': '기업명', 'y': 'RE100 달성률', 'sort': True, 'color': 'skyblue',
+                       'value_labels': True, 'title': '기업별 RE100 달성률',
+                       'ylabel': '달성률 (%)'},
+        },
+        {
+            'name': 're100_industry_avg', 'kind': 'bar', 'size': (10, 6),
+            'data': industry,
+            'params': {'x': '사업영역', 'y': 'RE100 달성률', 'color': 'lightgreen',
+                       'title': '산업별 평균 RE100 달성률 (2023 기준)', 'ylabel': '평균 달성률 (%)'},
+        },
+        {
+            'name': 're100_join_trend', 'kind': 'count_trend', 'size': (10, 6),
+            'data': joined,
+            'params': {'x': '가입연도', 'y': '기업 수', 'title': '연도별 RE100 가입 기업 수',
+                       'xlabel': '가입연도', 'ylabel': '기업 수'},
+        },
+        {
+            'name': 're100_country_compare', 'kind': 'hbar_highlight', 'size': (12, 6),
+            'data': countries,
+            'params': {'label': '국가', 'value': '재생에너지 사용률(%)', 'highlight': '한국',
+                       'unit': '%', 'xlim': (0, 100), 'title': '국가별 RE100 평균 재생에너지 사용률 비교',
+                       'xlabel': '재생에너지 사용률 (%)'},
+        },
+    ]
+
 
 # ==================== Folium 지도 생성 ====================
-print("\n[Folium 지도 생성 중...]")
+def build_map(df, path='./gangwon_map.html'):
+    """시군별 마커 지도 (map_layers: 컬럼 단위 처리, 공용 팝업 템플릿)"""
+    m = map_layers.build_map(df, cluster=False)
+    m.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강원도 신재생 에너지 차트/지도 생성")
+    parser.add_argument('--out', default='.', help="저장 폴더")
+    parser.add_argument('--workers', type=int, default=None, help="차트 그리는 프로세스 수")
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--force', action='store_true', help="바뀌지 않은 차트도 다시 그림")
+    args = parser.parse_args()
+    out = Path(args.out)
+
+    print("="*60)
+    print("강원도 신재생 에너지 현황 분석")
+    print("="*60)
+
+    df = load_sample_data()
+    print("\n✅ 데이터 로드 완료")
+    print(df.head())
+
+    specs = sample_chart_specs(df)
+    if YEARLY_XLSX.exists():
+        specs += yearly_chart_specs(load_yearly_data())
+    else:
+        print(f"⚠️ 연도별 자료 없음, 건너뜀: {YEARLY_XLSX}")
+    if (POLICY_DIR / 'k_re100_companies_all.csv').exists():
+        specs += re100_chart_specs()
+    else:
+        print(f"⚠️ RE100 자료 없음, 건너뜀: {POLICY_DIR}")
 
-m = folium.Map(location=[37.8228, 128.1555], zoom_start=9)
+    # ==================== 차트 생성 ====================
+    print(f"\n[차트 생성 중... {len(specs)}개]")
+    status = render_charts(specs, out, workers=args.workers, dpi=args.dpi, force=args.force)
 
-for idx, row in df.iterrows():
-    if row['총발전량(GWh)'] > 300:
-        color = 'red'
-    elif row['총발전량(GWh)'] > 200:
-        color = 'orange'
-    else:
-        color = 'green'
-    
-    popup_html = f"""
-    <div style="font-family: Malgun Gothic; width: 200px;">
-        <h4>{row['지역']}</h4>
-        <p>🔆 태양광: {row['태양광(GWh)']} GWh</p>
-        <p>💨 풍력: {row['풍력(GWh)']} GWh</p>
-        <p>💧 수력: {row['수력(GWh)']} GWh</p>
-        <p><b>⚡ 총: {row['총발전량(GWh)']:.1f} GWh</b></p>
-    </div>
-    """
-    
-    folium.Marker(
-        location=[row['위도'], row['경도']],
-        popup=folium.Popup(popup_html, max_width=250),
-        tooltip=row['지역'],
-        icon=folium.Icon(color=color, icon='bolt', prefix='fa')
-    ).add_to(m)
-
-m.save('./gangwon_map.html')
-print("✅ gangwon_map.html 저장")
-
-print("\n" + "="*60)
-print("✅ 모든 작업 완료!")
-print("="*60)
-print("\n생성된 파일:")
-print("  - chart1_total.png")
-print("  - chart2_stack.png")
-print("  - gangwon_map.html")
+    # ==================== Folium 지도 생성 ====================
+    print("\n[Folium 지도 생성 중...]")
+    build_map(df, str(out / 'gangwon_map.html'))
+    print("✅ gangwon_map.html 저장")
+
+    print("\n" + "="*60)
+    print("✅ 모든 작업 완료!")
+    print("="*60)
+    print("\n생성된 파일:")
+    for name, s in status.items():
+        print(f"  - {name}.png ({s})")
+    print("  - gangwon_map.html")
+
+
+if __name__ == '__main__':
+    main()
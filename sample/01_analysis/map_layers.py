@@ -0,0 +1,129 @@
+"""
+Folium 지도 생성기 (마커 수천 개용)
+- iterrows + 마커마다 f-string 팝업 대신, 컬럼 전체를 한 번에 배열로 만들어 넣음
+- 팝업 HTML 템플릿은 지도에 JS 함수 하나로만 들어감 (마커마다 HTML을 복사하지 않음)
+- FastMarkerCluster: 브라우저에서 마커를 만들고 가까운 마커는 묶어서 표시
+- year 컬럼을 주면 한 번의 정렬로 연도별 레이어를 나눠 만들고 레이어 선택 버튼 추가
+
+사용 예:
+    from map_layers import build_map
+    m = build_map(df)                                   # 시군 18개 (묶지 않음)
+    m = build_map(plants_df, name='발전소명', year='연도')  # 발전소 단위, 연도별 레이어
+    m.save('gangwon_map.html')
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import folium
+from folium.plugins import FastMarkerCluster
+
+CENTER = [37.8228, 128.1555]  # 강원도 중심
+
+# 시군 위치 (위도, 경도) — 시군 단위 지도/샘플 데이터에서 같이 씀
+REGION_COORDS = {
+    '춘천시': (37.8813, 127.7298), '원주시': (37.3422, 127.9202), '강릉시': (37.7519, 128.8760),
+    '동해시': (37.5247, 129.1143), '태백시': (37.1640, 128.9856), '속초시': (38.2070, 128.5918),
+    '삼척시': (37.4500, 129.1658), '홍천군': (37.6974, 127.8895), '횡성군': (37.4828, 127.9844),
+    '영월군': (37.1836, 128.4614), '평창군': (37.3709, 128.3906), '정선군': (37.3807, 128.6686),
+    '철원군': (38.1467, 127.3136), '화천군': (38.1063, 127.7084), '양구군': (38.1098, 127.9897),
+    '인제군': (38.0695, 128.1706), '고성군': (38.3806, 128.4692), '양양군': (38.0750, 128.6190),
+}
+
+# (컬럼, 팝업 표시 이름, 단위)
+POPUP_FIELDS = [
+    ('태양광(GWh)', '🔆 태양광', 'GWh'),
+    ('풍력(GWh)', '💨 풍력', 'GWh'),
+    ('수력(GWh)', '💧 수력', 'GWh'),
+]
+
+# 총량 구간별 마커 색 (200 이하 초록, 300 이하 주황, 그 위 빨강)
+COLOR_BINS = (200, 300)
+COLORS = ('green', 'orange', 'red')
+
+# 행 배열 [위도, 경도, 이름, 색, 총량, 값1, 값2, ...] → 마커
+# 지도마다 한 번만 들어가고 모든 레이어가 같이 씀
+_MARKER_JS = """
+var {func} = (function () {{
+    var fields = {fields};
+    var totalLabel = {total_label};
+    return function (row) {{
+        var html = '<div style="font-family: Malgun Gothic; width: 200px;"><h4>' + row[2] + '</h4>';
+        for (var i = 0; i < fields.length; i++) {{
+            html += '<p>' + fields[i][0] + ': ' + row[5 + i] + ' ' + fields[i][1] + '</p>';
+        }}
+        html += '<p><b>' + totalLabel + ': ' + row[4] + '</b></p></div>';
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {{
+            icon: L.AwesomeMarkers.icon({{icon: 'bolt', prefix: 'fa', markerColor: row[3]}})
+        }});
+        marker.bindPopup(html, {{maxWidth: 250}});
+        marker.bindTooltip(String(row[2]));
+        return marker;
+    }};
+}})();
+"""
+
+
+def marker_colors(values, bins=COLOR_BINS, colors=COLORS):
+    """총량 → 마커 색 (구간 경계값은 아래 구간에 포함)"""
+    idx = np.searchsorted(np.asarray(bins), np.asarray(values, dtype=float), side='left')
+    return np.asarray(colors, dtype=object)[idx]
+
+
+def marker_rows(df, name='지역', lat='위도', lon='경도', fields=POPUP_FIELDS,
+                total='총발전량(GWh)', decimals=1):
+    """DataFrame → 마커 행 배열 (컬럼 단위로 계산, 소수점 decimals자리로 줄여 HTML 크기 절약)"""
+    value_cols = [f[0] for f in fields]
+    totals = df[total] if total in df else df[value_cols].sum(axis=1)
+    values = df[value_cols].round(decimals).to_numpy(dtype=object)
+    head = np.column_stack([
+        df[lat].round(5).to_numpy(dtype=object),
+        df[lon].round(5).to_numpy(dtype=object),
+        df[name].astype(str).to_numpy(dtype=object),
+        marker_colors(totals),
+        totals.round(decimals).to_numpy(dtype=object),
+    ])
+    return np.hstack([head, values])
+
+
+def build_map(df, name='지역', lat='위도', lon='경도', fields=POPUP_FIELDS,
+              total='총발전량(GWh)', year=None, cluster=True, center=CENTER,
+              zoom_start=9, decimals=1, total_label='⚡ 총'):
+    """
+    마커 지도 만들기
+    year: 연도 컬럼 이름 (주면 연도별 레이어, 가장 최근 연도만 켜진 상태)
+    cluster: False면 마커를 묶지 않음 (시군 단위처럼 마커가 적을 때)
+    """
+    m = folium.Map(location=center, zoom_start=zoom_start)
+    func = f'marker_{m.get_name()}'
+    unit = fields[0][2] if fields else ''
+    m.get_root().script.add_child(folium.Element(_MARKER_JS.format(
+        func=func,
+        fields=json.dumps([[label, unit_] for _, label, unit_ in fields], ensure_ascii=False),
+        total_label=json.dumps(f'{total_label} ({unit})' if unit else total_label, ensure_ascii=False),
+    )))
+
+    rows = marker_rows(df, name, lat, lon, fields, total, decimals)
+    # 좌표가 없는 행은 제외
+    ok = pd.notna(rows[:, 0].astype(float)) & pd.notna(rows[:, 1].astype(float))
+    options = {} if cluster else {'disableClusteringAtZoom': 1}
+
+    if year is None:
+        FastMarkerCluster(rows[ok].tolist(), callback=func, **options).add_to(m)
+        return m
+
+    # 연도별 레이어: 한 번 정렬해서 연도 경계마다 잘라냄
+    years = df[year].to_numpy()[ok]
+    rows = rows[ok]
+    order = np.argsort(years, kind='stable')
+    years, rows = years[order], rows[order]
+    uniques, starts = np.unique(years, return_index=True)
+    bounds = list(starts[1:]) + [len(rows)]
+    for i, (y, start, end) in enumerate(zip(uniques, starts, bounds)):
+        FastMarkerCluster(
+            rows[start:end].tolist(), callback=func, name=f'{y}년',
+            show=(i == len(uniques) - 1), **options,
+        ).add_to(m)
+    folium.LayerControl(collapsed=False).add_to(m)
+    return m
@@ -18,8 +18,22 @@ URLS = {
 CONFIG = {
     'HEADLESS': True,           # 백그라운드 실행
     'WAIT_TIME': 3,             # 페이지 로딩 대기 (초)
+    'ELEMENT_TIMEOUT': 10,      # 요소 대기 최대 시간 (초)
     'MAX_PAGES': 5,             # 최대 페이지 수
 }
+CRAWLER_CONFIG = CONFIG         # page_ready가 찾는 이름
+
+# ==================== 페이지 로딩 완료 조건 ====================
+# ../sample_chart,web/page_ready.py 의 wait_until_ready 에서 사용
+PAGE_READY = {
+    'DEFAULT': [
+        {'type': 'document'},
+        {'type': 'network_idle', 'idle': 0.5},
+    ],
+    'DATA_GO_KR': [
+        {'type': 'selector', 'value': '#header-query'},  # 검색창
+    ],
+}
 
 # ==================== 강원도 지역 ====================
 REGIONS = [
@@ -5,13 +5,21 @@ Selenium + BeautifulSoup 사용
 이 파일은 참고용 샘플입니다.
 """
 
+import sys
+from pathlib import Path
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
+
+from crawler_config import CONFIG
+
+# 공용 대기 엔진 (설정은 이 폴더의 crawler_config.PAGE_READY 사용)
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'sample_chart,web'))
+from page_ready import wait_until_ready, WAIT_LOG
 
 print("="*60)
 print("웹 크롤링 샘플")
@@ -46,7 +54,9 @@ def example_crawl():
     try:
         url = "https://www.data.go.kr/index.do"
         driver.get(url)
-        time.sleep(3)
+        
+        # 고정 대기(time.sleep) 대신 검색창이 나타나는 즉시 진행 (대기 시간은 WAIT_LOG에 기록)
+        wait_until_ready(driver, 'DATA_GO_KR')
         
         # 페이지 제목 가져오기
         soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -69,6 +79,7 @@ def example_crawl():
 # ==================== 실행 ====================
 try:
     example_crawl()
+    WAIT_LOG.report()
     
     print("\n" + "="*60)
     print("✅ 크롤링 완료!")
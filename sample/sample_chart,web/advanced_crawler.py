@@ -7,40 +7,103 @@
 """
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue, Empty
+
+from page_ready import wait_until_ready, WAIT_LOG
+from http_fetch import fetch_html, http_get, host_limit, stream_download
+from crawler_config import CRAWLER_CONFIG, API_KEYS
+from kma_api import collect_asos_daily, collect_asos_incremental
+from crawl_state import upsert_dataset
+from request_policy import get_policy
+from table_extract import parse_tables
+from text_clean import clean_frame, clean_value
+
+
+def create_chrome_driver(headless=True):
+    """Chrome 웹드라이버 생성 (크롤러/병렬 워커 공용)"""
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument(f'user-agent={get_policy().next_user_agent()}')
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    return webdriver.Chrome(
+        service=Service(ChromeDriverManager().install()),
+        options=chrome_options
+    )
+
 
 class AdvancedCrawler:
     """고급 크롤링 클래스"""
     
-    def __init__(self, headless=True):
-        """초기화"""
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
-        
+    def __init__(self, headless=True, lazy=False):
+        """
+        초기화
+        - lazy=True: 브라우저가 필요한 페이지를 처음 만날 때 Chrome 실행
+          (정적 페이지만 수집하면 Chrome을 띄우지 않음)
+        """
+        self.headless = headless
+        self._driver = None
+        if not lazy:
+            self._start_driver()
+    
+    def _start_driver(self):
         try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
+            self._driver = create_chrome_driver(self.headless)
             print("✅ 크롤러 초기화 완료")
         except Exception as e:
             print(f"❌ 크롤러 초기화 실패: {e}")
             raise
+        return self._driver
+    
+    @property
+    def driver(self):
+        """Selenium 드라이버 (lazy 모드에서는 첫 접근 시 생성)"""
+        if self._driver is None:
+            self._start_driver()
+        return self._driver
+    
+    def fetch_html(self, url, site='DEFAULT'):
+        """
+        페이지 HTML 가져오기
+        - 정적 페이지는 공유 HTTP 세션으로 바로 수집
+        - JS 렌더링 페이지만 Selenium 사용 (crawler_config.JS_RENDERED)
+        """
+        return fetch_html(url, site, driver=lambda: self.driver)
+    
+    def wait_for_page(self, site='DEFAULT', conditions=None, driver=None):
+        """페이지 로딩 완료 조건(crawler_config.PAGE_READY)을 만족할 때까지 대기"""
+        return wait_until_ready(driver or self.driver, site, conditions)
+    
+    def load_page(self, url, site='DEFAULT', driver=None):
+        """
+        브라우저로 페이지 열고 HTML 반환
+        - 요청 정책(재시도/속도 제한/서킷 브레이커) 적용
+        - 로딩 완료 조건을 못 채우면 실패로 보고 재시도
+        - 호스트별 동시 요청 슬롯은 시도 한 번 동안만 잡음 (재시도 대기 중에는 놓아줌)
+        """
+        driver = driver or self.driver
+        
+        def open_page():
+            with host_limit(url):
+                driver.get(url)
+                if not self.wait_for_page(site, driver=driver):
+                    raise TimeoutException(f"페이지 준비 시간 초과: {url}")
+                return driver.page_source
+        
+        return get_policy().call(url, open_page)
     
     def wait_for_element(self, by, value, timeout=10):
         """요소가 로드될 때까지 대기"""
@@ -60,129 +123,232 @@ class AdvancedCrawler:
         while True:
             # 페이지 끝까지 스크롤
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(pause_time)
-            
-            # 새로운 높이 계산
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
             
-            if new_height == last_height:
+            # 새 콘텐츠가 붙어 높이가 바뀌는 즉시 진행, pause_time 동안 변화 없으면 끝
+            try:
+                WebDriverWait(self.driver, pause_time, poll_frequency=0.2).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") != last_height
+                )
+            except TimeoutException:
                 break
-            last_height = new_height
+            last_height = self.driver.execute_script("return document.body.scrollHeight")
         
         print("✅ 페이지 끝까지 스크롤 완료")
     
-    def crawl_with_pagination(self, base_url, max_pages=5):
+    @staticmethod
+    def parse_page_items(html):
+        """
+        목록 페이지 HTML에서 항목 추출 (순차/병렬 크롤링 공용)
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        items = soup.find_all('div', class_='data-item')  # 실제 클래스명으로 수정
+        
+        page_data = []
+        for item in items:
+            try:
+                # 데이터 추출 (예시)
+                title = item.find('h3').text.strip()
+                value = item.find('span', class_='value').text.strip()
+                page_data.append({'제목': title, '값': value})
+            except:
+                continue
+        
+        return page_data
+    
+    def crawl_with_pagination(self, base_url, max_pages=5, site='PAGINATION'):
         """
         페이지네이션이 있는 사이트 크롤링
+        - site: 페이지 로딩 완료 조건 (crawler_config.PAGE_READY 키)
+        - 실패한 페이지는 재시도 후 건너뛰고 계속 진행 (결과의 attrs['failed_pages'])
         """
         all_data = []
+        failed_pages = []
         
         for page in range(1, max_pages + 1):
             try:
                 url = f"{base_url}?page={page}"
-                self.driver.get(url)
-                time.sleep(2)
-                
                 print(f"📄 페이지 {page} 크롤링 중...")
                 
                 # 데이터 추출 로직
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                items = soup.find_all('div', class_='data-item')  # 실제 클래스명으로 수정
-                
-                page_data = []
-                for item in items:
-                    try:
-                        # 데이터 추출 (예시)
-                        title = item.find('h3').text.strip()
-                        value = item.find('span', class_='value').text.strip()
-                        page_data.append({'제목': title, '값': value})
-                    except:
-                        continue
+                page_data = self.parse_page_items(self.load_page(url, site))
                 
                 all_data.extend(page_data)
                 print(f"   ✅ {len(page_data)}개 항목 수집")
                 
             except Exception as e:
                 print(f"   ❌ 페이지 {page} 크롤링 실패: {e}")
-                break
+                failed_pages.append(page)
+        
+        df = pd.DataFrame(all_data)
+        df.attrs['failed_pages'] = failed_pages
+        return df
+    
+    def crawl_with_pagination_concurrent(self, base_url, max_pages=5, workers=4,
+                                         per_host=None, use_browser=True, site='PAGINATION'):
+        """
+        페이지네이션 병렬 크롤링
+        - workers: 동시에 띄울 브라우저(또는 HTTP 워커) 수
+        - per_host: 이 호출에서 동시에 보내는 요청 수 상한 (워커 수를 줄임)
+                    호스트 전체 상한은 HOST_CONCURRENCY / PER_HOST_LIMIT (http_fetch.host_limit)
+        - use_browser=False: 정적 페이지는 Chrome 없이 requests로 수집
+        결과는 페이지 순서대로 합쳐 crawl_with_pagination과 같은 형태로 반환
+        """
+        if per_host:
+            workers = min(workers, per_host)
         
-        return pd.DataFrame(all_data)
+        # 브라우저 풀: 워커 수만큼만 생성해서 재사용 (첫 드라이버는 self.driver)
+        pool = Queue()
+        created = []
+        if use_browser:
+            pool.put(self.driver)
+        pool_lock = threading.Lock()
+        
+        def acquire_driver():
+            try:
+                return pool.get_nowait()
+            except Empty:
+                pass
+            with pool_lock:
+                if len(created) + 1 < workers:
+                    driver = create_chrome_driver(self.headless)
+                    created.append(driver)
+                    return driver
+            return pool.get()
+        
+        def fetch_page(page):
+            url = f"{base_url}?page={page}"
+            if not use_browser:
+                # http_get이 호스트별 동시 요청 제한을 적용
+                return self.parse_page_items(http_get(url).text)
+            
+            # load_page가 시도마다 호스트 슬롯을 잡음
+            driver = acquire_driver()
+            try:
+                return self.parse_page_items(self.load_page(url, site, driver=driver))
+            finally:
+                pool.put(driver)
+        
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(fetch_page, page): page
+                           for page in range(1, max_pages + 1)}
+                for future in as_completed(futures):
+                    page = futures[future]
+                    try:
+                        results[page] = future.result()
+                        print(f"📄 페이지 {page}: ✅ {len(results[page])}개 항목 수집")
+                    except Exception as e:
+                        print(f"📄 페이지 {page}: ❌ 크롤링 실패: {e}")
+        finally:
+            for driver in created:
+                driver.quit()
+        
+        # 순차 크롤링과 동일하게 실패 페이지는 건너뛰고 페이지 순서대로 합침
+        all_data = []
+        failed_pages = []
+        for page in range(1, max_pages + 1):
+            if page not in results:
+                failed_pages.append(page)
+                continue
+            all_data.extend(results[page])
+        
+        df = pd.DataFrame(all_data)
+        df.attrs['failed_pages'] = failed_pages
+        return df
     
-    def extract_table_data(self, table_selector='table'):
+    def extract_table_data(self, table_selector='table', html=None, index=0,
+                           multi_header=False, numeric=True, exclude=()):
         """
-        HTML 테이블 데이터 추출
+        HTML 테이블 데이터 추출 (table_extract: lxml 한 번 파싱, rowspan/colspan, 여러 줄 헤더)
+        - html: 이미 받아 둔 HTML (없으면 현재 브라우저 페이지 사용)
+        - table_selector: CSS(table, #id, .class) 또는 XPath
+        - index: 몇 번째 테이블 (None이면 선택된 테이블 전부를 리스트로)
+        - numeric: 숫자 컬럼 자동 변환 (쉼표, '-', 단위)
+        - exclude: 숫자로 바꾸지 않을 컬럼 (지점번호 등 코드 컬럼)
         """
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            tables = soup.find_all(table_selector)
+            if html is None:
+                html = self.driver.page_source
+            tables = parse_tables(html, table_selector, multi_header=multi_header,
+                                  numeric=numeric, exclude=exclude)
             
             if not tables:
                 print("⚠️ 테이블을 찾을 수 없습니다")
-                return pd.DataFrame()
-            
-            # 첫 번째 테이블 추출
-            table = tables[0]
-            
-            # 헤더 추출
-            headers = []
-            thead = table.find('thead')
-            if thead:
-                headers = [th.text.strip() for th in thead.find_all('th')]
+                return [] if index is None else pd.DataFrame()
             
-            # 데이터 추출
-            rows = []
-            tbody = table.find('tbody') or table
-            for tr in tbody.find_all('tr'):
-                row = [td.text.strip() for td in tr.find_all(['td', 'th'])]
-                if row:
-                    rows.append(row)
-            
-            # DataFrame 생성
-            if headers:
-                df = pd.DataFrame(rows, columns=headers)
-            else:
-                df = pd.DataFrame(rows)
+            if index is None:
+                print(f"✅ 테이블 {len(tables)}개, 총 {sum(len(t) for t in tables)}행 추출")
+                return tables
             
+            df = tables[index]
             print(f"✅ 테이블 데이터 {len(df)}행 추출")
             return df
             
         except Exception as e:
             print(f"❌ 테이블 추출 실패: {e}")
-            return pd.DataFrame()
+            return [] if index is None else pd.DataFrame()
     
-    def download_file(self, download_url, save_path):
+    def download_file(self, download_url, save_path, expected_size=None, sha256=None):
         """
-        파일 다운로드
+        파일 다운로드 (스트리밍 저장, 실패 시 받은 곳부터 이어받기)
+        - expected_size / sha256: 완료 후 크기·체크섬 검증 (선택)
+        - 재시도 횟수는 요청 정책(CRAWLER_CONFIG['MAX_RETRIES'])을 따름
         """
         try:
-            import requests
-            response = requests.get(download_url, timeout=30)
-            response.raise_for_status()
-            
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"✅ 파일 다운로드 완료: {save_path}")
+            size = stream_download(download_url, save_path,
+                                   expected_size=expected_size, sha256=sha256)
+            print(f"✅ 파일 다운로드 완료: {save_path} ({size:,} bytes)")
             return True
         except Exception as e:
             print(f"❌ 파일 다운로드 실패: {e}")
             return False
     
-    def clean_text(self, text):
+    def download_many(self, manifest, workers=None):
         """
-        텍스트 정제 (공백, 특수문자 제거)
+        여러 파일 병렬 다운로드
+        - manifest: [{'url': ..., 'path': ..., 'size': (선택), 'sha256': (선택)}, ...]
+                    또는 같은 컬럼을 가진 DataFrame
+        - workers: 동시 다운로드 수 (기본값: CRAWLER_CONFIG['DOWNLOAD_WORKERS'])
+        반환값: 파일별 성공 여부 DataFrame
         """
-        if not text:
-            return ""
+        if isinstance(manifest, pd.DataFrame):
+            manifest = manifest.to_dict('records')
+        workers = workers or CRAWLER_CONFIG['DOWNLOAD_WORKERS']
         
-        # 다중 공백을 단일 공백으로
-        text = re.sub(r'\s+', ' ', text)
-        # 앞뒤 공백 제거
-        text = text.strip()
-        # 특정 특수문자 제거 (필요에 따라 수정)
-        text = re.sub(r'[^\w\s가-힣.,()%-]', '', text)
+        def run(item):
+            size = item.get('size')
+            sha256 = item.get('sha256')
+            return self.download_file(
+                item['url'], item['path'],
+                expected_size=int(size) if pd.notna(size) else None,
+                sha256=sha256 if pd.notna(sha256) else None,
+            )
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run, manifest))
         
-        return text
+        df = pd.DataFrame({
+            'url': [item['url'] for item in manifest],
+            'path': [item['path'] for item in manifest],
+            '성공': results,
+        })
+        print(f"📦 다운로드 {int(df['성공'].sum())}/{len(df)}개 완료")
+        return df
+    
+    def clean_text(self, text):
+        """
+        텍스트 정제 (공백, 특수문자 제거)
+        """
+        return clean_value(text)
+    
+    def clean_dataframe(self, df, numeric=True, exclude=()):
+        """
+        DataFrame 정제 (문자열 컬럼만, 서로 다른 값만 한 번씩 정제)
+        - numeric: 1,234 / 12.5% 같은 컬럼은 float로 변환
+        - exclude: 숫자로 바꾸지 않을 컬럼 (지점번호 등 코드 컬럼)
+        """
+        return clean_frame(df, numeric=numeric, exclude=exclude)
     
     def validate_data(self, df):
         """
@@ -217,8 +383,9 @@ class AdvancedCrawler:
     
     def close(self):
         """브라우저 종료"""
-        if self.driver:
-            self.driver.quit()
+        if self._driver:
+            self._driver.quit()
+            self._driver = None
             print("✅ 크롤러 종료")
 
 # ==================== 특정 사이트 크롤링 함수들 ====================
@@ -231,15 +398,14 @@ def crawl_kosis_data(crawler):
     
     try:
         url = "https://kosis.kr/statHtml/statHtml.do?orgId=388&tblId=DT_388N_0001"
-        crawler.driver.get(url)
-        time.sleep(3)
+        html = crawler.fetch_html(url, 'KOSIS')
         
         # 테이블 데이터 추출
-        df = crawler.extract_table_data()
+        df = crawler.extract_table_data(html=html)
         
         if not df.empty:
             # 데이터 정제
-            df = df.applymap(crawler.clean_text)
+            df = crawler.clean_dataframe(df)
             print(f"✅ KOSIS 데이터 {len(df)}행 수집")
             return df
         
@@ -248,49 +414,26 @@ def crawl_kosis_data(crawler):
     
     return pd.DataFrame()
 
-def crawl_weather_api_data():
+def crawl_weather_api_data(start='20240101', end='20241231', stations=None, out_path=None):
     """
     기상청 API를 사용한 데이터 수집 (API 키 필요)
+    - stations: 지점번호 목록 (기본값: 강원도 전체 관측지점)
+    - out_path: 주면 지난 수집 이후 구간만 받아서 이 파일에 누적 (증분 수집)
+    - 페이지/지점/기간 분할 수집은 kma_api.collect_asos_daily 참고
     """
     print("\n[기상청 API] 데이터 수집...")
     
-    # API 키가 필요합니다
-    API_KEY = "YOUR_API_KEY_HERE"
-    
-    if API_KEY == "YOUR_API_KEY_HERE":
+    # API 키가 필요합니다 (crawler_config.API_KEYS)
+    if API_KEYS['WEATHER_API_KEY'].startswith('YOUR_'):
         print("⚠️ 기상청 API 키를 설정해주세요")
         print("   발급: https://data.kma.go.kr/api/selectApiList.do")
         return pd.DataFrame()
     
     try:
-        import requests
-        
-        # 예시: 특정 지점의 일별 데이터
-        url = "http://apis.data.go.kr/1360000/AsosDalyInfoService/getWthrDataList"
-        
-        params = {
-            'serviceKey': API_KEY,
-            'numOfRows': 100,
-            'pageNo': 1,
-            'dataCd': 'ASOS',
-            'dateCd': 'DAY',
-            'startDt': '20240101',
-            'endDt': '20241231',
-            'stnIds': '101',  # 춘천
-            'dataType': 'JSON'
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # JSON 데이터를 DataFrame으로 변환
-        items = data.get('response', {}).get('body', {}).get('items', {}).get('item', [])
-        df = pd.DataFrame(items)
-        
-        print(f"✅ 기상청 API 데이터 {len(df)}행 수집")
-        return df
+        if out_path:
+            return collect_asos_incremental(end, out_path, stations=stations,
+                                            first_start=start)
+        return collect_asos_daily(start, end, stations=stations)
         
     except Exception as e:
         print(f"❌ 기상청 API 수집 실패: {e}")
@@ -302,22 +445,22 @@ if __name__ == "__main__":
     print("고급 웹 크롤링 실행")
     print("="*60)
     
-    # 크롤러 초기화
-    crawler = AdvancedCrawler(headless=True)
+    # 크롤러 초기화 (브라우저는 필요할 때만 실행)
+    crawler = AdvancedCrawler(headless=True, lazy=True)
     
     try:
         # 1. KOSIS 데이터
         df_kosis = crawl_kosis_data(crawler)
         if not df_kosis.empty:
             crawler.validate_data(df_kosis)
-            df_kosis.to_csv('C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/kosis_data.csv', 
-                           index=False, encoding='utf-8-sig')
+            upsert_dataset(df_kosis, 'C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/kosis_data.csv')
         
-        # 2. 기상청 API 데이터
-        df_weather = crawl_weather_api_data()
-        if not df_weather.empty:
-            df_weather.to_csv('C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/weather_api_data.csv',
-                             index=False, encoding='utf-8-sig')
+        # 2. 기상청 API 데이터 (지난 수집 이후 ~ 어제까지만 받아서 누적)
+        yesterday = (pd.Timestamp.today() - pd.Timedelta(days=1)).strftime('%Y%m%d')
+        crawl_weather_api_data(
+            start='20200101', end=yesterday,
+            out_path='C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/weather_api_data.csv'
+        )
         
         print("\n" + "="*60)
         print("✅ 고급 크롤링 완료!")
@@ -327,4 +470,5 @@ if __name__ == "__main__":
         print(f"\n❌ 오류 발생: {e}")
     
     finally:
+        WAIT_LOG.report()
         crawler.close()
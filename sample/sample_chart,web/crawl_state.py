@@ -0,0 +1,113 @@
+"""
+증분 크롤링 상태 저장소
+- 출처(source) × 지역(region)별로 마지막으로 수집한 시점(워터마크)을 SQLite에 기록
+- 다음 실행은 워터마크 이후 구간만 수집
+- 기존 데이터 파일에는 덮어쓰지 않고 키 기준으로 추가/갱신(upsert)
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from crawler_config import CRAWLER_CONFIG
+
+
+class CrawlState:
+    """워터마크 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or CRAWLER_CONFIG['STATE_DB']
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS watermarks (
+                source TEXT,
+                region TEXT,
+                watermark TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (source, region)
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, source, region='ALL', default=None):
+        """마지막 수집 시점 (없으면 default)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark FROM watermarks WHERE source = ? AND region = ?",
+                (source, str(region))
+            ).fetchone()
+        return row[0] if row else default
+
+    def set(self, source, region, watermark):
+        """워터마크 갱신 (이전 값보다 뒤일 때만)"""
+        current = self.get(source, region)
+        if current is not None and str(watermark) <= current:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)",
+                (source, str(region), str(watermark),
+                 datetime.now().isoformat(timespec='seconds'))
+            )
+            self._conn.commit()
+
+    def to_frame(self):
+        """저장된 워터마크 전체"""
+        with self._lock:
+            return pd.read_sql_query(
+                "SELECT * FROM watermarks ORDER BY source, region", self._conn
+            )
+
+    def close(self):
+        self._conn.close()
+
+
+# ==================== 기존 데이터에 추가/갱신 ====================
+def _read_any(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.parquet':
+        return pd.read_parquet(path)
+    if ext in ('.xlsx', '.xls'):
+        return pd.read_excel(path)
+    if ext == '.json':
+        return pd.read_json(path, orient='records')
+    return pd.read_csv(path, encoding='utf-8-sig')
+
+def _write_any(df, path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.parquet':
+        df.to_parquet(path, index=False)
+    elif ext in ('.xlsx', '.xls'):
+        df.to_excel(path, index=False, engine='openpyxl')
+    elif ext == '.json':
+        df.to_json(path, orient='records', force_ascii=False, indent=2)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+def upsert_dataset(df, path, keys=None):
+    """
+    기존 파일에 새 데이터를 합쳐 저장 (같은 키는 새 값으로 교체)
+    - keys: 행을 구분하는 컬럼 목록 (None이면 완전히 같은 행만 중복 제거)
+    반환값: 저장된 전체 행 수
+    """
+    if os.path.exists(path):
+        old = _read_any(path)
+        if keys:
+            # 키 컬럼 타입을 맞춰야 같은 행으로 인식됨
+            for col in keys:
+                if col in old.columns and col in df.columns:
+                    old[col] = old[col].astype(df[col].dtype)
+        merged = pd.concat([old, df], ignore_index=True)
+        merged = merged.drop_duplicates(subset=keys, keep='last')
+        if keys:
+            merged = merged.sort_values(keys, ignore_index=True)
+    else:
+        merged = df
+
+    _write_any(merged, path)
+    print(f"✅ {path}: 신규 {len(df):,}행 반영, 전체 {len(merged):,}행")
+    return len(merged)
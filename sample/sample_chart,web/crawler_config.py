@@ -35,6 +35,77 @@ URLS = {
     'INVEST_GANGWON': 'https://www.investkorea.org/gwn-kr/index.do',
 }
 
+# ==================== 호스트별 초당 요청 수 ====================
+# request_policy 토큰 버킷 (RATE_BURST만큼은 한 번에 보낼 수 있음)
+HOST_RATE_LIMITS = {
+    'DEFAULT': 2,
+    'apis.data.go.kr': 5,  # 기상청 ASOS API
+    'www.data.go.kr': 2,
+    'kosis.kr': 2,
+    'data.kma.go.kr': 2,
+    'www.knrec.or.kr': 1,
+}
+
+# ==================== 호스트별 동시 요청 수 ====================
+# http_fetch.host_limit 세마포어 크기 (여기 없는 호스트는 CRAWLER_CONFIG['PER_HOST_LIMIT'])
+# 호스트마다 하나의 상한을 모든 크롤러/워커가 함께 씀
+HOST_CONCURRENCY = {
+    'apis.data.go.kr': 4,  # 기상청 ASOS API (KMA_API['WORKERS']와 맞춤)
+}
+
+# ==================== 응답 캐시 유효기간 (초) ====================
+# http_fetch.cached_get 에서 사용 (키는 URLS / PAGE_READY와 동일)
+# 유효기간 안에서는 요청 없이 캐시 사용, 지나면 ETag/Last-Modified로 재검증
+CACHE_TTL = {
+    'DEFAULT': 60 * 60,  # 1시간
+    'DATA_GO_KR': 6 * 60 * 60,
+    'KOSIS': 24 * 60 * 60,  # 통계표는 하루 단위로 갱신
+    'WEATHER': 24 * 60 * 60,
+    'WEATHER_API': 7 * 24 * 60 * 60,  # 지난 기간 관측값은 바뀌지 않음
+    'ENERGY': 24 * 60 * 60,
+    'GANGWON': 6 * 60 * 60,
+}
+
+# ==================== 페이지 로딩 완료 조건 ====================
+# page_ready.wait_until_ready 에서 사용 (고정 time.sleep 대신 조건 충족 즉시 진행)
+# type: document(readyState), selector(요소 존재), network_idle(요청 멈춤), rows_stable(행 개수 고정)
+PAGE_READY = {
+    'DEFAULT': [
+        {'type': 'document'},
+        {'type': 'network_idle', 'idle': 0.5},
+    ],
+    'DATA_GO_KR': [
+        {'type': 'selector', 'value': '#header-query'},
+    ],
+    'DATA_GO_KR_SEARCH': [
+        {'type': 'document'},
+        {'type': 'rows_stable', 'value': 'div.result-item', 'checks': 3},
+    ],
+    'KOSIS': [
+        {'type': 'selector', 'value': 'table'},
+        {'type': 'rows_stable', 'value': 'table tbody tr', 'checks': 3},
+    ],
+    'WEATHER': [
+        # 통계표가 그려지고 행 수가 멈출 때까지 (title은 head를 읽자마자 있어서 대기가 안 됨)
+        {'type': 'selector', 'value': 'table'},
+        {'type': 'rows_stable', 'value': 'table tbody tr', 'checks': 3},
+    ],
+    'ENERGY': [
+        {'type': 'document'},
+        {'type': 'selector', 'value': 'a[href]'},
+    ],
+    'PAGINATION': [
+        {'type': 'document'},
+        {'type': 'rows_stable', 'value': 'div.data-item', 'checks': 3, 'min_rows': 0},
+    ],
+}
+
+# JS로 그려져서 requests만으로는 데이터가 없는 페이지 (항상 Selenium 사용)
+JS_RENDERED = [
+    'DATA_GO_KR',
+    'DATA_GO_KR_SEARCH',
+]
+
 # ==================== 크롤링 설정 ====================
 CRAWLER_CONFIG = {
     # 브라우저 설정
@@ -49,9 +120,31 @@ CRAWLER_CONFIG = {
     # 페이지네이션
     'MAX_PAGES': 5,  # 최대 크롤링 페이지 수
     
+    # HTTP 수집 (브라우저 없이)
+    'HTTP_TIMEOUT': 10,  # 요청 타임아웃 (초)
+    'PER_HOST_LIMIT': 2,  # 호스트별 동시 요청/연결 수 (기본값, 호스트별 값은 HOST_CONCURRENCY)
+    
+    # 파일 다운로드
+    'DOWNLOAD_CHUNK_SIZE': 1024 * 1024,  # 스트리밍 청크 크기 (bytes)
+    'DOWNLOAD_WORKERS': 4,  # 병렬 다운로드 수
+    
+    # 응답 캐시 (유효기간은 CACHE_TTL)
+    'CACHE_ENABLED': True,
+    'CACHE_DIR': './http_cache',
+    'CACHE_MAX_MB': 500,  # 초과 시 오래 안 쓴 항목부터 삭제
+    
+    # 증분 크롤링 (출처/지역별 마지막 수집 시점)
+    'STATE_DB': './crawl_state.sqlite',
+    
     # 재시도 설정
     'MAX_RETRIES': 3,  # 최대 재시도 횟수
-    'RETRY_DELAY': 5,  # 재시도 간격 (초)
+    'RETRY_DELAY': 5,  # 재시도 간격 (초, 재시도마다 2배 + 무작위 지터)
+    'RETRY_MAX_DELAY': 60,  # 재시도 간격 상한 (초)
+    
+    # 속도 제한 / 서킷 브레이커 (호스트별 초당 요청 수는 HOST_RATE_LIMITS)
+    'RATE_BURST': 5,  # 한 번에 몰아서 보낼 수 있는 요청 수
+    'CIRCUIT_FAILURES': 5,  # 연속 실패가 이만큼 쌓이면 해당 호스트 요청 중단
+    'CIRCUIT_RESET': 60,  # 중단 후 다시 시도하기까지 대기 (초)
 }
 
 # ==================== 데이터 저장 설정 ====================
@@ -81,6 +174,24 @@ GANGWON_REGIONS = [
     '철원군', '화천군', '양구군', '인제군', '고성군', '양양군'
 ]
 
+# 시군별 기상청 ASOS 관측지점 번호 (지점이 없는 시군은 가장 가까운 지점 사용)
+GANGWON_STATIONS = {
+    '춘천시': 101, '원주시': 114, '강릉시': 105, '동해시': 106,
+    '태백시': 216, '속초시': 90, '삼척시': 106, '홍천군': 212,
+    '횡성군': 114, '영월군': 121, '평창군': 100, '정선군': 217,
+    '철원군': 95, '화천군': 93, '양구군': 211, '인제군': 211,
+    '고성군': 90, '양양군': 90,
+}
+
+# ==================== 기상청 ASOS API ====================
+KMA_API = {
+    'DAILY_URL': 'http://apis.data.go.kr/1360000/AsosDalyInfoService/getWthrDataList',
+    'ROWS_PER_PAGE': 999,  # 페이지당 최대 행 수
+    'CHUNK_DAYS': 366,  # 긴 기간은 이 단위로 나눠서 요청
+    'WORKERS': 4,  # 동시 요청 수
+    'FIRST_START': '20200101',  # 증분 수집 시 처음 수집하는 지점의 시작일
+}
+
 # ==================== 에너지원 목록 ====================
 ENERGY_TYPES = [
     '태양광', '풍력', '수력', '바이오', '연료전지', '지열'
@@ -7,15 +7,15 @@
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
-import requests
-import json
+
+from page_ready import wait_until_ready, WAIT_LOG
+from http_fetch import cached_get
+from crawl_state import upsert_dataset
+from request_policy import get_policy
 
 print("="*60)
 print("강원도 신재생 에너지 데이터 크롤링")
@@ -28,7 +28,7 @@ chrome_options.add_argument('--headless')  # 백그라운드 실행
 chrome_options.add_argument('--no-sandbox')
 chrome_options.add_argument('--disable-dev-shm-usage')
 chrome_options.add_argument('--disable-gpu')
-chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+chrome_options.add_argument(f'user-agent={get_policy().next_user_agent()}')  # USER_AGENTS 순환
 
 print("\n[1] 웹드라이버 초기화 중...")
 
@@ -56,7 +56,7 @@ def crawl_public_data():
     try:
         url = "https://www.data.go.kr/index.do"
         driver.get(url)
-        time.sleep(3)
+        wait_until_ready(driver, 'DATA_GO_KR')
         
         # 검색창 찾기
         search_box = driver.find_element(By.ID, "header-query")
@@ -66,7 +66,7 @@ def crawl_public_data():
         # 검색 버튼 클릭
         search_btn = driver.find_element(By.CSS_SELECTOR, "button.btn-search")
         search_btn.click()
-        time.sleep(3)
+        wait_until_ready(driver, 'DATA_GO_KR_SEARCH')
         
         # 결과 페이지 파싱
         soup = BeautifulSoup(driver.page_source, 'html.parser')
@@ -108,7 +108,7 @@ def crawl_weather_data():
         # 기상자료개방포털
         url = "https://data.kma.go.kr/climate/RankState/selectRankStatisticsDivisionList.do?pgmNo=179"
         driver.get(url)
-        time.sleep(3)
+        wait_until_ready(driver, 'WEATHER')
         
         soup = BeautifulSoup(driver.page_source, 'html.parser')
         
@@ -147,7 +147,7 @@ def crawl_energy_data():
     try:
         url = "https://www.knrec.or.kr/biz/statistics/stts/list.do"
         driver.get(url)
-        time.sleep(3)
+        wait_until_ready(driver, 'ENERGY')
         
         soup = BeautifulSoup(driver.page_source, 'html.parser')
         
@@ -187,11 +187,8 @@ def crawl_simple_page(url, keyword):
     print(f"\n[5] BeautifulSoup으로 '{keyword}' 검색 중...")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        # 공유 세션(keep-alive) + 응답 캐시 사용, 브라우저 불필요
+        response = cached_get(url, source='GANGWON')
         
         soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -210,23 +207,19 @@ def crawl_simple_page(url, keyword):
         return None
 
 # ==================== 5. 데이터 저장 ====================
-def save_data(df, filename, file_format='csv'):
+def save_data(df, filename, file_format='csv', keys=None):
     """
     수집한 데이터를 파일로 저장
+    - 기존 파일이 있으면 덮어쓰지 않고 합침 (keys가 같은 행은 새 값으로 교체)
     """
+    ext = {'csv': 'csv', 'excel': 'xlsx', 'json': 'json'}.get(file_format)
+    if ext is None:
+        print(f"❌ 지원하지 않는 형식: {file_format}")
+        return
+    
     try:
-        if file_format == 'csv':
-            df.to_csv(f'C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/{filename}.csv', 
-                     index=False, encoding='utf-8-sig')
-            print(f"✅ 저장 완료: {filename}.csv")
-        elif file_format == 'excel':
-            df.to_excel(f'C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/{filename}.xlsx', 
-                       index=False, engine='openpyxl')
-            print(f"✅ 저장 완료: {filename}.xlsx")
-        elif file_format == 'json':
-            df.to_json(f'C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/{filename}.json', 
-                      orient='records', force_ascii=False, indent=2)
-            print(f"✅ 저장 완료: {filename}.json")
+        upsert_dataset(df, f'C:/Users/dkreh/Desktop/KDT_RE_5th/3_Project/{filename}.{ext}', keys=keys)
+        print(f"✅ 저장 완료: {filename}.{ext}")
     except Exception as e:
         print(f"❌ 저장 실패: {e}")
 
@@ -236,17 +229,17 @@ if __name__ == "__main__":
         # 1. 공공데이터 포털
         df_datasets = crawl_public_data()
         if not df_datasets.empty:
-            save_data(df_datasets, 'datasets_list', 'csv')
+            save_data(df_datasets, 'datasets_list', 'csv', keys=['제목'])
         
         # 2. 기상청 데이터
         df_weather = crawl_weather_data()
         if not df_weather.empty:
-            save_data(df_weather, 'weather_data', 'csv')
+            save_data(df_weather, 'weather_data', 'csv', keys=['지역'])
         
         # 3. 한국에너지공단
         df_energy = crawl_energy_data()
         if not df_energy.empty:
-            save_data(df_energy, 'energy_data', 'csv')
+            save_data(df_energy, 'energy_data', 'csv', keys=['연도'])
         
         # 4. 강원도청 페이지 크롤링 (BeautifulSoup)
         gangwon_url = "https://state.gwd.go.kr/portal"
@@ -262,12 +255,14 @@ if __name__ == "__main__":
         print("\n💡 Tip:")
         print("   - 실제 데이터 수집을 위해서는 API 키가 필요할 수 있습니다")
         print("   - 웹사이트 구조가 변경되면 코드 수정이 필요합니다")
-        print("   - 크롤링 간격(time.sleep)을 적절히 조절하세요")
+        print("   - 페이지 대기 조건은 crawler_config.PAGE_READY에서 조절하세요")
         
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
     
     finally:
+        WAIT_LOG.report()
+        
         # 브라우저 종료
         driver.quit()
         print("\n✅ 웹드라이버 종료")
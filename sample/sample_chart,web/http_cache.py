@@ -0,0 +1,203 @@
+"""
+HTTP 응답 디스크 캐시
+- URL + 파라미터 기준으로 응답 본문 저장
+- ETag / Last-Modified 저장 → 조건부 요청(304)으로 재검증
+- 출처별 유효기간(crawler_config.CACHE_TTL) 안에서는 네트워크 요청 없음
+- 전체 용량 초과 시 오래 안 쓴 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from crawler_config import CRAWLER_CONFIG, CACHE_TTL
+
+
+class CachedResponse:
+    """캐시에서 꺼낸 응답 (requests.Response와 같은 방식으로 사용)"""
+
+    def __init__(self, url, content, status_code=200, headers=None,
+                 encoding=None, from_cache=True):
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = encoding or 'utf-8'
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        pass
+
+
+class ResponseCache:
+    """응답 본문은 파일로, 메타데이터는 SQLite 인덱스로 관리"""
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or CRAWLER_CONFIG['CACHE_DIR']
+        self.max_bytes = max_bytes or CRAWLER_CONFIG['CACHE_MAX_MB'] * 1024 * 1024
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, 'index.sqlite'), check_same_thread=False
+        )
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                source TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                encoding TEXT,
+                size INTEGER,
+                fetched_at REAL,
+                last_access REAL
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url, params=None):
+        """URL + 정렬된 파라미터 → 캐시 키"""
+        items = sorted((params or {}).items())
+        raw = url + '?' + '&'.join(f'{k}={v}' for k, v in items)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.body')
+
+    def lookup(self, key):
+        """메타데이터 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, encoding, fetched_at, source, url "
+                "FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or not os.path.exists(self._body_path(key)):
+            return None
+        names = ['etag', 'last_modified', 'content_type', 'encoding', 'fetched_at', 'source', 'url']
+        return dict(zip(names, row))
+
+    def is_fresh(self, entry, source='DEFAULT'):
+        """출처별 유효기간 안이면 True (재검증 없이 사용)"""
+        ttl = CACHE_TTL.get(source, CACHE_TTL['DEFAULT'])
+        return time.time() - entry['fetched_at'] < ttl
+
+    def load(self, key, entry):
+        """저장된 본문을 응답 객체로 반환 (접근 시간 갱신)"""
+        with open(self._body_path(key), 'rb') as f:
+            content = f.read()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        headers = {'Content-Type': entry['content_type'] or ''}
+        return CachedResponse(entry['url'], content, headers=headers,
+                              encoding=entry['encoding'])
+
+    def touch(self, key):
+        """304 응답: 본문은 그대로, 유효기간만 갱신"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET fetched_at = ?, last_access = ? WHERE key = ?",
+                (now, now, key)
+            )
+            self._conn.commit()
+
+    def store(self, key, url, content, source='DEFAULT', etag=None,
+              last_modified=None, content_type=None, encoding=None):
+        """본문 저장 후 용량 초과분 정리"""
+        path = self._body_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, source, etag, last_modified, content_type, encoding,
+                 len(content), now, now)
+            )
+            self._conn.commit()
+        self.evict()
+
+    def remove(self, key):
+        """항목 하나 삭제 (내용 검사에 실패한 응답 등)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+        try:
+            os.remove(self._body_path(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        """전체 용량이 max_bytes 이하가 될 때까지 오래 안 쓴 항목 삭제"""
+        with self._lock:
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            removed = []
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                removed.append(key)
+                total -= size
+            self._conn.executemany("DELETE FROM entries WHERE key = ?",
+                                   [(key,) for key in removed])
+            self._conn.commit()
+
+        for key in removed:
+            try:
+                os.remove(self._body_path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self, source=None):
+        """캐시 비우기 (source를 주면 해당 출처만)"""
+        with self._lock:
+            if source is None:
+                keys = [r[0] for r in self._conn.execute("SELECT key FROM entries")]
+            else:
+                keys = [r[0] for r in self._conn.execute(
+                    "SELECT key FROM entries WHERE source = ?", (source,))]
+            self._conn.executemany("DELETE FROM entries WHERE key = ?",
+                                   [(key,) for key in keys])
+            self._conn.commit()
+        for key in keys:
+            try:
+                os.remove(self._body_path(key))
+            except FileNotFoundError:
+                pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """공유 캐시 (최초 호출 시 생성)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -0,0 +1,279 @@
+"""
+브라우저 없는 HTTP 고속 수집
+- keep-alive 세션(연결 풀) 하나를 모든 크롤러가 공유 (스레드 안전)
+- 호스트별 동시 요청 수 제한
+- 정적 페이지는 requests로, JS 렌더링 페이지만 Selenium으로 전환
+- 응답 디스크 캐시 + 조건부 요청 (http_cache)
+- 재시도/속도 제한/서킷 브레이커/User-Agent 순환 (request_policy)
+"""
+
+import hashlib
+import os
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+from crawler_config import CRAWLER_CONFIG, HOST_CONCURRENCY, PAGE_READY, JS_RENDERED
+from page_ready import wait_until_ready
+from http_cache import get_cache
+from request_policy import get_policy
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+# ==================== 공유 세션 ====================
+def get_session():
+    """연결 풀을 가진 공유 세션 (최초 호출 시 생성)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            adapter = HTTPAdapter(
+                pool_connections=16,  # 풀을 유지할 호스트 수
+                # 호스트별 연결 수 = 가장 큰 호스트 동시 요청 수 (HOST_CONCURRENCY)
+                pool_maxsize=max(CRAWLER_CONFIG['PER_HOST_LIMIT'], *HOST_CONCURRENCY.values()),
+                pool_block=True,
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+def host_concurrency(host):
+    """호스트의 동시 요청 수 상한 (HOST_CONCURRENCY, 없으면 PER_HOST_LIMIT)"""
+    return HOST_CONCURRENCY.get(host, CRAWLER_CONFIG['PER_HOST_LIMIT'])
+
+def host_limit(url):
+    """
+    호스트별 동시 요청 수를 제한하는 세마포어 (프로세스 내 공유)
+    - 호스트마다 하나, 크기는 host_concurrency(호스트)
+    - 재시도 대기 중에는 잡고 있지 않도록 요청 한 번(시도 한 번)마다 잡을 것
+    """
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(host_concurrency(host))
+        return _host_semaphores[host]
+
+def http_get(url, params=None, timeout=None, headers=None, validate=None, **kwargs):
+    """
+    공유 세션으로 GET 요청
+    - 호스트별 동시 요청 제한 + 요청 정책(재시도/속도 제한/서킷 브레이커) 적용
+    - validate: 응답 내용 검사 함수 (HTTP 200으로 오류를 돌려주는 API용)
+                예외를 내면 정책에 따라 재시도 (예외의 retryable 속성 참고)
+    """
+    policy = get_policy()
+    headers = dict(headers or {})
+    headers.setdefault('User-Agent', policy.next_user_agent())
+
+    def send():
+        with host_limit(url):
+            response = get_session().get(
+                url, params=params, headers=headers,
+                timeout=timeout or CRAWLER_CONFIG['HTTP_TIMEOUT'],
+                **kwargs
+            )
+        response.raise_for_status()
+        if validate is not None:
+            validate(response)
+        return response
+
+    return policy.call(url, send)
+
+def cached_get(url, params=None, source='DEFAULT', timeout=None, validate=None):
+    """
+    캐시를 거치는 GET 요청
+    - 유효기간(CACHE_TTL[source]) 안: 네트워크 요청 없이 캐시 반환
+    - 유효기간 지남: ETag/Last-Modified로 조건부 요청, 304면 캐시 재사용
+    - validate: 응답 내용 검사 (통과한 응답만 캐시, 검사에 실패한 캐시 항목은 삭제 후 다시 요청)
+    """
+    if not CRAWLER_CONFIG['CACHE_ENABLED']:
+        return http_get(url, params=params, timeout=timeout, validate=validate)
+
+    cache = get_cache()
+    key = cache.make_key(url, params)
+    entry = cache.lookup(key)
+    if entry and validate is not None:
+        try:
+            validate(cache.load(key, entry))
+        except Exception:
+            # 예전에 저장된 오류 응답은 버리고 새로 받음
+            cache.remove(key)
+            entry = None
+    if entry and cache.is_fresh(entry, source):
+        return cache.load(key, entry)
+
+    headers = {}
+    if entry and entry['etag']:
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry['last_modified']:
+        headers['If-Modified-Since'] = entry['last_modified']
+
+    response = http_get(url, params=params, timeout=timeout, headers=headers,
+                        validate=validate)
+    if response.status_code == 304 and entry:
+        cache.touch(key)
+        return cache.load(key, entry)
+
+    cache.store(
+        key, url, response.content, source,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+        content_type=response.headers.get('Content-Type'),
+        encoding=response.encoding,
+    )
+    return response
+
+
+# ==================== 정적/동적 페이지 판별 ====================
+def needs_browser(site, html):
+    """
+    정적 HTML만으로 부족한지 판단
+    - JS_RENDERED에 등록된 사이트
+    - PAGE_READY의 selector 조건이 정적 HTML에 없는 경우
+    """
+    if site in JS_RENDERED:
+        return True
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for cond in PAGE_READY.get(site, []):
+        if cond['type'] == 'selector' and soup.select_one(cond['value']) is None:
+            return True
+    return False
+
+def fetch_html(url, site='DEFAULT', driver=None):
+    """
+    페이지 HTML 가져오기 (HTTP 우선, 필요할 때만 Selenium)
+    - site: crawler_config.PAGE_READY / JS_RENDERED 키
+    - driver: Selenium 드라이버 또는 드라이버를 만들어 주는 함수 (지연 생성용)
+    """
+    if site not in JS_RENDERED:
+        try:
+            html = cached_get(url, source=site).text
+            if not needs_browser(site, html):
+                return html
+            print(f"💡 [{site}] 정적 HTML에 데이터가 없어 브라우저로 전환")
+        except Exception as e:
+            print(f"⚠️ [{site}] HTTP 수집 실패, 브라우저로 전환: {e}")
+
+    if driver is None:
+        raise RuntimeError(f"[{site}] 브라우저가 필요한 페이지입니다: {url}")
+    # 브라우저로 그린 결과도 유효기간 동안 캐시 (조건부 요청은 불가)
+    cache = get_cache() if CRAWLER_CONFIG['CACHE_ENABLED'] else None
+    if cache is not None:
+        key = cache.make_key(url, {'_rendered': site})
+        entry = cache.lookup(key)
+        if entry and cache.is_fresh(entry, site):
+            return cache.load(key, entry).text
+
+    if callable(driver):
+        driver = driver()
+
+    driver.get(url)
+    ready = wait_until_ready(driver, site)
+    html = driver.page_source
+    if not ready:
+        # 덜 그려진 페이지는 캐시하지 않음 (다음 호출에서 다시 시도)
+        print(f"⚠️ [{site}] 페이지 준비 안 됨, 캐시 저장 건너뜀: {url}")
+    elif cache is not None:
+        cache.store(key, url, html.encode('utf-8'), site,
+                    content_type='text/html', encoding='utf-8')
+    return html
+
+
+# ==================== 파일 다운로드 (스트리밍/이어받기) ====================
+def _hash_existing(path, hasher, chunk_size):
+    """이어받기 전에 이미 받은 부분을 해시에 반영"""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            hasher.update(chunk)
+
+def _total_size(response, offset):
+    """응답 헤더로 전체 파일 크기 계산 (모르면 None)"""
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return None  # 압축 전송이면 헤더 크기와 디스크 크기가 다름
+    content_range = response.headers.get('Content-Range')  # bytes 100-199/200
+    if content_range and '/' in content_range:
+        total = content_range.rsplit('/', 1)[1]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get('Content-Length')
+    if length is None:
+        return None
+    return int(length) + (offset if response.status_code == 206 else 0)
+
+def stream_download(url, save_path, expected_size=None, sha256=None,
+                    chunk_size=None, timeout=None):
+    """
+    파일을 청크 단위로 디스크에 바로 기록 (메모리 사용량 일정)
+    - save_path + '.part'가 남아 있으면 Range 요청으로 이어받기
+    - expected_size / sha256이 주어지면 완료 후 검증
+    - 재시도는 요청 정책 한 곳에서만: 실패하면 백오프 후 .part부터 이어받기
+      (대기하는 동안에는 호스트 슬롯을 놓아줌)
+    반환값: 저장된 바이트 수
+    """
+    chunk_size = chunk_size or CRAWLER_CONFIG['DOWNLOAD_CHUNK_SIZE']
+    part_path = save_path + '.part'
+    policy = get_policy()
+
+    def attempt():
+        with host_limit(url):
+            return _download_part(url, part_path, expected_size, sha256, chunk_size,
+                                  timeout, policy.next_user_agent())
+
+    size = policy.call(url, attempt)
+    os.replace(part_path, save_path)
+    return size
+
+def _download_part(url, part_path, expected_size, sha256, chunk_size, timeout, user_agent):
+    """한 번의 시도: .part 이어받기 + 크기/체크섬 검증 (실패 시 예외)"""
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    hasher = hashlib.sha256() if sha256 else None
+    headers = {'User-Agent': user_agent}
+    if offset:
+        headers['Range'] = f'bytes={offset}-'
+
+    with get_session().get(url, headers=headers, stream=True,
+                           timeout=timeout or CRAWLER_CONFIG['HTTP_TIMEOUT']) as response:
+        if response.status_code == 416:
+            # 이미 끝까지 받은 .part 파일
+            total = offset
+            if hasher:
+                _hash_existing(part_path, hasher, chunk_size)
+        else:
+            response.raise_for_status()
+            if offset and response.status_code != 206:
+                # 서버가 Range를 지원하지 않음 → 처음부터
+                offset = 0
+            total = _total_size(response, offset)
+            if hasher and offset:
+                _hash_existing(part_path, hasher, chunk_size)
+
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    if hasher:
+                        hasher.update(chunk)
+
+    size = os.path.getsize(part_path)
+    expected_size = expected_size or total
+    if expected_size is not None and size != expected_size:
+        # 크기가 모자라면 .part를 남겨 두고 다음 시도에서 이어받기
+        if size > expected_size:
+            os.remove(part_path)
+        raise IOError(f"크기 불일치: {size} / {expected_size} bytes")
+    if hasher and hasher.hexdigest() != sha256.lower():
+        os.remove(part_path)
+        raise IOError("SHA-256 체크섬 불일치 (부분 파일 삭제)")
+    return size
@@ -0,0 +1,296 @@
+"""
+기상청 ASOS 일자료 API 수집기
+- 여러 관측지점 × 긴 기간을 한 번에 수집
+- totalCount로 페이지 수를 계산해 모든 페이지 요청 (100행 잘림 방지)
+- 기간은 CHUNK_DAYS 단위로 분할, 지점/기간/페이지를 동시에 요청
+  (초당 요청 수는 request_policy가 HOST_RATE_LIMITS에 맞춰 제한)
+- 결과는 타입이 지정된 하나의 DataFrame 또는 Parquet 파일로 저장
+
+사용 예:
+    python kma_api.py 20200101 20251231 --out asos_gangwon.parquet
+    python kma_api.py 20200101 20251231 --out asos_gangwon.parquet --incremental
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from crawler_config import API_KEYS, GANGWON_STATIONS, KMA_API
+from http_fetch import cached_get
+from crawl_state import CrawlState, upsert_dataset
+
+STATE_SOURCE = 'KMA_ASOS_DAILY'  # 워터마크 저장소의 출처 이름
+
+# HTTP 200으로 오는 오류 중 잠시 후 다시 요청하면 풀릴 수 있는 resultCode
+# (01 애플리케이션 오류, 02 DB 오류, 04 HTTP 오류, 05 서비스 연결 실패, 99 기타)
+# 그 밖의 코드 (인증키/파라미터 오류, 요청 한도 초과 등)는 재시도하지 않음
+RETRY_CODES = {'01', '02', '04', '05', '99'}
+
+# 숫자가 아닌 컬럼 (나머지 관측값은 모두 float32로 변환)
+TEXT_COLUMNS = ['stnNm', 'iscs']
+# 'Hrmt'로 끝나는 컬럼은 발생 시각(HHMI) 문자열
+TIME_SUFFIX = 'Hrmt'
+
+
+# ==================== 요청 단위 계산 ====================
+def _parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), '%Y%m%d').date()
+
+def split_date_range(start, end, chunk_days=None):
+    """[start, end] 기간을 chunk_days 단위 (시작일, 종료일) 목록으로 분할"""
+    chunk_days = chunk_days or KMA_API['CHUNK_DAYS']
+    start, end = _parse_date(start), _parse_date(end)
+
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+        chunks.append((start.strftime('%Y%m%d'), chunk_end.strftime('%Y%m%d')))
+        start = chunk_end + timedelta(days=1)
+    return chunks
+
+def default_stations():
+    """강원도 시군 관측지점 번호 (중복 제거)"""
+    return sorted(set(GANGWON_STATIONS.values()))
+
+
+# ==================== 요청/변환 ====================
+class KmaApiError(RuntimeError):
+    """기상청 API가 HTTP 200으로 돌려준 오류 (retryable: 요청 정책이 재시도할지 여부)"""
+
+    def __init__(self, message, retryable):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def _parse_result(response):
+    """응답 → (resultCode, JSON) / 오류 응답이면 KmaApiError (캐시 전에 요청 정책 안에서 호출됨)"""
+    try:
+        data = response.json()
+    except ValueError:
+        # 인증키 오류 등은 JSON 대신 XML로 옴
+        raise KmaApiError(f"기상청 API 응답 해석 실패: {response.text[:200]}", retryable=False) from None
+    header = data.get('response', {}).get('header', {})
+    code = header.get('resultCode')
+    if code not in ('00', '03'):  # 03: NO_DATA (정상 응답)
+        raise KmaApiError(f"기상청 API 오류 {code}: {header.get('resultMsg')}",
+                          retryable=code in RETRY_CODES)
+    return code, data
+
+def fetch_page(station, start_dt, end_dt, page, api_key, rows=None):
+    """
+    한 페이지 요청
+    반환값: (totalCount, item 목록)
+    """
+    params = {
+        'serviceKey': api_key,
+        'numOfRows': rows or KMA_API['ROWS_PER_PAGE'],
+        'pageNo': page,
+        'dataCd': 'ASOS',
+        'dateCd': 'DAY',
+        'startDt': start_dt,
+        'endDt': end_dt,
+        'stnIds': str(station),
+        'dataType': 'JSON',
+    }
+    response = cached_get(KMA_API['DAILY_URL'], params=params, source='WEATHER_API',
+                          validate=_parse_result)
+    code, data = _parse_result(response)
+    if code == '03':  # NO_DATA
+        return 0, []
+
+    body = data['response']['body']
+    items = body.get('items') or {}
+    items = items.get('item', []) if isinstance(items, dict) else []
+    return int(body.get('totalCount', 0)), items
+
+def to_typed_frame(items):
+    """API item 목록 → 타입 지정 DataFrame (지점번호 int16, 일시 datetime, 관측값 float32)"""
+    df = pd.DataFrame(items)
+    if df.empty:
+        return df
+
+    df['stnId'] = pd.to_numeric(df['stnId'], errors='coerce').astype('int16')
+    df['tm'] = pd.to_datetime(df['tm'], format='%Y-%m-%d')
+    for col in df.columns:
+        if col in ('stnId', 'tm') or col in TEXT_COLUMNS or col.endswith(TIME_SUFFIX):
+            continue
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+    df['stnNm'] = df['stnNm'].astype('category')
+    return df
+
+
+# ==================== 수집기 ====================
+def collect_asos_daily(start, end, stations=None, api_key=None, out_path=None,
+                       rows=None, chunk_days=None, workers=None):
+    """
+    여러 지점의 ASOS 일자료 수집
+    - start, end: 'YYYYMMDD' 또는 date
+    - stations: 지점번호 목록 (기본값: 강원도 전체 GANGWON_STATIONS)
+    - out_path: 주면 결과를 Parquet으로 저장하면서 수집 (메모리에 쌓지 않음)
+    반환값: out_path가 없으면 DataFrame, 있으면 저장한 행 수
+    """
+    api_key = api_key or API_KEYS['WEATHER_API_KEY']
+    stations = stations or default_stations()
+    rows = rows or KMA_API['ROWS_PER_PAGE']
+
+    tasks = [(stn, s, e) for stn in stations
+             for s, e in split_date_range(start, end, chunk_days)]
+    print(f"\n[기상청 API] 지점 {len(stations)}개 × 기간 {len(tasks) // len(stations)}구간 수집...")
+
+    def request(task, page):
+        return fetch_page(*task, page, api_key, rows)
+
+    writer = None
+    columns = None
+    frames = []
+    total_rows = 0
+    failed = []
+
+    def emit(task, pages):
+        """한 구간의 모든 페이지가 모이면 페이지 순서대로 합쳐서 내보냄"""
+        nonlocal writer, columns, total_rows
+        items = [item for page in sorted(pages) for item in pages[page]]
+        df = to_typed_frame(items)
+        if df.empty:
+            return
+        total_rows += len(df)
+        if out_path is None:
+            frames.append(df)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if columns is None:
+            columns = list(df.columns)
+        table = pa.Table.from_pandas(df.reindex(columns=columns), preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(out_path, table.schema)
+        writer.write_table(table.cast(writer.schema))
+
+    # 1단계: 구간별 1페이지 → totalCount로 남은 페이지 추가 요청
+    results = {}  # task -> {page: items}
+    remaining = {}  # task -> 남은 페이지 수
+    try:
+        with ThreadPoolExecutor(max_workers=workers or KMA_API['WORKERS']) as executor:
+            pending = {executor.submit(request, task, 1): (task, 1) for task in tasks}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, page = pending.pop(future)
+                    try:
+                        total, items = future.result()
+                    except Exception as e:
+                        print(f"   ❌ 지점 {task[0]} {task[1]}~{task[2]} {page}페이지 실패: {e}")
+                        failed.append((task, page))
+                        results.pop(task, None)
+                        remaining[task] = -1
+                        continue
+                    if remaining.get(task) == -1:
+                        continue  # 같은 구간의 다른 페이지가 이미 실패
+
+                    results.setdefault(task, {})[page] = items
+                    if page == 1:
+                        pages = max(1, math.ceil(total / rows))
+                        remaining[task] = pages - 1
+                        for p in range(2, pages + 1):
+                            pending[executor.submit(request, task, p)] = (task, p)
+                    else:
+                        remaining[task] -= 1
+
+                    if remaining[task] == 0:
+                        emit(task, results.pop(task))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    print(f"✅ 기상청 API 데이터 {total_rows:,}행 수집 (실패 {len(failed)}건)")
+    if out_path is not None:
+        print(f"✅ 저장 완료: {out_path}")
+        return total_rows
+
+    if not frames:
+        df = pd.DataFrame()
+    else:
+        df = pd.concat(frames, ignore_index=True)
+        df['stnNm'] = df['stnNm'].astype('category')
+        df = df.sort_values(['stnId', 'tm'], ignore_index=True)
+    # 실패 구간 (증분 수집에서 워터마크를 넘기지 않도록 사용)
+    df.attrs['failed'] = [task for task, _ in failed]
+    return df
+
+
+def collect_asos_incremental(end, out_path, stations=None, first_start=None, state=None):
+    """
+    지점별 워터마크 이후 구간만 수집해서 기존 파일에 추가/갱신
+    - 처음 수집하는 지점은 first_start(기본값: KMA_API['FIRST_START'])부터
+    - out_path: 누적 데이터 파일 (.parquet / .csv)
+    반환값: 이번에 새로 수집한 DataFrame
+    """
+    state = state or CrawlState()
+    stations = stations or default_stations()
+    end = _parse_date(end)
+    first_start = _parse_date(first_start or KMA_API['FIRST_START'])
+
+    # 시작일이 같은 지점끼리 묶어서 한 번에 요청
+    groups = {}
+    for stn in stations:
+        watermark = state.get(STATE_SOURCE, stn)
+        start = _parse_date(watermark) + timedelta(days=1) if watermark else first_start
+        if start <= end:
+            groups.setdefault(start, []).append(stn)
+
+    if not groups:
+        print("✅ 모든 지점이 최신 상태입니다")
+        return pd.DataFrame()
+
+    frames = []
+    for start, group in sorted(groups.items()):
+        df = collect_asos_daily(start, end, stations=group)
+        if df.empty:
+            continue
+        upsert_dataset(df, out_path, keys=['stnId', 'tm'])
+        frames.append(df)
+
+        # 실패한 구간이 있으면 그 직전까지만 워터마크 이동
+        failed_start = {}
+        for stn, s, _ in df.attrs.get('failed', []):
+            failed_start[stn] = min(failed_start.get(stn, s), s)
+        for stn, last in df.groupby('stnId', observed=True)['tm'].max().items():
+            last = last.date()
+            if stn in failed_start:
+                last = min(last, _parse_date(failed_start[stn]) - timedelta(days=1))
+            state.set(STATE_SOURCE, stn, last.strftime('%Y%m%d'))
+
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+# ==================== 실행 ====================
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='기상청 ASOS 일자료 일괄 수집')
+    parser.add_argument('start', help='시작일 YYYYMMDD')
+    parser.add_argument('end', help='종료일 YYYYMMDD')
+    parser.add_argument('--stations', nargs='*', type=int,
+                        help='지점번호 (기본값: 강원도 전체)')
+    parser.add_argument('--out', help='저장할 Parquet 파일 경로')
+    parser.add_argument('--incremental', action='store_true',
+                        help='워터마크 이후만 수집해서 --out 파일에 추가')
+    args = parser.parse_args()
+
+    if args.incremental:
+        if args.out is None:
+            parser.error('--incremental에는 --out이 필요합니다')
+        collect_asos_incremental(args.end, args.out, stations=args.stations,
+                                 first_start=args.start)
+    else:
+        result = collect_asos_daily(args.start, args.end, stations=args.stations,
+                                    out_path=args.out)
+        if args.out is None:
+            print(result.head())
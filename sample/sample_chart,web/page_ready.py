@@ -0,0 +1,150 @@
+"""
+페이지 로딩 대기 엔진 (고정 time.sleep 대체)
+- 사이트별 "로딩 완료" 조건을 crawler_config.PAGE_READY에 선언
+- 선택자 존재 / 네트워크 유휴 / 행 개수 안정화 조건 지원
+- 대기 시간 기록 (고정 대기 대비 절약 시간 확인용)
+"""
+
+import threading
+import time
+
+import pandas as pd
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+from crawler_config import CRAWLER_CONFIG, PAGE_READY
+
+POLL_INTERVAL = 0.2  # 조건 확인 간격 (초)
+
+
+# ==================== 조건 함수 ====================
+def _document_ready(cond):
+    """document.readyState == 'complete'"""
+    def check(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+    return check
+
+def _selector_present(cond):
+    """CSS 선택자에 해당하는 요소가 하나 이상 존재"""
+    def check(driver):
+        return len(driver.find_elements(By.CSS_SELECTOR, cond['value'])) > 0
+    return check
+
+def _network_idle(cond):
+    """리소스 요청 수가 idle 초 동안 늘어나지 않음"""
+    idle = cond.get('idle', 0.5)
+    state = {'count': -1, 'since': time.perf_counter()}
+
+    def check(driver):
+        count = driver.execute_script(
+            "return performance.getEntriesByType('resource').length"
+        )
+        now = time.perf_counter()
+        if count != state['count']:
+            state['count'] = count
+            state['since'] = now
+            return False
+        return now - state['since'] >= idle
+    return check
+
+def _rows_stable(cond):
+    """선택자 요소 개수가 checks회 연속 같으면 완료 (min_rows 이상일 때)"""
+    checks = cond.get('checks', 3)
+    min_rows = cond.get('min_rows', 1)
+    state = {'count': -1, 'same': 0}
+
+    def check(driver):
+        count = len(driver.find_elements(By.CSS_SELECTOR, cond['value']))
+        if count == state['count']:
+            state['same'] += 1
+        else:
+            state['count'] = count
+            state['same'] = 0
+        return count >= min_rows and state['same'] >= checks - 1
+    return check
+
+CONDITIONS = {
+    'document': _document_ready,
+    'selector': _selector_present,
+    'network_idle': _network_idle,
+    'rows_stable': _rows_stable,
+}
+
+
+# ==================== 대기 시간 기록 ====================
+class WaitRecorder:
+    """페이지별 실제 대기 시간 기록 (스레드 안전)"""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, site, url, seconds, timed_out):
+        with self._lock:
+            self.records.append({
+                '사이트': site,
+                'URL': url,
+                '대기시간(초)': round(seconds, 3),
+                '시간초과': timed_out,
+            })
+
+    def to_frame(self):
+        with self._lock:
+            return pd.DataFrame(self.records)
+
+    def report(self, fixed_sleep=None):
+        """
+        대기 시간 요약 출력
+        - fixed_sleep: 비교할 고정 대기 시간 (기본값: CRAWLER_CONFIG['WAIT_TIME'])
+        """
+        df = self.to_frame()
+        if df.empty:
+            print("⚠️ 기록된 대기 없음")
+            return df
+
+        fixed_sleep = CRAWLER_CONFIG['WAIT_TIME'] if fixed_sleep is None else fixed_sleep
+        total = df['대기시간(초)'].sum()
+        print("\n⏱️ 페이지 대기 시간 요약")
+        print(f"   대기 횟수: {len(df)}회 (시간초과 {int(df['시간초과'].sum())}회)")
+        print(f"   실제 대기: {total:.1f}초 (평균 {df['대기시간(초)'].mean():.2f}초)")
+        print(f"   고정 대기({fixed_sleep}초) 기준: {fixed_sleep * len(df):.1f}초")
+        print(df.groupby('사이트')['대기시간(초)'].agg(['count', 'mean', 'max']))
+        return df
+
+WAIT_LOG = WaitRecorder()
+
+
+# ==================== 대기 함수 ====================
+def wait_until_ready(driver, site='DEFAULT', conditions=None, timeout=None,
+                     recorder=WAIT_LOG):
+    """
+    페이지가 준비될 때까지 대기 (조건을 모두 만족하는 즉시 반환)
+    - site: PAGE_READY 키 (조건을 직접 넘기면 기록용 이름으로만 사용)
+    - timeout: 전체 조건에 대한 최대 대기 시간 (기본값: ELEMENT_TIMEOUT)
+    반환값: 시간 내 준비 여부 (True/False)
+    """
+    if conditions is None:
+        conditions = PAGE_READY.get(site, PAGE_READY['DEFAULT'])
+    if timeout is None:
+        timeout = CRAWLER_CONFIG['ELEMENT_TIMEOUT']
+
+    start = time.perf_counter()
+    timed_out = False
+
+    for cond in conditions:
+        remaining = timeout - (time.perf_counter() - start)
+        try:
+            if remaining <= 0:
+                raise TimeoutException()
+            WebDriverWait(driver, remaining, poll_frequency=POLL_INTERVAL).until(
+                CONDITIONS[cond['type']](cond)
+            )
+        except TimeoutException:
+            print(f"⚠️ [{site}] 대기 시간 초과: {cond}")
+            timed_out = True
+            break
+
+    if recorder is not None:
+        recorder.add(site, driver.current_url, time.perf_counter() - start, timed_out)
+    return not timed_out
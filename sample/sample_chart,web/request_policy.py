@@ -0,0 +1,180 @@
+"""
+요청 정책 (모든 크롤러 공용)
+- 재시도: 지수 백오프 + 지터 (CRAWLER_CONFIG['MAX_RETRIES'], ['RETRY_DELAY'])
+- 호스트별 토큰 버킷 속도 제한 (HOST_RATE_LIMITS)
+- 호스트별 서킷 브레이커: 연속 실패가 쌓이면 잠시 요청 중단
+- User-Agent 순환 (USER_AGENTS)
+"""
+
+import itertools
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from crawler_config import CRAWLER_CONFIG, HOST_RATE_LIMITS, USER_AGENTS
+
+# 재시도할 HTTP 상태 코드 (그 외 4xx는 재시도해도 결과가 같음)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않음"""
+
+
+class TokenBucket:
+    """초당 rate개 토큰 충전, 최대 burst개까지 모아서 한 번에 사용 가능"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 받을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 threshold회 → 열림(요청 차단)
+    reset_timeout초 후 → 반열림(요청 1개 시험), 성공하면 닫힘
+    """
+
+    def __init__(self, threshold, reset_timeout):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self._trial:
+                return False
+            self._trial = True  # 반열림: 시험 요청 하나만 통과
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+
+class RequestPolicy:
+    """호스트별 속도 제한/서킷 브레이커 + 재시도"""
+
+    def __init__(self, max_retries=None, base_delay=None, max_delay=None):
+        self.max_retries = CRAWLER_CONFIG['MAX_RETRIES'] if max_retries is None else max_retries
+        self.base_delay = base_delay or CRAWLER_CONFIG['RETRY_DELAY']
+        self.max_delay = max_delay or CRAWLER_CONFIG['RETRY_MAX_DELAY']
+        self._buckets = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._agents = itertools.cycle(USER_AGENTS)
+
+    def next_user_agent(self):
+        with self._lock:
+            return next(self._agents)
+
+    def _for_host(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                rate = HOST_RATE_LIMITS.get(host, HOST_RATE_LIMITS['DEFAULT'])
+                self._buckets[host] = TokenBucket(rate, CRAWLER_CONFIG['RATE_BURST'])
+                self._breakers[host] = CircuitBreaker(
+                    CRAWLER_CONFIG['CIRCUIT_FAILURES'], CRAWLER_CONFIG['CIRCUIT_RESET']
+                )
+            return self._buckets[host], self._breakers[host]
+
+    def backoff(self, attempt, retry_after=None):
+        """attempt번째 재시도 전 대기 시간 (full jitter, Retry-After 우선)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def is_retryable(exc):
+        """
+        예외에 retryable 속성이 있으면 그 값 (응답 내용 검사 오류 등)
+        HTTP 응답이 있으면 상태 코드로, 없으면 (연결/타임아웃 오류) 재시도
+        """
+        flag = getattr(exc, 'retryable', None)
+        if flag is not None:
+            return flag
+        response = getattr(exc, 'response', None)
+        if response is not None and getattr(response, 'status_code', None) is not None:
+            return response.status_code in RETRY_STATUS
+        return not isinstance(exc, (CircuitOpenError, ValueError, KeyError))
+
+    @staticmethod
+    def _retry_after(exc):
+        response = getattr(exc, 'response', None)
+        value = response.headers.get('Retry-After') if response is not None else None
+        return float(value) if value and value.isdigit() else None
+
+    def call(self, url, fn):
+        """
+        fn()을 정책에 따라 실행
+        - 요청마다 호스트 토큰 하나 사용
+        - 재시도 가능한 오류는 백오프 후 최대 max_retries회 재시도
+        - 서킷이 열린 호스트는 CircuitOpenError
+        """
+        host = urlparse(url).netloc
+        bucket, breaker = self._for_host(host)
+
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"{host}: 연속 실패로 요청 일시 중단")
+            bucket.acquire()
+            try:
+                result = fn()
+            except Exception as e:
+                retryable = self.is_retryable(e)
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()  # 서버는 응답함 (요청 자체의 문제)
+                if not retryable or attempt == self.max_retries:
+                    raise
+                delay = self.backoff(attempt, self._retry_after(e))
+                print(f"   🔁 {host} 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                time.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+def get_policy():
+    """공유 요청 정책 (최초 호출 시 생성)"""
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = RequestPolicy()
+        return _policy
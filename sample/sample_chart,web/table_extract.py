@@ -0,0 +1,286 @@
+"""
+HTML 테이블 추출 (lxml)
+- 페이지를 lxml(C 파서)로 한 번만 파싱하고, 선택한 테이블 전부를 DataFrame으로 변환
+- rowspan / colspan 을 펼쳐서 칸 위치를 맞춤 (KOSIS 통계표처럼 병합된 셀)
+- 여러 줄 헤더는 한 줄로 합침 (예: "2023 발전량") 또는 MultiIndex 로
+- 숫자 컬럼 변환 (쉼표, '-', 단위 제거)은 컬럼 단위 벡터 연산
+
+사용 예:
+    from table_extract import parse_tables
+    tables = parse_tables(html)                     # 모든 테이블
+    df = parse_tables(html, '#mainTable')[0]         # 선택자로 하나만
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+# 결측으로 볼 표기 (KOSIS: '-' 값 없음, '…' 미상, 'x' 비밀보호)
+NA_TOKENS = ('', '-', '--', '…', '...', 'x', 'X', 'N/A', 'NA')
+
+# 숫자 뒤에 붙는 단위/기호 (예: "1,234 MWh", "12.5%", "3개")
+# 알려진 단위만 지움 ("2023년", "3분기"처럼 숫자가 아닌 뜻이 있는 값은 그대로)
+_UNIT_SUFFIX = re.compile(
+    r'\s*(?:%|‰|℃|°C|㎡|m²|km²?|mm|[kMGT]?Wh|[kMG]W|toe|tCO2(?:eq)?'
+    r'|(?:천|백만|억)?원|개소|개|건|명|가구|호|대)$'
+)
+# 코드 값 (행정코드, 우편번호 등): 숫자로 바꾸면 앞자리 0이 사라지거나 float가 됨
+_LEADING_ZERO = re.compile(r'^0\d')
+_DIGITS = re.compile(r'^\d+$')
+# 이름으로 보는 코드 컬럼 (지점번호, 행정코드, stnId, ID ...)
+_CODE_NAME = re.compile(r'코드|번호|(?:^|[_\s])id$|[a-z]Id$|ID$')
+_ROWS = './tr | ./thead/tr | ./tbody/tr | ./tfoot/tr'
+_SPANNED = '(./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr)/*[@rowspan or @colspan]'
+_CELL_TAGS = ('td', 'th')
+_SIMPLE_CSS = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[\w-]+))?(?P<classes>(?:\.[\w-]+)*)$')
+
+
+# ==================== 선택자 ====================
+def _to_xpath(selector):
+    """
+    선택자 → XPath
+    - '/'나 '('로 시작하면 XPath 그대로
+    - 단순 CSS (table, #id, .class, table#id.class) 는 직접 변환
+    - 그 밖의 CSS는 cssselect 패키지가 있으면 사용
+    """
+    selector = (selector or 'table').strip()
+    if selector.startswith(('/', '(')):
+        return selector
+    m = _SIMPLE_CSS.match(selector)
+    if m:
+        conds = []
+        if m.group('id'):
+            conds.append(f"@id='{m.group('id')}'")
+        for cls in filter(None, m.group('classes').split('.')):
+            conds.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')")
+        return f"//{m.group('tag') or '*'}" + ''.join(f'[{c}]' for c in conds)
+    try:
+        from cssselect import GenericTranslator
+    except ImportError:
+        raise ValueError(f"복잡한 CSS 선택자는 cssselect 필요 (pip install cssselect): {selector}") from None
+    return GenericTranslator().css_to_xpath(selector)
+
+
+def _tables(root, selector):
+    # 선택한 요소가 table이 아니면 그 안의 table 들
+    found = []
+    for el in root.xpath(_to_xpath(selector)):
+        if el.tag == 'table':
+            found.append(el)
+        else:
+            found.extend(el.iter('table'))
+    return found
+
+
+# ==================== 셀 펼치기 ====================
+def _span(value):
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+def _cell_text(cell):
+    # 자식 태그가 없으면 .text만 (대부분의 숫자 칸), 있으면 C 구현 텍스트 직렬화
+    text = cell.text if len(cell) == 0 else etree.tostring(cell, method='text', encoding='unicode', with_tail=False)
+    return ' '.join(text.split()) if text else ''
+
+
+def table_grid(table):
+    """
+    table 요소 → (칸 목록의 목록, 헤더 줄 수)
+    rowspan/colspan 셀은 차지하는 모든 칸에 같은 값을 넣음
+    헤더 줄: thead 안의 줄, thead가 없으면 맨 위에서부터 th로만 된 줄
+    """
+    # 중첩 테이블의 tr은 제외 (이 테이블에 직접 속한 줄만)
+    trs = table.xpath(_ROWS)
+    rows = [[c for c in tr if c.tag in _CELL_TAGS] for tr in trs]
+    kept = [i for i, cells in enumerate(rows) if cells]
+    trs, rows = [trs[i] for i in kept], [rows[i] for i in kept]
+
+    header_rows = 0
+    for tr, cells in zip(trs, rows):
+        if tr.getparent().tag != 'thead' and any(c.tag != 'th' for c in cells):
+            break
+        header_rows += 1
+
+    if table.xpath(_SPANNED):
+        grid = _expand_spans(rows)
+    else:
+        #병합 셀이 없으면 칸 위치 계산 없이 바로
+        grid = [[_cell_text(c) for c in cells] for cells in rows]
+
+    width = max((len(r) for r in grid), default=0)
+    grid = [r + [''] * (width - len(r)) if len(r) < width else r for r in grid]
+    # 몸통이 전부 th인 표(헤더만 있는 표)는 첫 줄만 헤더로
+    if header_rows == len(grid) and grid:
+        header_rows = 1
+    return grid, header_rows
+
+
+def _expand_spans(rows):
+    grid = []
+    pending = {}  #{열 번호: [남은 줄 수, 값]} — 위 줄의 rowspan이 내려오는 칸
+    for cells in rows:
+        row = []
+        col = 0
+        for cell in cells:
+            while col in pending:
+                row.append(pending[col][1])
+                col = _take(pending, col)
+            text = _cell_text(cell)
+            rowspan = cell.get('rowspan')
+            colspan = cell.get('colspan')
+            rowspan = _span(rowspan) if rowspan else 1
+            colspan = _span(colspan) if colspan else 1
+            for _ in range(colspan):
+                row.append(text)
+                if rowspan > 1:
+                    pending[col] = [rowspan - 1, text]
+                col += 1
+        while pending and (col in pending or col < max(pending)):
+            if col in pending:
+                row.append(pending[col][1])
+                col = _take(pending, col)
+            else:
+                row.append('')
+                col += 1
+        grid.append(row)
+    return grid
+
+
+def _take(pending, col):
+    pending[col][0] -= 1
+    if pending[col][0] == 0:
+        del pending[col]
+    return col + 1
+
+
+def _columns(header, multi_header, sep):
+    if not header:
+        return None
+    if multi_header and len(header) > 1:
+        return pd.MultiIndex.from_arrays(header)
+    names = []
+    for parts in zip(*header):
+        # rowspan으로 세로로 같은 값이 반복된 부분은 한 번만
+        kept = [p for i, p in enumerate(parts) if p and (i == 0 or p != parts[i - 1])]
+        names.append(sep.join(kept))
+    return names
+
+
+# ==================== 숫자 변환 ====================
+def _to_numbers(values, na_values):
+    # 문자열 배열 → float 배열 (na_values는 NaN, 숫자로 안 바뀌는 값도 NaN)
+    s = pd.Series([v if isinstance(v, str) else str(v) for v in values], dtype=object)
+    s = s.mask(s.str.strip().isin(na_values))
+    cleaned = s.str.replace(',', '', regex=False)
+    try:
+        # 쉼표만 빼면 되는 경우 (대부분): C 변환 한 번
+        num = cleaned.to_numpy(dtype=float, na_value=np.nan)
+    except (TypeError, ValueError):
+        num = pd.to_numeric(cleaned.str.replace(_UNIT_SUFFIX, '', regex=True), errors='coerce').to_numpy(dtype=float)
+    return num, s.notna().to_numpy()
+
+
+def _looks_like_code(col, uniques, na_values):
+    # 이름이 코드/번호/ID 이거나, 앞자리 0이 있는 값이 하나라도 있거나,
+    # 전부 같은 자릿수(5자리 이상)의 정수 → 코드 컬럼
+    name = ' '.join(map(str, col)) if isinstance(col, tuple) else str(col)
+    if _CODE_NAME.search(name):
+        return True
+    texts = [v.strip() for v in uniques if isinstance(v, str) and v.strip() not in na_values]
+    if any(_LEADING_ZERO.match(t) for t in texts):
+        return True
+    return (bool(texts) and all(_DIGITS.match(t) for t in texts)
+            and len({len(t) for t in texts}) == 1 and len(texts[0]) >= 5)
+
+
+def coerce_numeric(df, columns=None, na_values=NA_TOKENS, min_ratio=0.9, exclude=()):
+    """
+    숫자 컬럼 변환 (컬럼 단위 벡터 연산)
+    - 쉼표 제거, 끝의 단위(%, MWh, 개 등) 제거, na_values → NaN
+    - 서로 다른 값(unique)만 변환하고 코드로 다시 펼침 (반복되는 값이 많은 통계표에서 빠름)
+    - columns를 안 주면 결측 아닌 값의 min_ratio 이상이 숫자로 바뀌는 컬럼만 변환
+      (코드처럼 보이는 컬럼 — 이름이 코드/번호/ID, 앞자리 0, 같은 자릿수의 정수 — 은 건너뜀,
+       columns로 지정하면 변환)
+    - exclude: 변환하지 않을 컬럼 (지점번호처럼 숫자지만 코드인 컬럼)
+    숫자로 바뀌지 않아 NaN이 된 값은 경고로 출력하고 df.attrs['coerced_to_nan']에 {컬럼: [값, ...]}로 남김
+    """
+    df = df.copy()
+    exclude = set(exclude or ())
+    targets = columns if columns is not None else [
+        c for c in df.columns if df[c].dtype == object
+    ]
+    lost = {}
+    for col in targets:
+        if col in exclude:
+            continue
+        codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+        if columns is None and _looks_like_code(col, uniques, na_values):
+            continue
+        valid = codes >= 0
+        num = np.full(len(codes), np.nan)
+        present = 0
+        dropped = np.zeros(len(uniques), dtype=bool)
+        if len(uniques):
+            num_u, present_u = _to_numbers(uniques, na_values)
+            num[valid] = num_u[codes[valid]]
+            present = int(present_u[codes[valid]].sum())
+            dropped = present_u & np.isnan(num_u)
+        if columns is not None or (present and np.count_nonzero(~np.isnan(num)) >= min_ratio * present):
+            df[col] = num
+            if dropped.any():
+                lost[col] = list(np.asarray(uniques, dtype=object)[dropped])
+    for col, values in lost.items():
+        print(f"⚠️ [{col}] 숫자가 아닌 값 {len(values)}종 → NaN: {values[:5]}{' ...' if len(values) > 5 else ''}")
+    df.attrs['coerced_to_nan'] = lost
+    return df
+
+
+# ==================== 추출 ====================
+def frame_from_table(table, multi_header=False, sep=' ', numeric=True, exclude=()):
+    grid, header_rows = table_grid(table)
+    if not grid:
+        return pd.DataFrame()
+    columns = _columns(grid[:header_rows], multi_header, sep)
+    df = pd.DataFrame(grid[header_rows:], columns=columns)
+    if columns is not None and not isinstance(columns, pd.MultiIndex):
+        # 헤더가 비었거나 겹치면 번호를 붙여 구분
+        df.columns = _dedupe(df.columns)
+    return coerce_numeric(df, exclude=exclude) if numeric else df
+
+
+def _dedupe(columns):
+    seen = {}
+    out = []
+    for i, name in enumerate(columns):
+        name = name or f'열{i + 1}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        out.append(name)
+    return out
+
+
+def parse_tables(html, selector='table', multi_header=False, sep=' ', numeric=True, exclude=()):
+    """
+    HTML → 선택한 테이블 전부의 DataFrame 목록 (파싱은 한 번)
+    selector: 'table', '#id', '.class', 'table.class' 같은 CSS 또는 XPath
+    multi_header: True면 여러 줄 헤더를 MultiIndex 컬럼으로 (기본은 sep로 합친 한 줄)
+    numeric: 숫자 컬럼 자동 변환
+    exclude: 숫자로 바꾸지 않을 컬럼 (코드 컬럼 등)
+    """
+    parser = etree.HTMLParser()
+    try:
+        root = etree.fromstring(html, parser)
+    except ValueError:
+        # 인코딩 선언(<?xml encoding=...?>)이 붙은 문자열은 bytes로 넘겨야 함
+        root = etree.fromstring(html.encode('utf-8'), parser)
+    if root is None:
+        return []
+    return [frame_from_table(t, multi_header, sep, numeric, exclude) for t in _tables(root, selector)]
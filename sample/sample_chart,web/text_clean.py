@@ -0,0 +1,80 @@
+"""
+텍스트 정제 (DataFrame 컬럼 단위)
+- df.applymap(clean_text)는 칸마다 re.sub를 두 번씩 호출 (applymap은 pandas에서 지원 종료 예정)
+- 여기서는 컬럼마다 서로 다른 값(unique)만 한 번씩 정제하고 결과를 다시 펼침
+  (통계표는 같은 지역명/항목명이 수백 번 반복되므로 실제 정제 횟수가 크게 줄어듦)
+- 숫자처럼 보이는 컬럼(1,234 / 12.5% / '-')은 바로 float 컬럼으로 변환
+
+사용 예:
+    from text_clean import clean_frame
+    df = clean_frame(df)                  # 문자열 컬럼 정제 + 숫자 컬럼 변환
+    df = clean_frame(df, numeric=False)   # 정제만
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from table_extract import coerce_numeric
+
+# 정제 규칙 (AdvancedCrawler.clean_text와 같음)
+_SPACES = re.compile(r'\s+')                 # 다중 공백 → 단일 공백
+_JUNK = re.compile(r'[^\w\s가-힣.,()%-]')     # 특정 특수문자 제거 (필요에 따라 수정)
+
+
+def clean_value(text):
+    """값 하나 정제 (빈 값은 "")"""
+    if not text:
+        return ""
+    return _JUNK.sub('', _SPACES.sub(' ', str(text)).strip())
+
+
+def clean_series(s):
+    """
+    문자열 컬럼 정제: 서로 다른 값만 정제한 뒤 코드로 다시 펼침
+    결측(NaN/None)과 문자열이 아닌 값(숫자 등)은 그대로 둠
+    """
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    if len(uniques) == 0:
+        return s
+    cleaned = np.asarray(uniques, dtype=object).copy()
+    # 문자열인 값만 정제 (숫자만 든 object 컬럼은 .str 접근자가 에러를 냄)
+    is_text = np.fromiter((isinstance(v, str) for v in cleaned), dtype=bool, count=len(cleaned))
+    if is_text.any():
+        cleaned[is_text] = (
+            pd.Series(cleaned[is_text], dtype=object)
+            .str.replace(_SPACES, ' ', regex=True)
+            .str.strip()
+            .str.replace(_JUNK, '', regex=True)
+            .to_numpy(dtype=object)
+        )
+    out = np.empty(len(s), dtype=object)
+    valid = codes >= 0
+    out[valid] = cleaned[codes[valid]]
+    out[~valid] = s.to_numpy(dtype=object)[~valid]
+    return pd.Series(out, index=s.index, name=s.name)
+
+
+def clean_frame(df, columns=None, numeric=True, min_ratio=0.9, exclude=()):
+    """
+    DataFrame 정제
+    columns: 정제할 컬럼 (None이면 object/string 컬럼 전부, 숫자 컬럼은 건너뜀)
+    numeric: 정제 후 숫자처럼 보이는 컬럼을 float로 변환 (table_extract.coerce_numeric)
+    min_ratio: 값의 이 비율 이상이 숫자로 바뀌어야 숫자 컬럼으로 봄
+    exclude: 숫자로 바꾸지 않을 컬럼 (지점번호 등 코드 컬럼, 정제는 함)
+    """
+    df = df.copy()
+    text_cols = columns if columns is not None else [
+        c for c in df.columns
+        if df[c].dtype == object or isinstance(df[c].dtype, pd.StringDtype)
+    ]
+    for col in text_cols:
+        df[col] = clean_series(df[col].astype(object))
+    if numeric and text_cols:
+        converted = coerce_numeric(df[text_cols], min_ratio=min_ratio, exclude=exclude)
+        for col in text_cols:
+            if converted[col].dtype != object:
+                df[col] = converted[col]
+        df.attrs['coerced_to_nan'] = converted.attrs['coerced_to_nan']
+    return df
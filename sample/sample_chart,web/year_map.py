@@ -0,0 +1,214 @@
+"""
+연도별 지도 (gangwon_year_map.html) 생성
+- map_1.ipynb는 연도마다 팝업 HTML을 통째로 만들어 넣어서 모든 연도 데이터가 HTML 안에 들어감
+- 여기서는 연도별 집계를 한 번에 계산해 연도마다 작은 JSON 파일(사이드카)로 저장하고,
+  지도에는 시군 위치와 연도 슬라이더만 넣음 → 연도를 고를 때 그 연도 JSON만 불러옴
+- 한 번 불러온 연도는 브라우저에 보관 (다시 받지 않음)
+
+⚠️ JSON을 fetch로 불러오므로 file:// 로 열면 브라우저가 막을 수 있음
+   → python -m http.server 로 폴더를 띄우고 http://localhost:8000/gangwon_year_map.html 로 열기
+
+실행:
+    python year_map.py
+    python year_map.py --xlsx ../../01_DataAnalysis/docs/강원도_지역별_재생에너지_발전량.xlsx --out .
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import folium
+from branca.element import MacroElement
+from jinja2 import Template
+
+DEFAULT_XLSX = Path(__file__).resolve().parents[2] / '01_DataAnalysis' / 'docs' / '강원도_지역별_재생에너지_발전량.xlsx'
+
+# 시군 위치/지도 중심은 01_analysis/map_layers.py 것을 같이 씀
+sys.path.append(str(Path(__file__).resolve().parents[1] / '01_analysis'))
+from map_layers import CENTER, REGION_COORDS as COORDS
+
+# (컬럼, 팝업 표시 이름, 색)
+FIELDS = [
+    ('태양광', '☀️ 태양광', '#FFB800'),
+    ('풍력', '💨 풍력', '#00C4FF'),
+    ('수력', '💧 수력', '#0066FF'),
+    ('바이오', '🌱 바이오', '#4CAF50'),
+]
+UNIT = 'MWh'
+
+
+# ==================== 데이터 ====================
+def load_yearly(path=DEFAULT_XLSX, region_col='기초지자체', year_col='연도'):
+    """공단 기초지자체별 연도별 발전량 표 (쉼표/'-' 표기 → 숫자)"""
+    df = pd.read_excel(path)
+    df[year_col] = pd.to_numeric(df[year_col], errors='coerce').astype('Int64')
+    for col, _, _ in FIELDS:
+        df[col] = pd.to_numeric(
+            df[col].astype(str).str.replace(',', '', regex=False), errors='coerce'
+        ).fillna(0)
+    return df.rename(columns={region_col: '지역', year_col: '연도'})
+
+
+def precompute(df, regions=None):
+    """
+    연도 × 지역 집계를 한 번에 계산
+    반환값: {연도: [[지역, 값1, 값2, ..., 합계], ...]} (regions 순서, 값이 없는 지역은 제외)
+    """
+    regions = list(regions or COORDS)
+    cols = [f[0] for f in FIELDS]
+    table = df[df['지역'].isin(regions)].groupby(['연도', '지역'])[cols].sum()
+    table['합계'] = table[cols].sum(axis=1)
+    table = table.round(0).astype('int64')
+
+    out = {}
+    for year, part in table.groupby(level='연도'):
+        part = part.droplevel('연도')
+        part = part.reindex([r for r in regions if r in part.index])
+        out[int(year)] = [[region, *values] for region, values in zip(part.index, part.to_numpy().tolist())]
+    return out
+
+
+def _dumps(value):
+    # 공백 없는 한 줄 JSON (한글은 그대로)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_sidecars(aggregates, data_dir):
+    """연도별 JSON 파일 저장 (공백 없는 한 줄 JSON)"""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for year, rows in aggregates.items():
+        (data_dir / f'{year}.json').write_text(_dumps(rows), encoding='utf-8')
+    return data_dir
+
+
+# ==================== 지도 ====================
+_YEAR_JS = """
+(function () {
+    var map = %(map)s;
+    var coords = %(coords)s;
+    var fields = %(fields)s;
+    var years = %(years)s;
+    var dataDir = %(data_dir)s;
+    var unit = %(unit)s;
+    var cache = {};
+    var markers = {};
+
+    Object.keys(coords).forEach(function (region) {
+        markers[region] = L.circleMarker(coords[region], {
+            radius: 6, color: '#667eea', fillColor: '#667eea', fillOpacity: 0.7, weight: 1
+        }).bindTooltip('<b>' + region + '</b>').addTo(map);
+    });
+
+    function popup(row, year) {
+        var html = '<div style="font-family: Malgun Gothic; width: 220px;"><h4>📍 ' + row[0]
+                 + ' (' + year + '년)</h4>';
+        for (var i = 0; i < fields.length; i++) {
+            html += '<p style="border-left: 5px solid ' + fields[i][1] + '; padding-left: 6px;">'
+                  + fields[i][0] + ': <b>' + row[1 + i].toLocaleString() + ' ' + unit + '</b></p>';
+        }
+        return html + '<p><b>⚡ 총 발전량: ' + row[row.length - 1].toLocaleString() + ' ' + unit + '</b></p></div>';
+    }
+
+    function draw(year, rows) {
+        var max = 1;
+        rows.forEach(function (row) { max = Math.max(max, row[row.length - 1]); });
+        Object.keys(markers).forEach(function (region) { markers[region].setStyle({opacity: 0.3, fillOpacity: 0.1}); });
+        rows.forEach(function (row) {
+            var marker = markers[row[0]];
+            if (!marker) { return; }
+            marker.setRadius(6 + 24 * Math.sqrt(row[row.length - 1] / max));
+            marker.setStyle({opacity: 1, fillOpacity: 0.7});
+            marker.bindPopup(popup(row, year), {maxWidth: 260});
+        });
+        label.innerHTML = year + '년';
+    }
+
+    function show(year) {
+        if (cache[year]) { draw(year, cache[year]); return; }
+        label.innerHTML = year + '년 불러오는 중...';
+        fetch(dataDir + '/' + year + '.json')
+            .then(function (r) { if (!r.ok) { throw new Error(r.status); } return r.json(); })
+            .then(function (rows) { cache[year] = rows; draw(year, rows); })
+            .catch(function (e) { label.innerHTML = year + '년 자료를 불러오지 못했습니다 (' + e + ')'; });
+    }
+
+    var control = L.control({position: 'topright'});
+    var label;
+    control.onAdd = function () {
+        var div = L.DomUtil.create('div');
+        div.style.cssText = 'background:white; padding:10px 15px; border-radius:10px;'
+                          + 'box-shadow:0 2px 6px rgba(0,0,0,0.3); font-family:Malgun Gothic;';
+        div.innerHTML = '<input type="range" min="0" max="' + (years.length - 1) + '" value="'
+                      + (years.length - 1) + '" step="1" style="width:180px"><div style="text-align:center;'
+                      + 'font-weight:bold; color:#667eea"></div>';
+        var slider = div.querySelector('input');
+        label = div.querySelector('div');
+        L.DomEvent.disableClickPropagation(div);
+        slider.addEventListener('input', function () { show(years[+slider.value]); });
+        return div;
+    };
+    control.addTo(map);
+    show(years[years.length - 1]);
+})();
+"""
+
+
+class _YearScript(MacroElement):
+    """지도 스크립트 (지도의 자식으로 넣어야 L.map(...) 다음에 출력됨)"""
+
+    _template = Template("{% macro script(this, kwargs) %}{{ this.code }}{% endmacro %}")
+
+    def __init__(self, code):
+        super().__init__()
+        self._name = 'YearScript'
+        self.code = code
+
+
+def build_year_map(years, data_dir_name, coords=None, center=CENTER, zoom_start=9):
+    """
+    시군 위치 + 연도 슬라이더만 담은 지도 (값은 data_dir_name/연도.json 에서 불러옴)
+    data_dir_name: HTML 기준 상대 경로
+    """
+    coords = coords or COORDS
+    m = folium.Map(location=center, zoom_start=zoom_start)
+    script = _YEAR_JS % {
+        'map': m.get_name(),
+        'coords': _dumps({r: list(c) for r, c in coords.items()}),
+        'fields': _dumps([[label, color] for _, label, color in FIELDS]),
+        'years': _dumps([int(y) for y in sorted(years)]),
+        'data_dir': _dumps(data_dir_name),
+        'unit': _dumps(UNIT),
+    }
+    _YearScript(script).add_to(m)
+    return m
+
+
+def export_year_map(df, out_dir='.', name='gangwon_year_map'):
+    """연도별 집계 → JSON 사이드카 + 지도 HTML"""
+    out_dir = Path(out_dir)
+    aggregates = precompute(df)
+    data_dir = write_sidecars(aggregates, out_dir / f'{name}_data')
+    m = build_year_map(aggregates.keys(), data_dir.name)
+    html_path = out_dir / f'{name}.html'
+    m.save(str(html_path))
+    return html_path, data_dir
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="연도별 지도 + JSON 사이드카 생성")
+    parser.add_argument('--xlsx', default=str(DEFAULT_XLSX), help="공단 기초지자체별 연도별 발전량 엑셀")
+    parser.add_argument('--out', default='.', help="저장 폴더")
+    args = parser.parse_args()
+
+    df = load_yearly(args.xlsx)
+    html_path, data_dir = export_year_map(df, args.out)
+    sizes = sum(p.stat().st_size for p in data_dir.glob('*.json'))
+    print(f"✅ 완료: {html_path} ({html_path.stat().st_size:,} bytes)")
+    print(f"✅ 연도별 자료: {data_dir} ({len(list(data_dir.glob('*.json')))}개, {sizes:,} bytes)")
+    print("\n💡 사용법:")
+    print("  1. python -m http.server  (이 폴더에서 실행)")
+    print(f"  2. 브라우저에서 http://localhost:8000/{html_path.name} 열기")
+    print("  3. 오른쪽 위 슬라이더로 연도 선택 → 해당 연도 자료만 불러옴")